@@ -0,0 +1,129 @@
+import itertools
+import socket
+import uuid
+
+import pandas as pd
+import pytest
+
+from pins.cache import latest_cache, meta_cache
+
+# Backends ====================================================================
+
+BACKENDS = ["folder", "memory", "s3", "rsc"]
+
+S3_BUCKET = "pins-bench"
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(scope="session")
+def s3_endpoint():
+    """Run a local moto S3 server for the whole session."""
+
+    moto_server = pytest.importorskip("moto.server")
+    pytest.importorskip("s3fs")
+
+    port = _free_port()
+    server = moto_server.ThreadedMotoServer(ip_address="127.0.0.1", port=port)
+    server.start()
+
+    yield f"http://127.0.0.1:{port}"
+
+    server.stop()
+
+
+def make_board_s3(endpoint):
+    from s3fs import S3FileSystem
+
+    from pins.boards import BaseBoard
+
+    fs = S3FileSystem(
+        key="bench",
+        secret="bench",
+        client_kwargs={"endpoint_url": endpoint},
+        # a fresh instance, whose listings are never stale
+        skip_instance_cache=True,
+        use_listings_cache=False,
+    )
+    if not fs.exists(S3_BUCKET):
+        fs.mkdir(S3_BUCKET)
+
+    path = f"{S3_BUCKET}/{uuid.uuid4()}"
+    fs.mkdir(path)
+    return BaseBoard(path, fs=fs)
+
+
+def make_board_rsc():
+    from pins.boards import BoardRsConnect
+    from pins.rsconnect.api import RsConnectApi
+    from pins.rsconnect.fs import RsConnectFs
+    from pins.tests.helpers import MockRsConnectSession
+
+    session = MockRsConnectSession()
+    session.add_user("bench")
+    api = RsConnectApi(session.server_url, "some-key", session=session)
+    return BoardRsConnect("", RsConnectFs(api))
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    return request.param
+
+
+@pytest.fixture
+def make_board(backend, request, tmp_path):
+    """Return a function that creates an empty board on the backend."""
+
+    from pins import board, board_folder
+
+    if backend == "s3":
+        endpoint = request.getfixturevalue("s3_endpoint")
+        factory = lambda: make_board_s3(endpoint)  # noqa: E731
+    elif backend == "rsc":
+        factory = make_board_rsc
+    elif backend == "memory":
+        factory = lambda: board("memory", f"/{uuid.uuid4()}", cache=None)  # noqa: E731
+    else:
+        counter = itertools.count()
+        factory = lambda: board_folder(str(tmp_path / str(next(counter))))  # noqa: E731
+
+    yield factory
+
+    # memoized metadata would otherwise carry over between benchmarks
+    meta_cache.clear()
+    latest_cache.clear()
+
+
+@pytest.fixture
+def pin_name(backend):
+    """Return a function that turns a short pin name into one for the backend."""
+
+    def _pin_name(name):
+        # Connect pin names include their owner
+        if backend == "rsc":
+            return f"bench/{name}"
+        return name
+
+    return _pin_name
+
+
+# Data ========================================================================
+
+# number of rows in the data frames that are pinned
+PIN_SIZES = {"small": 100, "large": 100_000}
+
+
+@pytest.fixture(params=list(PIN_SIZES))
+def df(request):
+    n = PIN_SIZES[request.param]
+    return pd.DataFrame(
+        {
+            "x": range(n),
+            "y": [i * 0.5 for i in range(n)],
+            "z": [f"row-{i}" for i in range(n)],
+        }
+    )
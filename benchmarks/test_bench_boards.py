@@ -0,0 +1,96 @@
+"""Benchmarks of core board operations.
+
+Each benchmark runs against every backend in conftest.BACKENDS. See the
+"Benchmarks" section of CONTRIBUTING.md for how to run and compare them.
+"""
+
+import itertools
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from pins.cache import meta_cache
+
+SMALL_DF = pd.DataFrame({"x": [1, 2, 3]})
+
+
+def write_versions(board, name, n):
+    created = datetime(2020, 1, 1)
+    for ii in range(n):
+        board.pin_write(
+            SMALL_DF.assign(v=ii),
+            name,
+            type="csv",
+            created=created + timedelta(seconds=ii),
+        )
+
+
+# Reading and writing data ====================================================
+
+
+def test_pin_write(benchmark, make_board, pin_name, df):
+    board = make_board()
+    names = (pin_name(f"df-{ii}") for ii in itertools.count())
+
+    benchmark(lambda: board.pin_write(df, next(names), type="csv"))
+
+
+def test_pin_read(benchmark, make_board, pin_name, df):
+    board = make_board()
+    name = pin_name("df")
+    board.pin_write(df, name, type="csv")
+
+    res = benchmark(board.pin_read, name)
+    assert len(res) == len(df)
+
+
+# Metadata and versions =======================================================
+
+
+@pytest.mark.parametrize("n_versions", [1, 50])
+def test_pin_meta(benchmark, make_board, pin_name, n_versions):
+    board = make_board()
+    name = pin_name("df")
+    write_versions(board, name, n_versions)
+
+    benchmark(board.pin_meta, name)
+
+
+@pytest.mark.parametrize("n_versions", [10, 100])
+def test_pin_versions(benchmark, make_board, pin_name, n_versions):
+    board = make_board()
+    name = pin_name("df")
+    write_versions(board, name, n_versions)
+
+    res = benchmark(board.pin_versions, name, as_df=False)
+    assert len(res) == n_versions
+
+
+@pytest.mark.parametrize("n_pins", [10, 50])
+def test_pin_search(benchmark, make_board, pin_name, n_pins):
+    board = make_board()
+    for ii in range(n_pins):
+        board.pin_write(SMALL_DF, pin_name(f"df-{ii}"), type="csv")
+
+    # forget memoized metadata before each round, so it is fetched every time
+    res = benchmark.pedantic(
+        board.pin_search, kwargs={"as_df": False}, setup=meta_cache.clear, rounds=5
+    )
+    assert len(res) == n_pins
+
+
+# Cache =======================================================================
+
+
+@pytest.mark.parametrize("n_versions", [100, 1000])
+def test_cache_prune(benchmark, tmp_path, n_versions):
+    from pins.cache import cache_prune
+
+    # <cache_root>/<board_hash>/<pin>/<version>/data.txt, where nothing is stale
+    for ii in range(n_versions):
+        p_version = tmp_path / "board" / f"pin-{ii % 10}" / f"v{ii}"
+        p_version.mkdir(parents=True)
+        (p_version / "data.txt").touch()
+
+    benchmark(cache_prune, days=30, cache_root=str(tmp_path), prompt=False)
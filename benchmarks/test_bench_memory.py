@@ -0,0 +1,86 @@
+"""Memory used by the objects pins holds for each pin version.
+
+Each benchmark builds many objects, and reports the bytes used per object by
+both the pins class and an equivalent class that stores attributes in a
+__dict__, in the benchmark's extra_info.
+"""
+
+import tracemalloc
+from datetime import datetime, timedelta
+
+import pytest
+
+from pins.meta import Meta
+from pins.rsconnect.api import Bundle
+from pins.versions import Version
+
+N_OBJECTS = 10_000
+
+
+def with_dict(cls):
+    """Return a copy of a slotted class, whose instances have a __dict__."""
+
+    namespace = {
+        k: v
+        for k, v in cls.__dict__.items()
+        if k != "__slots__" and k not in cls.__slots__
+    }
+    return type(cls.__name__, cls.__bases__, namespace)
+
+
+def make_version(cls, ii):
+    return cls(datetime(2020, 1, 1) + timedelta(seconds=ii), f"{ii:05x}")
+
+
+def make_meta(cls, ii):
+    version = make_version(Version, ii)
+    return cls(
+        title=None,
+        description=None,
+        created=version.render_created(),
+        pin_hash=version.hash,
+        file="some_file.csv",
+        file_size=ii,
+        type="csv",
+        api_version=1,
+        version=version,
+        tags=None,
+        name="some_pin",
+        user={},
+        local={},
+    )
+
+
+def make_bundle(cls, ii):
+    return cls({"id": str(ii), "content_guid": "abc", "active": False})
+
+
+def bytes_per_object(make, cls):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [make(cls, ii) for ii in range(N_OBJECTS)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    del objects
+    return (after - before) / N_OBJECTS
+
+
+@pytest.mark.parametrize(
+    "make, cls",
+    [(make_version, Version), (make_meta, Meta), (make_bundle, Bundle)],
+    ids=["version", "meta", "bundle"],
+)
+def test_memory_per_object(benchmark, make, cls):
+    slotted = bytes_per_object(make, cls)
+    unslotted = bytes_per_object(make, with_dict(cls))
+
+    benchmark.extra_info["bytes_per_object"] = slotted
+    benchmark.extra_info["bytes_per_object_with_dict"] = unslotted
+
+    benchmark.pedantic(lambda: [make(cls, ii) for ii in range(N_OBJECTS)], rounds=3)
+
+    assert not hasattr(make(cls, 0), "__dict__")
+    assert slotted < unslotted
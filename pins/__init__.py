@@ -1,28 +1,72 @@
 # flake8: noqa
 
-# Set version ----
-from importlib_metadata import version as _v
-
-__version__ = _v("pins")
-
-del _v
-
-
-# Imports ----
-from .cache import cache_prune, cache_info
-from .constructors import (
-    board_folder,
-    board_temp,
-    board_local,
-    board_github,
-    board_urls,  # DEPRECATED
-    board_url,
-    board_connect,
-    board_rsconnect,
-    board_azure,
-    board_s3,
-    board_gcs,
-    board_databricks,
-    board,
-)
-from .boards import board_deparse
+# Lazy imports ----
+# Importing pins should be cheap (e.g. for command line tools), so the public
+# functions below are only imported from their modules when first accessed.
+# This also means fsspec, yaml, etc.. are not imported until a board is used.
+
+_LAZY_ATTRS = {
+    "cache_prune": "cache",
+    "cache_info": "cache",
+    "board_folder": "constructors",
+    "board_temp": "constructors",
+    "board_local": "constructors",
+    "board_github": "constructors",
+    "board_urls": "constructors",  # DEPRECATED
+    "board_url": "constructors",
+    "board_connect": "constructors",
+    "board_rsconnect": "constructors",
+    "board_azure": "constructors",
+    "board_s3": "constructors",
+    "board_gcs": "constructors",
+    "board_databricks": "constructors",
+    "board": "constructors",
+    "board_deparse": "boards",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+# static tools (type checkers, IDEs, and quartodoc for the docs) do not run
+# __getattr__, so they see the public functions through these imports instead.
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .boards import board_deparse
+    from .cache import cache_info, cache_prune
+    from .constructors import (
+        board,
+        board_azure,
+        board_connect,
+        board_databricks,
+        board_folder,
+        board_gcs,
+        board_github,
+        board_local,
+        board_rsconnect,
+        board_s3,
+        board_temp,
+        board_url,
+        board_urls,  # DEPRECATED
+    )
+
+
+def __getattr__(name):
+    if name == "__version__":
+        from importlib_metadata import version
+
+        value = version("pins")
+    elif name in _LAZY_ATTRS:
+        import importlib
+
+        module = importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # cache, so __getattr__ is only called once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), "__version__", *_LAZY_ATTRS])
@@ -4,29 +4,70 @@ import contextlib
 import functools
 import inspect
 import logging
+import os
 import re
 import shutil
 import tempfile
+import time
+import weakref
 from collections.abc import Mapping, Sequence
 from datetime import datetime, timedelta
 from io import IOBase
 from pathlib import Path
-from typing import Any, Protocol
+from typing import Any, Callable, Protocol
 
+from fsspec.implementations.local import LocalFileSystem
 from importlib_resources import files
 from importlib_resources.abc import Traversable
 
 from ._adaptors import Adaptor, create_adaptor
-from .cache import PinsCache
-from .config import get_allow_rsc_short_name
-from .drivers import REQUIRES_SINGLE_FILE, default_title, load_data, load_file, save_data
-from .errors import PinsError, PinsVersionError
+from .cache import (
+    PinsAccessTimeCache,
+    PinsCache,
+    cache_fill_lock,
+    cache_path,
+    cached_file_hash,
+    evict_cached_file,
+    fill_cache,
+    latest_cache,
+    meta_cache,
+    prefix_cache,
+    stats_key,
+)
+from .config import (
+    get_allow_rsc_short_name,
+    get_latest_marker,
+    get_latest_ttl,
+    get_offline,
+    get_verify_hash,
+)
+from .drivers import (
+    REQUIRES_SINGLE_FILE,
+    check_pickle_read,
+    default_title,
+    load_data,
+    load_file,
+    load_path,
+    read_data,
+    save_data,
+)
+from .errors import PinsError, PinsHashError, PinsVersionError
 from .meta import Meta, MetaFactory, MetaRaw
+from .tracing import file_size, path_size, span
 from .utils import ExtendMethodDoc, inform, warn_deprecated
-from .versions import VersionRaw, guess_version, version_setup
+from .versions import (
+    Version,
+    VersionBundle,
+    VersionRaw,
+    guess_version,
+    version_setup,
+)
 
 _log = logging.getLogger(__name__)
 
+# seconds to wait before retrying a failed download, doubled after each attempt
+DOWNLOAD_RETRY_WAIT = 0.5
+
 _ = default_title  # Keep this import for backward compatibility
 
 
@@ -53,6 +94,32 @@ class IFileSystem(Protocol):
 class BaseBoard:
     reserved_pin_names = {"_pins.yaml"}
 
+    # name of the optional file in a pin's folder, holding its latest version
+    latest_marker_name = "_latest"
+
+    # Opt-in ways to find a pin's latest version without listing every version.
+    # latest_ttl is how many seconds a latest version seen by this process may be
+    # reused for. latest_marker sets whether writes record the latest version in
+    # a file, which reads then use. If None, these are set by the PINS_LATEST_TTL
+    # and PINS_LATEST_MARKER environment variables.
+    latest_ttl: float | None = None
+    latest_marker: bool | None = None
+
+    # Whether to read pins only from the local cache, without contacting the
+    # board. Versions (including the latest) and metadata are found in the cache
+    # directory, and reading anything not cached raises an error. Boards without a
+    # cache (e.g. local folders) are unaffected. If None, this is set by the
+    # PINS_OFFLINE environment variable.
+    offline: bool | None = None
+
+    # Whether to check that the files read by pin_read and pin_download match
+    # their pin's hash. Hashes are recorded as files are cached, so checking cached
+    # files is cheap, and corrupt cached files are fetched again. If None, this is
+    # set by the PINS_VERIFY_HASH environment variable.
+    verify_hash: bool | None = None
+
+    # note that the options above are defaults for boards, which may also be set
+    # when creating a board.
     def __init__(
         self,
         board: str | Path,
@@ -60,6 +127,11 @@ class BaseBoard:
         versioned=True,
         meta_factory=MetaFactory(),
         allow_pickle_read: bool | None = None,
+        *,
+        latest_ttl: float | None = None,
+        latest_marker: bool | None = None,
+        offline: bool | None = None,
+        verify_hash: bool | None = None,
     ):
         self.board = str(board)
         self.fs = fs
@@ -67,6 +139,11 @@ class BaseBoard:
         self.versioned = versioned
         self.allow_pickle_read = allow_pickle_read
 
+        self.latest_ttl = latest_ttl
+        self.latest_marker = latest_marker
+        self.offline = offline
+        self.verify_hash = verify_hash
+
     def pin_exists(self, name: str) -> bool:
         """Determine if a pin exists.
 
@@ -76,7 +153,11 @@ class BaseBoard:
             Pin name.
         """
 
-        return self.fs.exists(self.construct_path([self.path_to_pin(name)]))
+        if self._is_offline():
+            return self._get_cache_path(name) is not None
+
+        with span("pin_exists", pin=name):
+            return self.fs.exists(self.construct_path([self.path_to_pin(name)]))
 
     def pin_versions(self, name: str, as_df: bool = True) -> Sequence[VersionRaw]:
         """Return available versions of a pin.
@@ -88,30 +169,42 @@ class BaseBoard:
 
         """
 
-        if not self.pin_exists(name):
+        # names are sorted before parsing, which gives the same order as sorting
+        # the parsed versions, since version strings are fixed width.
+        sorted_versions = [guess_version(v) for v in self._pin_version_names(name)]
+
+        if as_df:
+            import pandas as pd
+
+            return pd.DataFrame([v.to_dict() for v in sorted_versions])
+
+        return sorted_versions
+
+    def _pin_version_names(self, name: str, check_exists: bool = True) -> list[str]:
+        """Return the sorted version names of a pin, without parsing them."""
+
+        if self._is_offline():
+            return self._cached_version_names(name)
+
+        if check_exists and not self.pin_exists(name):
             raise PinsError(f"Cannot check version, since pin {name} does not exist")
 
-        detail = isinstance(self, BoardRsConnect)
+        with span("pin_versions", pin=name):
+            versions_raw = self.fs.ls(
+                self.construct_path([self.path_to_pin(name)]), detail=False
+            )
 
-        versions_raw = self.fs.ls(
-            self.construct_path([self.path_to_pin(name)]), detail=detail
-        )
+        return self._sort_version_paths(versions_raw)
 
-        # get a list of Version(Raw) objects
+    def _sort_version_paths(self, paths) -> list[str]:
         all_versions = []
-        for full_path in versions_raw:
+        for full_path in paths:
             version = self.keep_final_path_component(full_path)
-            all_versions.append(guess_version(version))
+            if version != self.latest_marker_name:
+                all_versions.append(VersionRaw(version))
 
         # sort them, with latest last
-        sorted_versions = self.sort_pin_versions(all_versions)
-
-        if as_df:
-            import pandas as pd
-
-            return pd.DataFrame([v.to_dict() for v in sorted_versions])
-
-        return sorted_versions
+        return [v.version for v in self.sort_pin_versions(all_versions)]
 
     def pin_meta(self, name, version: str = None) -> Meta:
         """Return metadata about a pin.
@@ -129,13 +222,33 @@ class BaseBoard:
 
         """
 
+        return self._pin_meta(name, version)
+
+    def _pin_meta(self, name, version: str = None, check_exists: bool = True) -> Meta:
         pin_name = self.path_to_pin(name)
 
         # determine pin version -----------------------------------------------
 
         if version is not None:
-            # ensure pin and version exist
-            if not self.fs.exists(self.construct_path([pin_name, version])):
+            # versions never change, so metadata seen before can be reused
+            meta = self._get_memoized_meta(pin_name, version)
+            if meta is not None:
+                return meta
+
+            # ensure pin and version exist, unless its metadata is in the local
+            # cache directory (e.g. from an earlier read). Otherwise, a missing
+            # version is noticed when opening its metadata.
+            path_meta = self._path_to_meta(pin_name, version)
+            if self._is_cached(path_meta):
+                pass
+            elif self._is_offline():
+                raise PinsError(
+                    f"Version {version} of pin {name} is not in the local cache, so "
+                    "cannot be read while offline."
+                )
+            elif check_exists and not self.fs.exists(
+                self.construct_path([pin_name, version])
+            ):
                 raise PinsError(
                     f"Pin {name} either does not exist, or is missing version: {version}."
                 )
@@ -143,25 +256,31 @@ class BaseBoard:
             selected_version = guess_version(version)
         else:
             # otherwise, get the last pin version
-            versions = self.pin_versions(name, as_df=False)
-
-            if not len(versions):
-                raise NotImplementedError("TODO: sanity check when no versions")
+            selected_version = self._resolve_latest_version(name, check_exists)
 
-            # select last version ----
-            selected_version = versions[-1]
+            meta = self._get_memoized_meta(pin_name, selected_version.version)
+            if meta is not None:
+                return meta
 
         # fetch metadata for version ------------------------------------------
 
-        components = [pin_name, selected_version.version]
-        meta_name = self.meta_factory.get_meta_name(*components)
+        path_meta = self._path_to_meta(pin_name, selected_version.version)
+        try:
+            with self._open_pin_meta(path_meta) as (f, local):
+                meta = self.meta_factory.read_pin_yaml(
+                    f, pin_name, selected_version, local=local
+                )
+        except FileNotFoundError:
+            if check_exists:
+                raise
 
-        path_meta = self.construct_path([*components, meta_name])
-        with self._open_pin_meta(path_meta) as (f, local):
-            meta = self.meta_factory.read_pin_yaml(
-                f, pin_name, selected_version, local=local
+            raise PinsError(
+                f"Pin {name} either does not exist, or is missing version: "
+                f"{selected_version.version}."
             )
 
+        meta_cache.set(self._meta_cache_key(pin_name, selected_version.version), meta)
+
         return meta
 
     def pin_list(self):
@@ -174,7 +293,11 @@ class BaseBoard:
         """
 
         full_paths = self.fs.ls(self.board, detail=False)
-        pin_names = map(self.keep_final_path_component, full_paths)
+
+        return self._pin_names_from_paths(full_paths)
+
+    def _pin_names_from_paths(self, paths) -> list[str]:
+        pin_names = map(self.keep_final_path_component, paths)
 
         return [name for name in pin_names if name not in self.reserved_pin_names]
 
@@ -201,26 +324,420 @@ class BaseBoard:
             A specific pin version to retrieve.
         hash:
             A hash used to validate the retrieved pin data. If specified, it is
-            compared against the `pin_hash` field retrieved by [](`~pins.boards.BaseBoard.pin_meta`).
+            compared against the hash of the pin's files, which should match the
+            `pin_hash` field retrieved by [](`~pins.boards.BaseBoard.pin_meta`).
+            A PinsHashError is raised if they differ.
 
         """
         meta = self.pin_fetch(name, version)
 
+        return self._read_pin_data(name, meta, hash)
+
+    def _read_pin_data(self, name, meta: Meta, hash: str | None = None):
         if isinstance(meta, MetaRaw):
             raise TypeError(
                 "Could not find metadata for this pin version. If this is an individual "
                 "file, may need to use pin_download()."
             )
 
+        self._link_blobs(name, meta)
+        self._check_offline_files(name, meta)
+
+        path_version = self.construct_path([self.path_to_pin(name), meta.version.version])
+        verify = hash is not None or get_verify_hash(self.verify_hash)
+
+        if verify and not isinstance(self.fs, PinsCache) and isinstance(meta.file, str):
+            # without a cache, hashing the file and then loading it would download
+            # it twice, so it is read into memory once, and loaded from there
+            from io import BytesIO
+
+            check_pickle_read(meta, self.allow_pickle_read)
+            with load_file(meta.file, self.fs, path_version, meta.type) as f:
+                buf = BytesIO(f.read())
+
+            _verify_pin_file(name, getattr(meta, "pin_hash", None), buf, hash)
+            return read_data(meta, buf)
+
+        if verify:
+            self._verify_pin_hash(name, meta, hash)
+
+        return self._load_data(meta, path_version)
+
+    def pin_meta_many(
+        self, names: Sequence[str], versions=None, max_workers: int | None = None
+    ) -> dict[str, Meta | Exception]:
+        """Return metadata about many pins at once.
+
+        Pins are checked using a single listing of the board, and their metadata
+        is fetched concurrently.
+
+        Parameters
+        ----------
+        names:
+            Pin names.
+        versions:
+            Specific pin versions to retrieve. Either a mapping of pin name to
+            version, or a sequence with a version (or None) for each name. By
+            default, the latest version of each pin is used.
+        max_workers:
+            The maximum number of threads used to fetch metadata.
+
+        Returns
+        -------
+        :
+            A dict mapping each pin name to its metadata. If fetching a pin failed,
+            its value is the raised exception, so one missing pin does not stop the
+            others from being fetched.
+
+        See Also
+        --------
+        [](`~pins.boards.BaseBoard.pin_meta`)
+
+        """
+
+        items = self._many_versions(names, versions)
+        existing = self._list_existing_pins()
+
+        def _fetch(item):
+            name, version = item
+            if existing is None:
+                return self.pin_meta(name, version)
+
+            if self.path_to_pin(name) not in existing:
+                raise PinsError(f"Pin {name} does not exist.")
+
+            return self._pin_meta(name, version, check_exists=False)
+
+        return dict(zip(names, self._map_many(_fetch, items, max_workers)))
+
+    def pin_read_many(
+        self, names: Sequence[str], versions=None, max_workers: int | None = None
+    ) -> dict[str, Any]:
+        """Return the data stored in many pins at once.
+
+        Metadata is fetched as in [](`~pins.boards.BaseBoard.pin_meta_many`). Then,
+        on boards with a cache, uncached pin files are downloaded in one request to
+        the filesystem (concurrent for filesystems like s3 or gcs), before the data
+        is loaded in threads.
+
+        Parameters
+        ----------
+        names:
+            Pin names.
+        versions:
+            Specific pin versions to retrieve. Either a mapping of pin name to
+            version, or a sequence with a version (or None) for each name. By
+            default, the latest version of each pin is used.
+        max_workers:
+            The maximum number of threads used to fetch metadata and load data.
+
+        Returns
+        -------
+        :
+            A dict mapping each pin name to its data. If reading a pin failed,
+            its value is the raised exception.
+
+        See Also
+        --------
+        [](`~pins.boards.BaseBoard.pin_read`)
+
+        """
+
+        metas = self.pin_meta_many(names, versions, max_workers=max_workers)
+
+        self._download_many(
+            [(name, meta) for name, meta in metas.items() if isinstance(meta, Meta)]
+        )
+
+        def _read(name):
+            meta = metas[name]
+            if isinstance(meta, Exception):
+                raise meta
+
+            return self._read_pin_data(name, meta)
+
+        return dict(zip(metas, self._map_many(_read, metas, max_workers)))
+
+    def _many_versions(self, names, versions) -> list[tuple[str, str | None]]:
+        if versions is None:
+            return [(name, None) for name in names]
+
+        if isinstance(versions, Mapping):
+            return [(name, versions.get(name)) for name in names]
+
+        if len(versions) != len(names):
+            raise ValueError(
+                f"Received {len(versions)} versions for {len(names)} pins. "
+                "Versions must be a mapping, or have one entry per pin name."
+            )
+
+        return list(zip(names, versions))
+
+    def _list_existing_pins(self) -> set[str] | None:
+        """Return the names of all pins, or None if each pin should be checked."""
+
+        if self._is_offline():
+            return None
+
+        return set(self.pin_list())
+
+    @staticmethod
+    def _map_many(f, items, max_workers=None) -> list:
+        """Call f on each item using a thread pool, returning errors as results."""
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        def _call(item):
+            try:
+                return f(item)
+            except Exception as e:
+                return e
+
+        items = list(items)
+        if len(items) <= 1:
+            return [_call(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers) as pool:
+            return list(pool.map(_call, items))
+
+    def pin_prefetch(
+        self,
+        names: str | Sequence[str],
+        versions="latest",
+        max_workers: int | None = None,
+        wait: bool = True,
+    ):
+        """Download the metadata and files of pins into the cache, without reading them.
+
+        This is useful for warming the cache before pins are needed, e.g. while a
+        scheduled job is starting up. Metadata is fetched as in
+        [](`~pins.boards.BaseBoard.pin_meta_many`). Then, uncached pin files are
+        downloaded in one request to the filesystem (concurrent for filesystems like
+        s3 or gcs), or otherwise in threads.
+
+        Parameters
+        ----------
+        names:
+            A pin name, or sequence of pin names.
+        versions:
+            The pin versions to download. Either "latest", a mapping of pin name to
+            version, or a sequence with a version (or None) for each name.
+        max_workers:
+            The maximum number of threads used to fetch metadata and files.
+        wait:
+            Whether to wait for the downloads to finish. If False, a
+            concurrent.futures.Future is returned immediately, whose result is the
+            dict described below.
+
+        Returns
+        -------
+        :
+            A dict mapping each pin name to the paths of its files in the cache. If
+            downloading a pin failed, its value is the raised exception.
+
+        See Also
+        --------
+        [](`~pins.boards.BaseBoard.pin_download`)
+
+        """
+
+        if not isinstance(self.fs, PinsCache):
+            raise PinsError("pin_prefetch requires a cache.")
+
+        if not wait:
+            from concurrent.futures import ThreadPoolExecutor
+
+            pool = ThreadPoolExecutor(1)
+            future = pool.submit(self.pin_prefetch, names, versions, max_workers)
+            pool.shutdown(wait=False)
+
+            return future
+
+        names = [names] if isinstance(names, str) else list(names)
+        versions = None if versions == "latest" else versions
+
+        metas = self.pin_meta_many(names, versions, max_workers=max_workers)
+        paths = {
+            name: self._pin_file_paths(name, meta)
+            for name, meta in metas.items()
+            if not isinstance(meta, Exception)
+        }
+
+        for name in paths:
+            self._link_blobs(name, metas[name])
+
+        try:
+            self._get_many([path for x in paths.values() for path in x])
+        except Exception as e:
+            # files that failed are fetched one at a time below, which ties any
+            # error to the pins it affects
+            _log.info(f"Downloading pin files together failed: {e!r}")
+
+        def _fetch(name):
+            meta = metas[name]
+            if isinstance(meta, Exception):
+                raise meta
+
+            self._check_offline_files(name, meta)
+
+            files = []
+            for path in paths[name]:
+                fname = self.fs._check_file(path)
+                if fname is None:
+                    with load_file(path, self.fs, None, None) as f:
+                        fname = f.name
+                files.append(str(Path(fname).absolute()))
+
+            return files
+
+        return dict(zip(metas, self._map_many(_fetch, metas, max_workers)))
+
+    def _pin_file_paths(self, name, meta: Meta) -> list[str]:
+        """Return the paths of every file in a pin version."""
+
+        if isinstance(meta, MetaRaw):
+            # e.g. a url to a single file, which has no version directory
+            return [load_path(meta.file, None, meta.type)]
+
+        fnames = [meta.file] if isinstance(meta.file, str) else meta.file
+        path_version = self.construct_path([self.path_to_pin(name), meta.version.version])
+
+        paths = [load_path(fname, path_version, meta.type) for fname in fnames]
+        return list(dict.fromkeys(paths))
+
+    def _link_blobs(self, name, meta: Meta) -> None:
+        """Link an uncached pin file to an identical file in the cache's blob store.
+
+        Pin hashes are the xxh64 hash of a pin's file, when it has one, so these
+        files can be found in the store without downloading them.
+        """
+
+        if not isinstance(self.fs, PinsCache) or self.fs.blobs is None:
+            return
+
+        if isinstance(meta, MetaRaw) or not isinstance(meta.file, str):
+            return
+
+        if not meta.pin_hash:
+            return
+
+        (path,) = self._pin_file_paths(name, meta)
+        if self._is_cached(path):
+            return
+
+        lpath = cache_path(self.fs, path)
+        with cache_fill_lock([lpath]):
+            if not os.path.exists(lpath):
+                self.fs.blobs.link(meta.pin_hash, lpath)
+
+    def _verify_pin_hash(self, name, meta: Meta, hash: str | None = None) -> None:
+        """Check that a pin's files match its hash, and any hash the user gave.
+
+        When the board has a cache, a pin whose cached files do not match its hash
+        is removed from the cache and fetched once more, before raising an error.
+        """
+
+        if isinstance(meta, MetaRaw):
+            # files without metadata have no hash, so only a hash the user gave is
+            # checked
+            if hash is not None:
+                paths = self._pin_file_paths(name, meta)
+                _check_pin_hash(name, self._hash_pin_files(paths), hash)
+            return
+
+        pin_hash = getattr(meta, "pin_hash", None)
+        if not _is_xxh64(pin_hash):
+            # e.g. pins written by R, whose hashes are calculated differently
+            if hash is not None:
+                _check_pin_hash(name, pin_hash, hash)
+            return
+
+        paths = self._pin_file_paths(name, meta)
+        actual = self._hash_pin_files(paths)
+
+        if (
+            actual != pin_hash
+            and isinstance(self.fs, PinsCache)
+            and not self._is_offline()
+        ):
+            inform(_log, f"Pin {name} does not match its hash, fetching it again.")
+
+            hashes = [pin_hash] if len(paths) == 1 else [None] * len(paths)
+            for path, file_hash in zip(paths, hashes):
+                evict_cached_file(cache_path(self.fs, path), self.fs.blobs, file_hash)
+
+            actual = self._hash_pin_files(paths)
+
+        _check_pin_hash(name, actual, pin_hash)
         if hash is not None:
-            raise NotImplementedError("TODO: validate hash")
+            _check_pin_hash(name, actual, hash)
 
-        pin_name = self.path_to_pin(name)
+    def _hash_pin_files(self, paths: Sequence[str]) -> str:
+        """Return the xxh64 hash of the files in a pin, fetching them into the cache."""
 
-        return self._load_data(
-            meta, self.construct_path([pin_name, meta.version.version])
+        if not isinstance(self.fs, PinsCache):
+            hashes = []
+            for path in paths:
+                with self.fs.open(path, "rb") as f:
+                    hashes.append(Version.hash_file(f, 2**20))
+
+            return Version.combine_hashes(hashes)
+
+        self._get_many(paths)
+        for path in paths:
+            if not self._is_cached(path):
+                self.fs.open(path, "rb").close()
+
+        return Version.combine_hashes(
+            [cached_file_hash(cache_path(self.fs, path)) for path in paths]
+        )
+
+    def _download_many(self, metas) -> None:
+        """Download the uncached files pin_read needs into the cache, in one request."""
+
+        for name, meta in metas:
+            self._link_blobs(name, meta)
+
+        self._get_many(
+            [
+                path
+                for name, meta in metas
+                if not isinstance(meta, MetaRaw) and isinstance(meta.file, str)
+                for path in self._pin_file_paths(name, meta)
+            ]
         )
 
+    def _get_many(self, rpaths: Sequence[str]) -> None:
+        """Download uncached files into the cache, in a single request."""
+
+        from fsspec.asyn import AsyncFileSystem
+
+        # filesystems without coroutines get files one at a time, so there is no
+        # gain over fetching them in threads
+        fs = self._uncached_fs
+        if not isinstance(self.fs, PinsCache) or not isinstance(fs, AsyncFileSystem):
+            return
+
+        if self._is_offline():
+            return
+
+        rpaths = [path for path in dict.fromkeys(rpaths) if not self._is_cached(path)]
+
+        if rpaths:
+            # note that _make_local_details would request each file's info
+            lpaths = [cache_path(self.fs, path) for path in rpaths]
+            for parent in {os.path.dirname(lpath) for lpath in lpaths}:
+                os.makedirs(parent, exist_ok=True)
+
+            fetched = set(fill_cache(fs, rpaths, lpaths, self.fs.blobs))
+
+            for rpath, lpath in zip(rpaths, lpaths):
+                # files another process fetched are counted when they are read
+                if rpath in fetched:
+                    self.fs.stats.record(
+                        stats_key(self.fs, rpath), False, os.path.getsize(lpath)
+                    )
+
     def _pin_store(
         self,
         x,
@@ -234,71 +751,24 @@ class BaseBoard:
         *,
         force_identical_write: bool = False,
     ) -> Meta:
-        _type = type
-        if _type == "feather":
-            warn_deprecated(
-                'Writing pin type "feather" is unsupported. Switching type to "arrow".'
-                " This produces the exact same behavior, and also works with R pins."
-                ' Please switch to pin_write using type="arrow".'
-            )
-            _type = "arrow"
-
-        if _type == "file":
-            # the file type makes the name of the data the exact filename, rather
-            # than the pin name + a suffix (e.g. my_pin.csv).
-            if isinstance(x, (tuple, list)) and len(x) == 1:
-                x = x[0]
-
-            if not isinstance(x, (list, tuple)):
-                _p = Path(x)
-                _base_len = len(_p.name) - len("".join(_p.suffixes))
-                object_name = _p.name[:_base_len]
-            else:
-                # multifile upload, keep list of filenames
-                object_name = []
-                for file in x:
-                    _p = Path(file)
-                    # _base_len = len(_p.name) - len("".join(_p.suffixes))
-                    object_name.append(_p.name)  # [:_base_len])
-        else:
-            object_name = None
-
         pin_name = self.path_to_pin(name)
-
-        # Preemptively fetch the most recent pin's meta if it exists - this is used
-        # for the force_identical_write check
-        abort_if_identical = not force_identical_write and self.pin_exists(name)
-        if abort_if_identical:
-            last_meta = self.pin_meta(name)
+        last_meta = self._last_meta_for_write(name, force_identical_write)
 
         with tempfile.TemporaryDirectory() as tmp_dir:
-            # create all pin data (e.g. data.txt, save object) to get the metadata.
-            # For unversioned boards, this also will delete the most recent pin version,
-            # ready for it to be replaced with a new one.
-            meta = self.prepare_pin_version(
+            meta = self._stage_pin_version(
                 tmp_dir,
                 x,
-                pin_name,
-                _type,
+                name,
+                type,
                 title,
                 description,
                 metadata,
                 versioned,
                 created,
-                object_name=object_name,
+                last_meta=last_meta,
             )
-
-            # force_identical_write check
-            if abort_if_identical:
-                last_hash = last_meta.pin_hash
-
-                if last_hash == meta.pin_hash:
-                    msg = (
-                        f'The hash of pin "{name}" has not changed. Your pin will not '
-                        f"be stored.",
-                    )
-                    inform(log=_log, msg=msg)
-                    return last_meta
+            if meta is None:
+                return last_meta
 
             # move pin to destination ----
             # create pin version folder
@@ -326,7 +796,11 @@ class BaseBoard:
 
             inform(_log, f"Writing pin:\nName: {repr(pin_name)}\nVersion: {dst_version}")
 
-            res = self.fs.put(tmp_dir, dst_version_path, recursive=True)
+            with span("put", path=dst_version_path) as s:
+                if s.active:
+                    s.bytes = path_size(tmp_dir)
+
+                res = self.fs.put(tmp_dir, dst_version_path, recursive=True)
 
         if dst_version_path == dst_pin_path:
             # TODO(refactor): this is a RSConnect specific hack
@@ -335,46 +809,139 @@ class BaseBoard:
             bundle_version = VersionRaw(res.split("/")[-1])
             meta.version = bundle_version
 
+        self._update_latest(name, pin_name)
+
         return meta
 
-    def pin_write(
+    def _last_meta_for_write(self, name, force_identical_write: bool) -> Meta | None:
+        """Return a pin's latest metadata, to check whether a write changes it."""
+
+        if force_identical_write or not self.pin_exists(name):
+            return None
+
+        return self.pin_meta(name)
+
+    def _stage_pin_version(
         self,
+        tmp_dir,
         x,
-        name: str | None = None,
-        type: str | None = None,
-        title: str | None = None,
-        description: str | None = None,
-        metadata: Mapping | None = None,
-        versioned: bool | None = None,
-        created: datetime | None = None,
+        name: str | None,
+        type: str | None,
+        title: str | None,
+        description: str | None,
+        metadata: Mapping | None,
+        versioned: bool | None,
+        created: datetime | None,
         *,
-        force_identical_write: bool = False,
-    ) -> Meta:
-        """Write a pin object to the board.
+        last_meta: Meta | None = None,
+    ) -> Meta | None:
+        """Save a new pin version to tmp_dir, and return its metadata.
 
-        Parameters
-        ----------
-        x:
-            An object (e.g. a pandas DataFrame) to pin.
-        name:
-            Pin name.
-        type:
-            File type used to save `x` to disk. May be "csv", "arrow", "parquet",
-            "joblib", or "json".
-        title:
-            A title for the pin; most important for shared boards so that others
-            can understand what the pin contains. If omitted, a brief description
-            of the contents will be automatically generated.
-        description:
-            A detailed description of the pin contents.
-        metadata:
-            A dictionary containing additional metadata to store with the pin.
-            This gets stored on the Meta.user field.
-        versioned:
-            Whether the pin should be versioned. Defaults to versioning.
-        created:
-            A date to store in the Meta.created field. This field may be used as
-            part of the pin version name.
+        Returns None if the version has the same hash as last_meta, so does not need
+        to be written.
+        """
+
+        x, _type, object_name = self._prepare_pin_object(x, type)
+
+        # create all pin data (e.g. data.txt, save object) to get the metadata.
+        # For unversioned boards, this also will delete the most recent pin version,
+        # ready for it to be replaced with a new one.
+        meta = self.prepare_pin_version(
+            tmp_dir,
+            x,
+            self.path_to_pin(name),
+            _type,
+            title,
+            description,
+            metadata,
+            versioned,
+            created,
+            object_name=object_name,
+        )
+
+        # force_identical_write check
+        if last_meta is not None and last_meta.pin_hash == meta.pin_hash:
+            msg = (
+                f'The hash of pin "{name}" has not changed. Your pin will not '
+                f"be stored.",
+            )
+            inform(log=_log, msg=msg)
+            return None
+
+        return meta
+
+    def _prepare_pin_object(self, x, type: str | None):
+        """Return the object to save, its pin type, and (for files) its name."""
+
+        _type = type
+        if _type == "feather":
+            warn_deprecated(
+                'Writing pin type "feather" is unsupported. Switching type to "arrow".'
+                " This produces the exact same behavior, and also works with R pins."
+                ' Please switch to pin_write using type="arrow".'
+            )
+            _type = "arrow"
+
+        if _type == "file":
+            # the file type makes the name of the data the exact filename, rather
+            # than the pin name + a suffix (e.g. my_pin.csv).
+            if isinstance(x, (tuple, list)) and len(x) == 1:
+                x = x[0]
+
+            if not isinstance(x, (list, tuple)):
+                _p = Path(x)
+                _base_len = len(_p.name) - len("".join(_p.suffixes))
+                object_name = _p.name[:_base_len]
+            else:
+                # multifile upload, keep list of filenames
+                object_name = []
+                for file in x:
+                    _p = Path(file)
+                    # _base_len = len(_p.name) - len("".join(_p.suffixes))
+                    object_name.append(_p.name)  # [:_base_len])
+        else:
+            object_name = None
+
+        return x, _type, object_name
+
+    def pin_write(
+        self,
+        x,
+        name: str | None = None,
+        type: str | None = None,
+        title: str | None = None,
+        description: str | None = None,
+        metadata: Mapping | None = None,
+        versioned: bool | None = None,
+        created: datetime | None = None,
+        *,
+        force_identical_write: bool = False,
+    ) -> Meta:
+        """Write a pin object to the board.
+
+        Parameters
+        ----------
+        x:
+            An object (e.g. a pandas DataFrame) to pin.
+        name:
+            Pin name.
+        type:
+            File type used to save `x` to disk. May be "csv", "arrow", "parquet",
+            "joblib", or "json".
+        title:
+            A title for the pin; most important for shared boards so that others
+            can understand what the pin contains. If omitted, a brief description
+            of the contents will be automatically generated.
+        description:
+            A detailed description of the pin contents.
+        metadata:
+            A dictionary containing additional metadata to store with the pin.
+            This gets stored on the Meta.user field.
+        versioned:
+            Whether the pin should be versioned. Defaults to versioning.
+        created:
+            A date to store in the Meta.created field. This field may be used as
+            part of the pin version name.
         force_identical_write:
             Store the pin even if the pin contents are identical to the last version
             (compared using the hash). Only the pin contents are compared, not the pin
@@ -406,12 +973,24 @@ class BaseBoard:
             force_identical_write=force_identical_write,
         )
 
-    def pin_download(self, name, version=None, hash=None) -> Sequence[str]:
+    def pin_download(
+        self,
+        name,
+        version=None,
+        hash=None,
+        *,
+        max_workers: int | None = None,
+        retries: int = 0,
+        callback=None,
+    ) -> Sequence[str]:
         """Download the files contained in a pin.
 
         This method only downloads the files in a pin. In order to read and load
         pin data as an object (e.g. a pandas DataFrame), use [](`~pins.boards.BaseBoard.pin_read`).
 
+        Files are downloaded together, in one request to the filesystem (concurrent
+        for filesystems like s3 or gcs), or otherwise in threads.
+
         Parameters
         ----------
         name:
@@ -420,14 +999,31 @@ class BaseBoard:
             A specific pin version to retrieve.
         hash:
             A hash used to validate the retrieved pin data. If specified, it is
-            compared against the `pin_hash` field retrieved by [](`~pins.boards.BaseBoard.pin_meta`).
+            compared against the hash of the pin's files, which should match the
+            `pin_hash` field retrieved by [](`~pins.boards.BaseBoard.pin_meta`).
+            A PinsHashError is raised if they differ.
+        max_workers:
+            The maximum number of threads used to download files.
+        retries:
+            The number of times to retry downloading a file, if it fails. Missing
+            files are not retried.
+        callback:
+            An fsspec Callback, whose size is set to the number of files, and which is
+            updated as each file is downloaded (e.g. fsspec's TqdmCallback, to show a
+            progress bar).
+
+        Returns
+        -------
+        :
+            The absolute paths of the downloaded files, in the same order as the
+            files in the pin's metadata.
 
         """
 
         meta = self.pin_fetch(name, version)
 
-        if hash is not None:
-            raise NotImplementedError("TODO: validate hash")
+        self._link_blobs(name, meta)
+        self._check_offline_files(name, meta)
 
         fnames = [meta.file] if isinstance(meta.file, str) else meta.file
         pin_type = meta.type
@@ -435,24 +1031,56 @@ class BaseBoard:
         if len(fnames) > 1 and pin_type in REQUIRES_SINGLE_FILE:
             raise ValueError("Cannot load data when more than 1 file")
 
-        pin_name = self.path_to_pin(name)
-        files = []
-
-        for fname in fnames:
-            # fetch file
-            with load_file(
-                fname,
-                self.fs,
-                self.construct_path([pin_name, meta.version.version]),
-                pin_type,
-            ) as f:
-                # could also check whether f isinstance of PinCache
-                fname = getattr(f, "name", None)
+        if isinstance(meta, MetaRaw):
+            # e.g. a url to a single file, which has no version directory
+            paths = self._pin_file_paths(name, meta)
+        else:
+            path_version = self.construct_path(
+                [self.path_to_pin(name), meta.version.version]
+            )
+            paths = [load_path(fname, path_version, pin_type) for fname in fnames]
 
-                if fname is None:
-                    raise PinsError("pin_download requires a cache.")
+        if callback is None:
+            from fsspec.callbacks import DEFAULT_CALLBACK as callback
 
-                files.append(str(Path(fname).absolute()))
+        callback.set_size(len(paths))
+
+        def _fetch(path):
+            for attempt in range(retries + 1):
+                try:
+                    with load_file(path, self.fs, None, None) as f:
+                        # could also check whether f isinstance of PinCache
+                        fname = getattr(f, "name", None)
+                    break
+                except (FileNotFoundError, PinsError):
+                    raise
+                except Exception as e:
+                    if attempt == retries:
+                        raise
+
+                    inform(_log, f"Retrying download of {path} after error: {e!r}")
+                    time.sleep(DOWNLOAD_RETRY_WAIT * 2**attempt)
+
+            if fname is None:
+                raise PinsError("pin_download requires a cache.")
+
+            callback.relative_update(1)
+            return str(Path(fname).absolute())
+
+        try:
+            self._get_many(paths)
+        except Exception as e:
+            # files are fetched one at a time below, with retries
+            _log.info(f"Downloading pin files together failed: {e!r}")
+
+        files = self._map_many(_fetch, paths, max_workers)
+        for res in files:
+            if isinstance(res, Exception):
+                raise res
+
+        # files are in the cache now, so checking them does not download them again
+        if hash is not None or get_verify_hash(self.verify_hash):
+            self._verify_pin_hash(name, meta, hash)
 
         return files
 
@@ -518,6 +1146,9 @@ class BaseBoard:
         pin_version_path = self.construct_path([pin_name, version])
         self.fs.rm(pin_version_path, recursive=True)
 
+        self._evict_meta(pin_name, version)
+        self._evict_latest(pin_name, version)
+
     def pin_versions_prune(self, name, n: int | None = None, days: int | None = None):
         """Delete old versions of a pin.
 
@@ -586,6 +1217,9 @@ class BaseBoard:
 
         metas = list(map(self.pin_meta, names))
 
+        return self._search_metas(metas, search, as_df)
+
+    def _search_metas(self, metas, search=None, as_df=True):
         # search pins ----
 
         if search:
@@ -632,6 +1266,9 @@ class BaseBoard:
             path_to_pin = self.construct_path([self.path_to_pin(name)])
             self.fs.rm(path_to_pin, recursive=True)
 
+            self._evict_meta(self.path_to_pin(name))
+            latest_cache.evict(self._latest_cache_key(self.path_to_pin(name)))
+
     def pin_browse(self, name, version=None, local=False):
         """TODO: Navigate to the home of a pin, either on the internet or locally.
 
@@ -788,11 +1425,49 @@ class BaseBoard:
             meta, self.fs, pin_version_path, allow_pickle_read=self.allow_pickle_read
         )
 
+    def cache_stats(self, reset: bool = False) -> dict | None:
+        """Return counts of cache hits and misses, and bytes read from the cache.
+
+        Parameters
+        ----------
+        reset:
+            Whether to set the counts back to zero, after returning them.
+
+        Returns
+        -------
+        :
+            A dict with total hits, misses, bytes_fetched from the board, and
+            bytes_served from the cache. Its "pins" entry holds the same counts for
+            each pin. None if this board does not have a cache.
+
+        Notes
+        -----
+        Counts are kept in memory, unless the environment variable PINS_CACHE_STATS
+        is set to 1. Then they are also saved in the board's cache directory, and
+        added to by later sessions.
+        """
+
+        if not isinstance(self.fs, PinsCache):
+            return None
+
+        stats = self.fs.stats.to_dict()
+        if reset:
+            self.fs.stats.reset()
+
+        return stats
+
+    # async ------------------------------------------------------------------
+
+    @functools.cached_property
+    def aio(self) -> AsyncBoard:
+        """Coroutine versions of this board's methods. See AsyncBoard."""
+        return AsyncBoard(self)
+
     # filesystem and cache methods --------------------------------------------
 
     @contextlib.contextmanager
     def _open_pin_meta(self, path):
-        with self.fs.open(path) as f:
+        with self._traced_open(path) as f:
             self._touch_cache(path)
 
             # optional additional data to put in Meta.local
@@ -800,6 +1475,148 @@ class BaseBoard:
 
             yield f, local
 
+    def _traced_open(self, path):
+        """Open a file, timing it as an open_pin_meta span."""
+
+        with span("open_pin_meta", path=path) as s:
+            if s.active:
+                s.cache_hit = self._is_cached(path)
+
+            f = self.fs.open(path)
+
+            if s.active:
+                s.bytes = file_size(f)
+
+        return f
+
+    @property
+    def _meta_cache_board(self) -> str:
+        board = self.board
+
+        # a relative path names a different board from each working directory
+        if isinstance(self._uncached_fs, LocalFileSystem):
+            board = os.path.abspath(board)
+
+        return prefix_cache(self._uncached_fs, board)
+
+    def _meta_cache_key(self, pin_name: str, version: str) -> tuple[str, str, str]:
+        return (self._meta_cache_board, pin_name, version)
+
+    # latest version resolution -------------------------------------------------
+
+    def _use_latest_marker(self) -> bool:
+        return get_latest_marker(self.latest_marker)
+
+    def _latest_cache_key(self, pin_name: str) -> tuple[str, str]:
+        return (self._meta_cache_board, pin_name)
+
+    def _resolve_latest_version(self, name: str, check_exists: bool = True):
+        if self._is_offline():
+            return guess_version(self._cached_version_names(name)[-1])
+
+        pin_name = self.path_to_pin(name)
+
+        version = self._get_cached_latest(pin_name)
+        if version is None:
+            version = self._read_latest_marker(pin_name)
+            if version is None:
+                versions = self._pin_version_names(name, check_exists)
+                version = self._last_version_name(versions)
+
+            self._set_cached_latest(pin_name, version)
+
+        return guess_version(version)
+
+    def _get_cached_latest(self, pin_name: str) -> str | None:
+        ttl = get_latest_ttl(self.latest_ttl)
+        if ttl > 0:
+            return latest_cache.get(self._latest_cache_key(pin_name), ttl)
+
+        return None
+
+    def _set_cached_latest(self, pin_name: str, version: str) -> None:
+        if get_latest_ttl(self.latest_ttl) > 0:
+            latest_cache.set(self._latest_cache_key(pin_name), version)
+
+    @staticmethod
+    def _last_version_name(versions: Sequence[str]) -> str:
+        if not len(versions):
+            raise NotImplementedError("TODO: sanity check when no versions")
+
+        return versions[-1]
+
+    def _update_latest(self, name: str, pin_name: str) -> None:
+        """Record the latest version of a pin, after writing to it."""
+
+        # writes may not be the latest version (e.g. if created is set to an
+        # earlier time), so the latest version is found the usual way.
+        latest_cache.evict(self._latest_cache_key(pin_name))
+
+        if self._use_latest_marker():
+            version = self._pin_version_names(name)[-1]
+            self._write_latest_marker(pin_name, version)
+
+    def _evict_latest(self, pin_name: str, version: str) -> None:
+        latest_cache.evict(self._latest_cache_key(pin_name))
+
+        # remove the marker if it points to a deleted version
+        if self._read_latest_marker(pin_name) == version:
+            path_marker = self.construct_path([pin_name, self.latest_marker_name])
+            self._uncached_fs.rm(path_marker)
+
+    def _read_latest_marker(self, pin_name: str) -> str | None:
+        if not self._use_latest_marker():
+            return None
+
+        # the marker changes, so always read it from the board, not a cache
+        path_marker = self.construct_path([pin_name, self.latest_marker_name])
+        try:
+            return self._uncached_fs.cat_file(path_marker).decode().strip()
+        except FileNotFoundError:
+            return None
+
+    def _write_latest_marker(self, pin_name: str, version: str) -> None:
+        path_marker = self.construct_path([pin_name, self.latest_marker_name])
+        self._uncached_fs.pipe_file(path_marker, version.encode())
+
+    @property
+    def _uncached_fs(self) -> IFileSystem:
+        return self.fs.fs if isinstance(self.fs, PinsCache) else self.fs
+
+    # metadata memoization ------------------------------------------------------
+
+    def _get_memoized_meta(self, pin_name: str, version: str) -> Meta | None:
+        meta = meta_cache.get(self._meta_cache_key(pin_name, version))
+
+        # count this as an access of the local copy, for cache pruning
+        if meta is not None:
+            path_meta = self._path_to_meta(pin_name, version)
+            if self._is_cached(path_meta):
+                self._touch_cache(path_meta)
+
+        return meta
+
+    def _evict_meta(self, pin_name: str, version: str | None = None) -> None:
+        """Forget the metadata of a deleted pin, or pin version."""
+
+        meta_cache.evict(self._meta_cache_board, pin_name, version)
+
+        # remove the local copy too, so it is not mistaken for an existing version
+        if isinstance(self.fs, PinsCache):
+            path_cache = self._get_cache_path(pin_name, version)
+            if path_cache is not None:
+                shutil.rmtree(path_cache, ignore_errors=True)
+
+    def _path_to_meta(self, pin_name: str, version: str) -> str:
+        meta_name = self.meta_factory.get_meta_name(pin_name, version)
+        return self.construct_path([pin_name, version, meta_name])
+
+    def _is_cached(self, path: str) -> bool:
+        if not isinstance(self.fs, (PinsCache, PinsAccessTimeCache)):
+            return False
+
+        return self.fs._check_file(path) is not None
+
     def _get_cache_path(self, pin_name, version=None, fname=None):
         version_part = [version] if version is not None else []
         fname_part = [fname] if fname is not None else []
@@ -818,6 +1635,75 @@ class BaseBoard:
         path_to_hashed = self.fs._check_file(path)
         return touch_access_time(path_to_hashed)
 
+    # offline mode ------------------------------------------------------------
+
+    def _is_offline(self) -> bool:
+        # boards without a cache (e.g. local folders) have nothing to be offline from
+        return isinstance(self.fs, (PinsCache, PinsAccessTimeCache)) and get_offline(
+            self.offline
+        )
+
+    def _cached_version_names(self, name: str) -> list[str]:
+        """Return the sorted names of versions whose metadata is in the cache."""
+
+        path_pin = self._get_cache_path(name)
+        meta_name = self.meta_factory.get_meta_name()
+
+        versions = []
+        if path_pin is not None:
+            for version in os.listdir(path_pin):
+                if os.path.isfile(os.path.join(path_pin, version, meta_name)):
+                    versions.append(version)
+
+        if not versions:
+            raise PinsError(
+                f"Pin {name} has no versions in the local cache, so cannot be read "
+                "while offline."
+            )
+
+        return self._sort_version_paths(versions)
+
+    def _check_offline_files(self, name: str, meta: Meta) -> None:
+        """Raise an error if offline, and any of a pin's files are not cached."""
+
+        if not self._is_offline():
+            return
+
+        missing = [p for p in self._pin_file_paths(name, meta) if not self._is_cached(p)]
+        if missing:
+            raise PinsError(
+                f"Pin {name} has files that are not in the local cache, so cannot be "
+                f"read while offline: {missing}"
+            )
+
+
+def _is_xxh64(pin_hash: str | None) -> bool:
+    return pin_hash is not None and re.fullmatch("[0-9a-f]{16}", pin_hash) is not None
+
+
+def _check_pin_hash(name: str, actual: str | None, expected: str) -> None:
+    # hashes may be shortened, e.g. to the part used in version names
+    if not expected or actual is None or not actual.startswith(expected):
+        raise PinsHashError(
+            f"Pin {name} has hash {actual!r}, which does not match the expected "
+            f"hash {expected!r}."
+        )
+
+
+def _verify_pin_file(name: str, pin_hash: str | None, f, hash: str | None) -> None:
+    """Check an in-memory pin file against its hash, and any hash the user gave."""
+
+    if _is_xxh64(pin_hash):
+        actual = Version.hash_file(f)
+        f.seek(0)
+        _check_pin_hash(name, actual, pin_hash)
+    else:
+        # e.g. pins written by R, whose hashes are calculated differently
+        actual = pin_hash
+
+    if hash is not None:
+        _check_pin_hash(name, actual, hash)
+
 
 def board_deparse(board: BaseBoard):
     """Return a representation of how a board could be reconstructed.
@@ -918,6 +1804,10 @@ class BoardManual(BaseBoard):
     def pin_versions(self, *args, **kwargs):
         raise NotImplementedError("This board does not support pin_versions.")
 
+    def _list_existing_pins(self):
+        # pin_meta is customized for this board, so it checks each pin itself
+        return None
+
     @ExtendMethodDoc
     def pin_meta(self, name, version=None):
         if version is not None:
@@ -948,23 +1838,31 @@ class BoardManual(BaseBoard):
         return meta
 
     @ExtendMethodDoc
-    def pin_download(self, name, version=None, hash=None) -> Sequence[str]:
+    def pin_download(
+        self,
+        name,
+        version=None,
+        hash=None,
+        *,
+        max_workers: int | None = None,
+        retries: int = 0,
+        callback=None,
+    ) -> Sequence[str]:
         meta = self.pin_meta(name, version)
 
-        if isinstance(meta, MetaRaw):
-            f = load_file(meta.file, self.fs, None, meta.type)
-        else:
+        if not isinstance(meta, MetaRaw):
             raise NotImplementedError(
                 "TODO: pin_download currently can only read a url to a single file."
             )
 
-        # could also check whether f isinstance of PinCache
-        fname = getattr(f, "name", None)
-
-        if fname is None:
-            raise PinsError("pin_download requires a cache.")
-
-        return [str(Path(fname).absolute())]
+        return super().pin_download(
+            name,
+            version,
+            hash,
+            max_workers=max_workers,
+            retries=retries,
+            callback=callback,
+        )
 
     def construct_path(self, elements):
         # TODO: in practice every call to construct_path has the first element of
@@ -1011,54 +1909,137 @@ class BoardRsConnect(BaseBoard):
     # defaults work ----
 
     @ExtendMethodDoc
-    def pin_list(self):
+    def pin_list(self, owner: str | None = None, name: str | None = None):
+        """List names of all pins in a board.
+
+        Extends parent method in the following ways:
+
+        * Adds owner and name arguments, to only list pins owned by a specific
+          user, or with a specific (short) name. These filters are applied by the
+          Posit Connect server.
+        """
+
+        if owner is not None or name is not None:
+            return self._pin_list_filtered(owner, name)
+
         # lists all pin content on Posit Connect server
         # we can't use fs.ls, because it will list *all content*
-        paged_res = self.fs.api.misc_get_applications("content_type:pin")
-        results = paged_res.results
+        names = []
+        for page in self.fs.api.misc_walk_applications("content_type:pin"):
+            names.extend(
+                f"{cont['owner_username']}/{cont['name']}" for cont in page.results
+            )
 
-        names = [f"{cont['owner_username']}/{cont['name']}" for cont in results]
         return names
 
+    def _pin_list_filtered(self, owner: str | None, name: str | None):
+        if owner is not None:
+            try:
+                owner_guid = self.fs.info(owner)["guid"]
+            except ValueError:
+                # no user with this name
+                return []
+        else:
+            owner_guid = None
+
+        results = self.fs.api.get_content(owner_guid, name, include="owner")
+
+        # the v1 content endpoint can't filter on type, so keep pins here
+        return [
+            f"{cont['owner']['username']}/{cont['name']}"
+            for cont in results
+            if cont.get("content_category") == "pin"
+        ]
+
+    def _list_existing_pins(self):
+        # listing every pin on the server costs more than checking a few pins
+        return None
+
     @ExtendMethodDoc
-    def pin_write(self, *args, access_type=None, versioned: bool | None = None, **kwargs):
+    def pin_write(
+        self,
+        *args,
+        access_type=None,
+        deploy: bool = True,
+        deploy_timeout: float | None = None,
+        **kwargs,
+    ):
         """Write a pin.
 
         Extends parent method in the following ways:
 
         * Modifies content item to include any title and description changes.
         * Adds access_type argument to specify who can see content. Defaults to "acl".
+        * Adds deploy argument. If False, return as soon as the deployment of the
+          new version has started, with a RsConnectDeployment, whose .wait() method
+          returns the pin metadata once it is finished. Work done after deploying
+          (e.g. removing the replaced version of an unversioned pin) happens even
+          if the deployment is never waited on, unless Python exits first.
+        * Adds deploy_timeout argument, the number of seconds to wait for a
+          deployment to finish before raising an error. Defaults to waiting forever.
+          A deployment that is not waited on is given up on after this long too.
         """
 
-        f_super = super().pin_write
-
-        # bind the original signature to get pin name
-        sig = inspect.signature(f_super)
+        sig = inspect.signature(super().pin_write)
         bind = sig.bind(*args, **kwargs)
-        pin_name = self.path_to_pin(bind.arguments["name"])
 
-        if pin_name.split("/")[0] != self.user_name and not self.fs.exists(pin_name):
-            # TODO: fs.mkdir here would erroneously create content for the user calling the API
-            # even if they were trying to create a content item for another user. we catch it here,
-            # but should also fix things downstream.
+        if bind.arguments.get("type") == "file":
+            # let the parent method raise its usual error
+            return super().pin_write(*args, **kwargs)
+
+        return self._pin_store(
+            *bind.args,
+            **bind.kwargs,
+            access_type=access_type,
+            deploy=deploy,
+            deploy_timeout=deploy_timeout,
+        )
+
+    def _pin_store(
+        self,
+        x,
+        name: str | None = None,
+        type: str | None = None,
+        title: str | None = None,
+        description: str | None = None,
+        metadata: Mapping | None = None,
+        versioned: bool | None = None,
+        created: datetime | None = None,
+        *,
+        force_identical_write: bool = False,
+        access_type: str | None = None,
+        deploy: bool = True,
+        deploy_timeout: float | None = None,
+    ):
+        # Posit Connect requests are slow, so rather than going through the
+        # filesystem (which re-fetches the content item for nearly every call),
+        # this fetches the content item once and works directly with the API.
+        from pins.rsconnect.fs import PinBundleManifest
+
+        x, _type, object_name = self._prepare_pin_object(x, type)
+
+        pin_name = self.path_to_pin(name)
+        content = self._get_content_or_none(pin_name)
+
+        if content is None and pin_name.split("/")[0] != self.user_name:
+            # we can only create content for the user calling the API.
             raise PinsError(
                 f"You are connected as {self.user_name}, but you are trying to create a new piece"
                 f" of content for another user ({pin_name}). They must create the content before you"
                 " can write to it."
             )
 
-        # attempt to make the least number of API calls possible
-        if versioned or versioned is None and self.versioned:
-            # arbitrary number greater than 1
-            n_versions_before = 100
+        # only unversioned writes need to know about existing versions
+        if content is None:
+            versions = []
+        elif versioned or versioned is None and self.versioned:
+            versions = None
         else:
-            try:
-                versions_df = self.pin_versions(pin_name, as_df=True)
-                versions = versions_df["version"].to_list()
-                n_versions_before = len(versions)
-            except PinsError:
-                # pin does not exist
-                n_versions_before = 0
+            bundles = self.fs.api.get_content_bundles(content["guid"])
+            versions = self.sort_pin_versions([VersionRaw(b.get_id()) for b in bundles])
+            versions = [v.version for v in versions]
+
+        n_versions_before = 100 if versions is None else len(versions)
 
         if versioned is None:
             versioned = True if n_versions_before > 1 else self.versioned
@@ -1069,36 +2050,94 @@ class BoardRsConnect(BaseBoard):
                 "To un-version a pin, you must delete it"
             )
 
-        # run parent function ---
-        meta = f_super(*args, **kwargs)
-
-        # update content title to reflect what's in metadata ----
-        # TODO(question): R pins updates this info before writing the pin..?
-        content = self.fs.info(pin_name)
-        self.fs.api.patch_content_item(
-            content["guid"],
-            title=meta.title,
-            description=meta.description or "",
-            access_type=access_type or content["access_type"],
-        )
-
-        # clean up non-active pins in the case of an unversioned board
-        # a pin existed before the latest pin
-        if versioned is False and n_versions_before == 1:
-            _log.info(f"Replacing version '{versions}' with '{meta.version.version}'")
-            self.pin_version_delete(pin_name, versions[0])
+        # metadata of the active version, for the force_identical_write check
+        if not force_identical_write and content is not None and content["bundle_id"]:
+            last_meta = self._read_content_meta(pin_name, content)
+        else:
+            last_meta = None
 
-        return meta
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            meta = self.prepare_pin_version(
+                tmp_dir,
+                x,
+                pin_name,
+                _type,
+                title,
+                description,
+                metadata,
+                versioned,
+                created,
+                object_name=object_name,
+            )
+
+            if last_meta is not None and last_meta.pin_hash == meta.pin_hash:
+                msg = (
+                    f'The hash of pin "{name}" has not changed. Your pin will not '
+                    f"be stored.",
+                )
+                inform(log=_log, msg=msg)
+                deployment = RsConnectDeployment(self, None, last_meta)
+                return deployment if not deploy else deployment.wait()
+
+            content_fields = {
+                "title": meta.title,
+                "description": meta.description or "",
+                "access_type": access_type or (content or {}).get("access_type", "acl"),
+            }
+
+            if content is None:
+                # create the content with its title, so it won't need patching
+                content = self.fs.api.post_content_item(
+                    pin_name.split("/")[-1], **content_fields
+                )
+
+            inform(
+                _log,
+                f"Writing pin:\nName: {repr(pin_name)}\nVersion: {meta.version.version}",
+            )
+
+            PinBundleManifest.add_manifest_to_directory(tmp_dir)
+            with span("put", path=pin_name) as s:
+                if s.active:
+                    s.bytes = path_size(tmp_dir)
+
+                bundle = self.fs.api.post_content_bundle(content["guid"], tmp_dir)
+
+        # since we don't know the bundle id ahead of time, the meta version
+        # object needs to be replaced
+        meta.version = VersionRaw(str(bundle.get_id()))
+
+        # update content title to reflect what's in metadata ----
+        if any(content[k] != v for k, v in content_fields.items()):
+            self.fs.api.patch_content_item(content["guid"], **content_fields)
+
+        # clean up non-active pins in the case of an unversioned board
+        # a pin existed before the latest pin
+        def on_finish():
+            if versioned is False and n_versions_before == 1:
+                _log.info(f"Replacing version '{versions}' with '{meta.version.version}'")
+                self.pin_version_delete(pin_name, versions[0])
+
+            self._update_latest(name, pin_name)
+
+        task = self.fs.api.post_content_item_deploy(content["guid"], bundle.get_id())
+        deployment = RsConnectDeployment(
+            self, task["task_id"], meta, on_finish, timeout=deploy_timeout
+        )
+
+        if not deploy:
+            return deployment
+
+        return deployment.wait(timeout=deploy_timeout)
 
     @ExtendMethodDoc
     def pin_search(self, search=None, as_df=True):
         from pins.rsconnect.api import RsConnectApiRequestError
 
-        paged_res = self.fs.api.misc_get_applications("content_type:pin", search=search)
-        results = paged_res.results
+        pages = self.fs.api.misc_walk_applications("content_type:pin", search=search)
 
         res = []
-        for content in results:
+        for content in (cont for page in pages for cont in page.results):
             pin_name = f"{content['owner_username']}/{content['name']}"
             version = str(content["bundle_id"])
             try:
@@ -1127,6 +2166,85 @@ class BoardRsConnect(BaseBoard):
 
         return res
 
+    @ExtendMethodDoc
+    def pin_versions(
+        self,
+        name: str,
+        as_df: bool = True,
+        prefetch_meta: bool = False,
+        max_workers: int | None = None,
+    ):
+        """Return available versions of a pin.
+
+        Extends parent method in the following ways:
+
+        * Each version includes the created time, size, and whether it is the
+          active bundle. These come from the same bundle listing as the versions.
+        * Adds a prefetch_meta argument. If True, the metadata for every version is
+          fetched concurrently, using up to max_workers threads, so that each
+          version also includes its hash. Bundles never change, so this metadata is
+          cached, and later calls to pin_meta for these versions do not contact the
+          server.
+        """
+
+        if self._is_offline():
+            # only the version names are in the cache, not the bundle details
+            return super().pin_versions(name, as_df)
+
+        pin_name = self.path_to_pin(name)
+
+        with span("pin_versions", pin=name):
+            content = self._get_content_or_none(pin_name)
+            if content is None:
+                raise PinsError(f"Cannot check version, since pin {name} does not exist")
+
+            bundles = self.fs.api.get_content_bundles(content["guid"])
+
+        if prefetch_meta:
+            self._prefetch_bundle_metas(
+                pin_name, content["guid"], [b.get_id() for b in bundles], max_workers
+            )
+
+        all_versions = []
+        for bundle in bundles:
+            bundle_id = str(bundle.get_id())
+            meta = meta_cache.get(self._meta_cache_key(pin_name, bundle_id))
+            all_versions.append(
+                VersionBundle(
+                    bundle_id,
+                    created=VersionBundle.parse_created(bundle.get("created_time")),
+                    size=bundle.get("size"),
+                    active=bundle.get("active"),
+                    hash=meta.pin_hash if meta is not None else None,
+                )
+            )
+
+        sorted_versions = self.sort_pin_versions(all_versions)
+
+        if as_df:
+            import pandas as pd
+
+            return pd.DataFrame([v.to_dict() for v in sorted_versions])
+
+        return sorted_versions
+
+    def _pin_version_names(self, name: str, check_exists: bool = True) -> list[str]:
+        if self._is_offline():
+            return self._cached_version_names(name)
+
+        pin_name = self.path_to_pin(name)
+
+        with span("pin_versions", pin=name):
+            content = self._get_content_or_none(pin_name)
+            if content is None:
+                raise PinsError(f"Cannot check version, since pin {name} does not exist")
+
+            bundles = self.fs.api.get_content_bundles(content["guid"])
+
+        versions = self.sort_pin_versions([VersionRaw(str(b.get_id())) for b in bundles])
+
+        return [v.version for v in versions]
+
     @ExtendMethodDoc
     def pin_version_delete(self, *args, **kwargs):
         from pins.rsconnect.api import RsConnectApiRequestError
@@ -1150,13 +2268,22 @@ class BoardRsConnect(BaseBoard):
 
     @contextlib.contextmanager
     def _open_pin_meta(self, path):
-        with self.fs.open(path) as f:
+        with self._traced_open(path) as f:
             self._touch_cache(path)
 
             # optional additional data to put in Meta.local
             user_name, content_name, bundle_id = str(path).split("/")[:3]
-            user_guid = self.fs._user_name_cache[user_name]
-            content_guid = self.fs._content_name_cache[(user_guid, content_name)]
+            if self._is_offline():
+                # looking up the content item needs the server
+                yield f, {"version": bundle_id}
+                return
+
+            try:
+                user_guid = self.fs._user_name_cache[user_name]
+                content_guid = self.fs._content_name_cache[(user_guid, content_name)]
+            except KeyError:
+                # e.g. the file was in the local cache, so no lookups were needed
+                content_guid = self.fs.info(f"{user_name}/{content_name}")["guid"]
 
             local = {
                 "content_id": content_guid,
@@ -1166,6 +2293,73 @@ class BoardRsConnect(BaseBoard):
 
             yield f, local
 
+    def _get_content_or_none(self, pin_name: str):
+        from pins.rsconnect.api import RsConnectApiMissingContentError
+
+        try:
+            return self.fs.info(pin_name)
+        except RsConnectApiMissingContentError:
+            return None
+
+    def _read_content_meta(self, pin_name: str, content) -> Meta:
+        """Read the metadata of the active version of a content item."""
+
+        return self._read_bundle_meta(pin_name, content["guid"], content["bundle_id"])
+
+    def _read_bundle_meta(self, pin_name: str, content_guid: str, bundle_id) -> Meta:
+        """Read the metadata of a bundle, using previously fetched results."""
+
+        from io import BytesIO
+
+        bundle_id = str(bundle_id)
+        key = self._meta_cache_key(pin_name, bundle_id)
+
+        meta = meta_cache.get(key)
+        if meta is not None:
+            return meta
+
+        meta_name = self.meta_factory.get_meta_name()
+
+        f = BytesIO()
+        self.fs.api.misc_get_content_bundle_file(content_guid, bundle_id, meta_name, f)
+        f.seek(0)
+
+        local = {
+            "content_id": content_guid,
+            "version": bundle_id,
+            "url": f"{self.fs.api.server_url}/content/{content_guid}/",
+        }
+        meta = self.meta_factory.read_pin_yaml(
+            f, pin_name, VersionRaw(bundle_id), local=local
+        )
+
+        meta_cache.set(key, meta)
+        return meta
+
+    def _prefetch_bundle_metas(
+        self, pin_name: str, content_guid: str, bundle_ids, max_workers=None
+    ) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        missing = [
+            bundle_id
+            for bundle_id in map(str, bundle_ids)
+            if meta_cache.get(self._meta_cache_key(pin_name, bundle_id)) is None
+        ]
+        if not missing:
+            return
+
+        with ThreadPoolExecutor(max_workers) as pool:
+            # consume the results, so errors are raised
+            list(
+                pool.map(
+                    lambda bundle_id: self._read_bundle_meta(
+                        pin_name, content_guid, bundle_id
+                    ),
+                    missing,
+                )
+            )
+
     def validate_pin_name(self, name) -> None:
         # this should be the default behavior, expecting a full pin name.
         # but because the tests use short names, we allow it to be disabled via config
@@ -1204,9 +2398,23 @@ class BoardRsConnect(BaseBoard):
         # to fs.put to the <user>/<content_name>.
         return self.path_to_pin(name)
 
+    def _use_latest_marker(self) -> bool:
+        # each content item has an active bundle, so no marker file is needed
+        return False
+
+    @functools.cached_property
+    def _meta_cache_board(self) -> str:
+        # the board path is unused, so use the server to tell boards apart
+        return prefix_cache("rsc", self.fs.api.server_url)
+
     @functools.cached_property
     def user_name(self):
-        return self.fs.api.get_user()["username"]
+        user = self.fs.api.get_user()
+
+        # saves looking up our own user, when fetching our content by name
+        self.fs._user_name_cache[user["username"]] = user["guid"]
+
+        return user["username"]
 
     def prepare_pin_version(self, pin_dir_path, x, name: str | None, *args, **kwargs):
         # RSC pin names can have form <user_name>/<name>, but this will try to
@@ -1262,3 +2470,447 @@ class BoardRsConnect(BaseBoard):
         (Path(pin_dir_path) / "index.html").write_text(rendered)
 
         return meta
+
+
+class RsConnectDeployment:
+    """A pin version being deployed to Posit Connect.
+
+    This is returned by BoardRsConnect.pin_write when called with `deploy=False`.
+    It can be waited on with its .wait() method, or awaited inside a coroutine.
+
+    If a deployment is dropped before it finishes (e.g. it is never waited on), it
+    is waited on for up to timeout seconds in a background thread instead, so
+    on_finish still runs. Python does not wait for this thread before exiting.
+
+    Parameters
+    ----------
+    board:
+        The board the pin was written to.
+    task_id:
+        The id of the deployment task. If None, there is nothing to deploy.
+    meta:
+        Metadata for the pin version being deployed.
+    on_finish:
+        An optional function called once, after the deployment succeeds.
+    timeout:
+        Seconds to wait for a dropped deployment to finish. Defaults to waiting
+        forever.
+    """
+
+    def __init__(
+        self,
+        board: BoardRsConnect,
+        task_id: str | None,
+        meta: Meta,
+        on_finish: Callable[[], None] | None = None,
+        timeout: float | None = None,
+    ):
+        self.board = board
+        self.task_id = task_id
+        self.meta = meta
+
+        self._on_finish = on_finish
+        self._task = None
+        self._last = None
+
+        # note that the finalizer must not refer to this object, or it is never
+        # garbage collected
+        if task_id is not None:
+            self._finalizer = weakref.finalize(
+                self, _finish_dropped_deployment, board, task_id, on_finish, timeout
+            )
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(task_id={self.task_id!r}, done={self.done()})"
+
+    def __await__(self):
+        import asyncio
+
+        return asyncio.to_thread(self.wait).__await__()
+
+    def done(self) -> bool:
+        """Return whether the deployment has finished, without blocking."""
+
+        if self.task_id is None or self._task is not None:
+            return True
+
+        task = self.board.fs.api.get_tasks(self.task_id, self._last, wait=0)
+        self._last = task["last"]
+        if task["finished"]:
+            self._finish(task)
+
+        return task["finished"]
+
+    def wait(
+        self,
+        timeout: float | None = None,
+        on_output: Callable[[str], None] | None = None,
+    ) -> Meta:
+        """Block until the deployment finishes, and return the pin metadata.
+
+        Parameters
+        ----------
+        timeout:
+            Seconds to wait before raising an error. Defaults to waiting forever.
+        on_output:
+            A function called on each line of deployment output, as it arrives.
+        """
+
+        if self.task_id is None:
+            return self.meta
+
+        if self._task is None:
+            task = self.board.fs.api.poll_tasks(
+                self.task_id, self._last, timeout=timeout, on_output=on_output
+            )
+            self._finish(task)
+        else:
+            # a failed deployment raises every time it is waited on
+            self._check_task()
+
+        return self.meta
+
+    def _finish(self, task):
+        self._task = task
+        self._finalizer.detach()
+        self._check_task()
+
+        if self._on_finish is not None:
+            self._on_finish()
+
+    def _check_task(self):
+        from pins.rsconnect.api import RsConnectApiError
+
+        if self._task["code"] != 0:
+            raise RsConnectApiError(f"deployment failed for task: {self._task}")
+
+
+def _finish_dropped_deployment(board, task_id, on_finish, timeout):
+    """Wait for a deployment nothing is waiting on, then run its on_finish."""
+
+    import threading
+
+    def _wait():
+        try:
+            task = board.fs.api.poll_tasks(task_id, timeout=timeout)
+            if task["code"] != 0:
+                _log.warning(f"Deployment failed for task: {task}")
+            elif on_finish is not None:
+                on_finish()
+        except Exception as e:
+            _log.warning(f"Finishing deployment for task {task_id} failed: {e!r}")
+
+    try:
+        threading.Thread(target=_wait, name=f"pins-deploy-{task_id}", daemon=True).start()
+    except RuntimeError:
+        # threads cannot be started while the interpreter shuts down
+        _wait()
+
+
+class AsyncBoard:
+    """Coroutine versions of a board's methods.
+
+    Because the methods are coroutines, many pins can be read or written at once,
+    e.g. using asyncio.gather. This is usually accessed through a board's .aio
+    attribute.
+
+    For boards on an fsspec AsyncFileSystem (e.g. s3, gcs, azure, http), requests
+    use the filesystem's coroutine methods directly. These requests go to the
+    filesystem itself, so they do not use the board's local cache. Other boards run
+    their usual methods in a thread.
+
+    Parameters
+    ----------
+    board:
+        The board whose methods are wrapped.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> import pins
+    >>> board = pins.board_temp()
+    >>> meta = board.pin_write([1, 2], "a", type="json")
+    >>> meta = board.pin_write([3], "b", type="json")
+    >>> async def read_pins(board):
+    ...     return await asyncio.gather(board.aio.pin_read("a"), board.aio.pin_read("b"))
+    >>> asyncio.run(read_pins(board))
+    [[1, 2], [3]]
+    """
+
+    def __init__(self, board: BaseBoard):
+        self.board = board
+
+    @property
+    def fs(self):
+        return self.board._uncached_fs
+
+    @property
+    def is_native(self) -> bool:
+        """Whether requests use the filesystem's coroutine methods."""
+        from fsspec.asyn import AsyncFileSystem
+
+        # these boards customize how pins are found, so use their own methods
+        custom_board = isinstance(self.board, (BoardManual, BoardRsConnect))
+
+        # offline boards read from their cache, which coroutine methods skip
+        if custom_board or self.board._is_offline():
+            return False
+
+        return isinstance(self.fs, AsyncFileSystem)
+
+    async def _call(self, method: str, *args, **kwargs):
+        import asyncio
+
+        coro = getattr(self.fs, method)(*args, **kwargs)
+        if self.fs.asynchronous:
+            return await coro
+
+        # the filesystem runs on its own event loop, in another thread
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coro, self.fs.loop)
+        )
+
+    async def _to_thread(self, method: str, *args, **kwargs):
+        import asyncio
+
+        return await asyncio.to_thread(getattr(self.board, method), *args, **kwargs)
+
+    async def pin_exists(self, name: str) -> bool:
+        """Determine if a pin exists. See BaseBoard.pin_exists."""
+
+        if not self.is_native:
+            return await self._to_thread("pin_exists", name)
+
+        board = self.board
+        return await self._call(
+            "_exists", board.construct_path([board.path_to_pin(name)])
+        )
+
+    async def pin_list(self) -> list[str]:
+        """List names of all pins in a board. See BaseBoard.pin_list."""
+
+        if not self.is_native:
+            return await self._to_thread("pin_list")
+
+        full_paths = await self._call("_ls", self.board.board, detail=False)
+        return self.board._pin_names_from_paths(full_paths)
+
+    async def _pin_version_names(self, name: str) -> list[str]:
+        board = self.board
+
+        if not await self.pin_exists(name):
+            raise PinsError(f"Cannot check version, since pin {name} does not exist")
+
+        versions_raw = await self._call(
+            "_ls", board.construct_path([board.path_to_pin(name)]), detail=False
+        )
+        return board._sort_version_paths(versions_raw)
+
+    async def pin_versions(self, name: str, as_df: bool = True):
+        """Return available versions of a pin. See BaseBoard.pin_versions."""
+
+        if not self.is_native:
+            return await self._to_thread("pin_versions", name, as_df=as_df)
+
+        names = await self._pin_version_names(name)
+        sorted_versions = [guess_version(v) for v in names]
+
+        if as_df:
+            import pandas as pd
+
+            return pd.DataFrame([v.to_dict() for v in sorted_versions])
+
+        return sorted_versions
+
+    async def _resolve_latest_version(self, name: str):
+        board = self.board
+        pin_name = board.path_to_pin(name)
+
+        version = board._get_cached_latest(pin_name)
+        if version is None:
+            if board._use_latest_marker():
+                path_marker = board.construct_path([pin_name, board.latest_marker_name])
+                try:
+                    data = await self._call("_cat_file", path_marker)
+                    version = data.decode().strip()
+                except FileNotFoundError:
+                    pass
+
+            if version is None:
+                versions = await self._pin_version_names(name)
+                version = board._last_version_name(versions)
+
+            board._set_cached_latest(pin_name, version)
+
+        return guess_version(version)
+
+    async def pin_meta(self, name, version: str | None = None) -> Meta:
+        """Return metadata about a pin. See BaseBoard.pin_meta."""
+
+        from io import BytesIO
+
+        if not self.is_native:
+            return await self._to_thread("pin_meta", name, version)
+
+        board = self.board
+        pin_name = board.path_to_pin(name)
+
+        if version is not None:
+            meta = meta_cache.get(board._meta_cache_key(pin_name, version))
+            if meta is not None:
+                return meta
+
+            if not await self._call("_exists", board.construct_path([pin_name, version])):
+                raise PinsError(
+                    f"Pin {name} either does not exist, or is missing version: {version}."
+                )
+
+            selected_version = guess_version(version)
+        else:
+            selected_version = await self._resolve_latest_version(name)
+
+            meta = meta_cache.get(
+                board._meta_cache_key(pin_name, selected_version.version)
+            )
+            if meta is not None:
+                return meta
+
+        path_meta = board._path_to_meta(pin_name, selected_version.version)
+        f = BytesIO(await self._call("_cat_file", path_meta))
+        meta = board.meta_factory.read_pin_yaml(f, pin_name, selected_version, local={})
+
+        meta_cache.set(board._meta_cache_key(pin_name, selected_version.version), meta)
+
+        return meta
+
+    async def pin_read(self, name, version: str | None = None, hash: str | None = None):
+        """Return the data stored in a pin. See BaseBoard.pin_read."""
+
+        import asyncio
+        from io import BytesIO
+
+        if not self.is_native:
+            return await self._to_thread("pin_read", name, version, hash)
+
+        board = self.board
+        meta = await self.pin_meta(name, version)
+
+        if isinstance(meta, MetaRaw):
+            raise TypeError(
+                "Could not find metadata for this pin version. If this is an individual "
+                "file, may need to use pin_download()."
+            )
+
+        check_pickle_read(meta, board.allow_pickle_read)
+
+        path_version = board.construct_path(
+            [board.path_to_pin(name), meta.version.version]
+        )
+        path_file = load_path(meta.file, path_version, meta.type)
+        f = BytesIO(await self._call("_cat_file", path_file))
+
+        if hash is not None or get_verify_hash(board.verify_hash):
+            _verify_pin_file(name, meta.pin_hash, f, hash)
+
+        # parsing may be slow, so avoid blocking the event loop
+        return await asyncio.to_thread(read_data, meta, f)
+
+    async def pin_write(
+        self,
+        x,
+        name: str | None = None,
+        type: str | None = None,
+        title: str | None = None,
+        description: str | None = None,
+        metadata: Mapping | None = None,
+        versioned: bool | None = None,
+        created: datetime | None = None,
+        *,
+        force_identical_write: bool = False,
+    ) -> Meta:
+        """Write a pin object to the board. See BaseBoard.pin_write."""
+
+        import asyncio
+
+        if not self.is_native:
+            return await self._to_thread(
+                "pin_write",
+                x,
+                name,
+                type,
+                title,
+                description,
+                metadata,
+                versioned,
+                created,
+                force_identical_write=force_identical_write,
+            )
+
+        if type == "file":
+            raise NotImplementedError(
+                ".pin_write() does not support type='file'. "
+                "Use .pin_upload() to save a file as a pin."
+            )
+
+        board = self.board
+        pin_name = board.path_to_pin(name)
+
+        # reading the last version and saving data are synchronous, and shared with
+        # the board's pin_write, so run them in a thread
+        last_meta = await asyncio.to_thread(
+            board._last_meta_for_write, name, force_identical_write
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            meta = await asyncio.to_thread(
+                board._stage_pin_version,
+                tmp_dir,
+                x,
+                name,
+                type,
+                title,
+                description,
+                metadata,
+                versioned,
+                created,
+                last_meta=last_meta,
+            )
+            if meta is None:
+                return last_meta
+
+            dst_pin_path = board.construct_path([pin_name])
+            dst_version = meta.version.version
+            dst_version_path = board.path_to_deploy_version(name, dst_version)
+
+            if not await self._call("_exists", dst_pin_path):
+                try:
+                    await self._call("_mkdir", dst_pin_path)
+                except FileExistsError:
+                    pass
+
+            if await self._call("_exists", dst_version_path):
+                raise PinsError(
+                    f"Attempting to write pin version to {dst_version_path}, "
+                    "but that directory already exists."
+                )
+
+            inform(_log, f"Writing pin:\nName: {repr(pin_name)}\nVersion: {dst_version}")
+
+            await self._call("_put", tmp_dir, dst_version_path, recursive=True)
+
+        await asyncio.to_thread(board._update_latest, name, pin_name)
+
+        return meta
+
+    async def pin_search(self, search=None, as_df=True):
+        """Search for pins. See BaseBoard.pin_search."""
+
+        import asyncio
+
+        if not self.is_native:
+            return await self._to_thread("pin_search", search, as_df)
+
+        names = await self.pin_list()
+        metas = await asyncio.gather(*[self.pin_meta(name) for name in names])
+
+        return self.board._search_metas(list(metas), search, as_df)
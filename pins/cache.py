@@ -1,18 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import copy
 import logging
 import os
 import shutil
+import threading
 import time
 import urllib.parse
-from collections.abc import Iterator
+import weakref
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator, Sequence
 from pathlib import Path
 
-import humanize
 from fsspec import register_implementation
 from fsspec.implementations.cached import SimpleCacheFileSystem
 
-from .config import get_cache_dir
+from .config import (
+    get_cache_dedup,
+    get_cache_dir,
+    get_cache_stats_persist,
+    get_offline,
+    get_url_max_age,
+)
+from .errors import PinsError
 from .utils import hash_name, inform
 
 _log = logging.getLogger(__name__)
@@ -22,6 +34,18 @@ _log = logging.getLogger(__name__)
 PLACEHOLDER_VERSION = "v"
 PLACEHOLDER_FILE = "file"
 
+# name of the file cache statistics are saved to, in a board's cache directory
+CACHE_STATS_FILE = "pins_cache_stats.json"
+
+# name of the directory deduplicated files are stored in, in the cache root
+BLOB_DIR = "pins_blobs"
+
+# files stored next to a cached file, named like .{name}.{suffix}
+SIDECAR_SUFFIXES = ("pins-xxh64", "pins-http")
+
+# block size used when hashing cached files
+HASH_BLOCK_SIZE = 2**20
+
 
 def touch_access_time(path, access_time: float | None = None, strict=True):
     """Update access time of file.
@@ -43,6 +67,392 @@ def touch_access_time(path, access_time: float | None = None, strict=True):
     return access_time
 
 
+@contextlib.contextmanager
+def file_lock(path: str, remove: bool = False) -> Iterator[None]:
+    """Hold an exclusive lock on a file, which other processes wait for.
+
+    The lock is released when the with block exits, or if the process dies. It is
+    also held per open file, so it works between threads of one process. If remove
+    is True, the lock file is deleted before the lock is released, so lock files do
+    not build up.
+    """
+
+    while True:
+        with open(path, "a+b") as f:
+            _lock_file(f)
+            if not _is_open_file(f, path):
+                # the last holder removed the file while we waited, so locking it
+                # does not exclude anyone opening the path now. Try again.
+                _unlock_file(f)
+                continue
+
+            try:
+                yield
+            finally:
+                if remove:
+                    # open files cannot be removed on windows, so they are left
+                    with contextlib.suppress(OSError):
+                        os.remove(path)
+                _unlock_file(f)
+
+            return
+
+
+def _is_open_file(f, path: str) -> bool:
+    try:
+        return os.path.samestat(os.fstat(f.fileno()), os.stat(path))
+    except FileNotFoundError:
+        return False
+
+
+def _lock_file(f) -> None:
+    if os.name == "nt":
+        import msvcrt
+
+        # LK_LOCK gives up after 10 seconds, so keep trying
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                break
+            except OSError:
+                pass
+    else:
+        import fcntl
+
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+
+def _unlock_file(f) -> None:
+    if os.name == "nt":
+        import msvcrt
+
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _sibling_path(path: str, suffix: str) -> str:
+    """Return a hidden path next to a cache file, e.g. for its lock file."""
+
+    head, tail = os.path.split(path)
+    return os.path.join(head, f".{tail}.{suffix}")
+
+
+@contextlib.contextmanager
+def cache_fill_lock(lpaths: Sequence[str]) -> Iterator[None]:
+    """Lock cache files while they are downloaded, so only one process fetches them.
+
+    Locks are taken in sorted order, so processes filling overlapping sets of files
+    cannot deadlock. Lock files are removed once the files are filled.
+    """
+
+    with contextlib.ExitStack() as stack:
+        for lpath in sorted(set(lpaths)):
+            Path(lpath).parent.mkdir(parents=True, exist_ok=True)
+            stack.enter_context(file_lock(_sibling_path(lpath, "pins-lock"), remove=True))
+
+        yield
+
+
+def fill_cache(
+    fs, rpaths: Sequence[str], lpaths: Sequence[str], blobs: BlobStore | None = None
+) -> list[str]:
+    """Download files into the cache atomically, skipping any another process has.
+
+    Each file is downloaded to a temporary file next to its cache path, then renamed
+    into place, so a partial file is never read from the cache. While downloading,
+    the files are locked, so that processes filling the same files wait for one
+    download, rather than each doing their own. If blobs is specified, downloaded
+    files are then deduplicated by adding them to it.
+
+    Returns the remote paths that were downloaded.
+    """
+
+    with cache_fill_lock(lpaths):
+        todo = [
+            (r, lpath) for r, lpath in zip(rpaths, lpaths) if not os.path.exists(lpath)
+        ]
+        if not todo:
+            return []
+
+        tmp_paths = [_sibling_path(lpath, f"{os.getpid()}.pins-tmp") for _, lpath in todo]
+        try:
+            if len(todo) == 1:
+                fs.get_file(todo[0][0], tmp_paths[0])
+            else:
+                fs.get([r for r, _ in todo], tmp_paths)
+
+            for (_, lpath), tmp_path in zip(todo, tmp_paths):
+                # hash each file as it is put into the cache, while it is likely
+                # still in memory, so verifying it later does not need to read it.
+                hash_ = _hash_local_file(tmp_path)
+                os.replace(tmp_path, lpath)
+
+                if blobs is not None:
+                    blobs.add(lpath, hash_)
+
+                _write_file_hash(lpath, hash_)
+        finally:
+            for tmp_path in tmp_paths:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(tmp_path)
+
+    return [r for r, _ in todo]
+
+
+def _hash_local_file(path: str) -> str:
+    from .versions import Version
+
+    with open(path, "rb") as f:
+        return Version.hash_file(f, HASH_BLOCK_SIZE)
+
+
+def _write_file_hash(lpath: str, hash: str) -> None:
+    # record the size and modified time, so changes to the file are noticed
+    stat = os.stat(lpath)
+    _write_sidecar(lpath, "pins-xxh64", f"{hash} {stat.st_size} {stat.st_mtime_ns}")
+
+
+def _write_sidecar(lpath: str, suffix: str, content: str) -> None:
+    import tempfile
+
+    # threads may write the same file outside the fill lock, e.g. when a cached
+    # file is hashed, so each writes its own temporary file
+    head, tail = os.path.split(lpath)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{tail}.", suffix=".pins-tmp", dir=head)
+    try:
+        with open(fd, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, _sibling_path(lpath, suffix))
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+
+
+def cached_file_hash(lpath: str) -> str:
+    """Return the xxh64 hash of a cached file.
+
+    Hashes are recorded next to cached files when they are filled, so this only
+    reads the file if it was cached some other way, or has changed since.
+    """
+
+    try:
+        with open(_sibling_path(lpath, "pins-xxh64")) as f:
+            hash_, size, mtime_ns = f.read().split()
+
+        stat = os.stat(lpath)
+        if (int(size), int(mtime_ns)) == (stat.st_size, stat.st_mtime_ns):
+            return hash_
+    except (OSError, ValueError):
+        pass
+
+    hash_ = _hash_local_file(lpath)
+    _write_file_hash(lpath, hash_)
+
+    return hash_
+
+
+def evict_cached_file(
+    lpath: str, blobs: BlobStore | None = None, hash: str | None = None
+) -> None:
+    """Remove a file from the cache, e.g. since it is corrupt.
+
+    If a blob store and the hash the file should have are given, and the file is
+    linked to that blob, the blob is removed too. This stops the corrupt contents
+    being linked back into the cache.
+    """
+
+    with cache_fill_lock([lpath]):
+        if blobs is not None and hash is not None:
+            p_blob = blobs.path(hash)
+            with contextlib.suppress(OSError):
+                if os.path.samefile(p_blob, lpath):
+                    os.remove(p_blob)
+
+        sidecars = [_sibling_path(lpath, suffix) for suffix in SIDECAR_SUFFIXES]
+        for path in [lpath, *sidecars]:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+
+
+def _read_http_validators(lpath: str) -> dict:
+    import json
+
+    try:
+        with open(_sibling_path(lpath, "pins-http")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_http_validators(lpath: str, validators: dict) -> None:
+    import json
+
+    _write_sidecar(lpath, "pins-http", json.dumps(validators))
+
+
+async def _http_get_if_modified(fs, url: str, lpath: str, validators: dict):
+    """Download a url to lpath, unless the server says it matches the validators.
+
+    Returns the new validators, or None if the url was not modified.
+    """
+
+    kwargs = fs.kwargs.copy()
+    headers = kwargs.pop("headers", {}).copy()
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    session = await fs.set_session()
+    async with session.get(fs.encode_url(url), headers=headers, **kwargs) as r:
+        if r.status == 304:
+            return None
+        if r.status == 404:
+            raise FileNotFoundError(url)
+        r.raise_for_status()
+
+        with open(lpath, "wb") as f:
+            async for chunk in r.content.iter_chunked(2**20):
+                f.write(chunk)
+
+        return {
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+        }
+
+
+def revalidate_http_file(fs, rpath: str, lpath: str, max_age: float) -> bool:
+    """Fill the cache with a url, or check a cached url is unchanged.
+
+    The ETag and Last-Modified headers of a url are stored next to its cached file.
+    Once the file was last checked over max_age seconds ago, they are sent in a
+    conditional request, so an unchanged file costs one "304 Not Modified" response,
+    rather than downloading it again.
+
+    If the server cannot be reached, a stale cached file is used, with a warning.
+
+    Returns whether the url was downloaded.
+    """
+
+    from aiohttp import ClientError
+    from fsspec.asyn import sync
+
+    with cache_fill_lock([lpath]):
+        validators = _read_http_validators(lpath) if os.path.exists(lpath) else {}
+        if validators and time.time() - validators["checked"] < max_age:
+            return False
+
+        tmp_path = _sibling_path(lpath, f"{os.getpid()}.pins-tmp")
+        try:
+            new = sync(fs.loop, _http_get_if_modified, fs, rpath, tmp_path, validators)
+        except FileNotFoundError:
+            raise
+        except (ClientError, OSError, asyncio.TimeoutError) as e:
+            if not validators:
+                raise
+
+            # not marked as checked, so the next read tries the server again
+            _log.warning(
+                f"Using stale cached copy of {rpath}, as checking it failed: {e!r}"
+            )
+            return False
+        else:
+            if new is not None:
+                os.replace(tmp_path, lpath)
+                validators = new
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+
+        _write_http_validators(lpath, {**validators, "checked": time.time()})
+
+    return new is not None
+
+
+class BlobStore:
+    """A directory of files, named by the xxh64 hash of their contents.
+
+    Cached files with the same contents are hard links to a single file in the
+    store, so they only use disk space once. The number of links to a blob is its
+    reference count, so blobs no cached file links to can be pruned.
+
+    Parameters
+    ----------
+    root:
+        The directory blobs are stored in.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = str(root)
+
+    def path(self, hash: str) -> str:
+        return os.path.join(self.root, hash)
+
+    def add(self, lpath: str, hash: str | None = None) -> str | None:
+        """Add a cached file's contents, replacing the file with a link to them.
+
+        Returns the hash of the contents, or None if the file could not be linked
+        (e.g. since the filesystem does not support hard links). If the hash is
+        already known, it may be passed in, to avoid reading the file.
+        """
+
+        hash_ = _hash_local_file(lpath) if hash is None else hash
+
+        Path(self.root).mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(lpath, self.path(hash_))
+        except FileExistsError:
+            # the contents are already stored, so only keep one copy of them
+            if not self.link(hash_, lpath):
+                return None
+        except OSError as e:
+            _log.info(f"Could not add {lpath} to the cache blob store: {e!r}")
+            return None
+
+        return hash_
+
+    def link(self, hash: str, lpath: str) -> bool:
+        """Make a cache path a link to a blob, and return whether it was linked."""
+
+        tmp_path = _sibling_path(lpath, f"{os.getpid()}.pins-tmp")
+        try:
+            os.link(self.path(hash), tmp_path)
+        except OSError:
+            # e.g. there is no blob with this hash
+            return False
+
+        os.replace(tmp_path, lpath)
+        return True
+
+    def refcount(self, hash: str) -> int:
+        """Return the number of cached files that link to a blob."""
+
+        try:
+            return os.stat(self.path(hash)).st_nlink - 1
+        except FileNotFoundError:
+            return 0
+
+    def prune(self) -> list[str]:
+        """Delete the blobs no cached file links to, and return their hashes."""
+
+        if not os.path.isdir(self.root):
+            return []
+
+        pruned = []
+        for entry in os.scandir(self.root):
+            if entry.is_file() and entry.stat().st_nlink <= 1:
+                os.remove(entry.path)
+                pruned.append(entry.name)
+
+        return pruned
+
+
 def protocol_to_string(protocol):
     if isinstance(protocol, str):
         return protocol
@@ -106,25 +516,242 @@ class PinsRscCacheMapper:
         return _hash
 
 
+class CacheStats:
+    """Counts of cache hits and misses, and bytes read, in total and per pin.
+
+    A hit is a file read from the cache directory, and a miss is a file fetched
+    from the board (e.g. when first reading it, or by pin_read_many).
+
+    Parameters
+    ----------
+    path:
+        An optional json file. If specified, counts are loaded from it, and the
+        save method adds the counts recorded since to it.
+    """
+
+    fields = ("hits", "misses", "bytes_fetched", "bytes_served")
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+
+        self._pins: dict[str, dict[str, int]] = {}
+        # the counts last loaded from, or saved to, the json file
+        self._saved: dict[str, dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+        if path is not None:
+            self.load()
+
+    def record(self, pin: str, hit: bool, nbytes: int | None = None) -> None:
+        with self._lock:
+            entry = self._pins.get(pin)
+            if entry is None:
+                entry = self._pins[pin] = dict.fromkeys(self.fields, 0)
+
+            if hit:
+                entry["hits"] += 1
+                entry["bytes_served"] += nbytes or 0
+            else:
+                entry["misses"] += 1
+                entry["bytes_fetched"] += nbytes or 0
+
+    def to_dict(self) -> dict:
+        """Return the total counts, with a "pins" entry holding counts per pin."""
+
+        with self._lock:
+            pins = {name: dict(entry) for name, entry in self._pins.items()}
+
+        totals = {k: sum(entry[k] for entry in pins.values()) for k in self.fields}
+        return {**totals, "pins": pins}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._pins.clear()
+
+            if self.path is not None:
+                with file_lock(_sibling_path(self.path, "pins-lock"), remove=True):
+                    self._write({})
+                self._saved = {}
+
+    def load(self) -> None:
+        pins = self._read()
+
+        with self._lock:
+            self._pins = pins
+            self._saved = copy.deepcopy(pins)
+
+    def save(self) -> None:
+        """Add the counts recorded since the last load or save to the json file.
+
+        The file is locked while it is updated, so processes (or caches) sharing a
+        file each add their own counts.
+        """
+
+        if self.path is None:
+            raise ValueError("Cannot save cache statistics without a path.")
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, file_lock(_sibling_path(self.path, "pins-lock"), remove=True):
+            pins = self._read()
+            for name, entry in self._pins.items():
+                saved = self._saved.get(name, {})
+                merged = pins.setdefault(name, dict.fromkeys(self.fields, 0))
+                for k in self.fields:
+                    merged[k] += entry[k] - saved.get(k, 0)
+
+            self._write(pins)
+            self._pins = pins
+            self._saved = copy.deepcopy(pins)
+
+    def _read(self) -> dict[str, dict[str, int]]:
+        import json
+
+        try:
+            with open(self.path) as f:
+                pins = json.load(f)["pins"]
+
+            return {
+                name: {k: int(entry.get(k, 0)) for k in self.fields}
+                for name, entry in pins.items()
+            }
+        except FileNotFoundError:
+            return {}
+        except (ValueError, KeyError, TypeError, AttributeError):
+            _log.warning(f"Ignoring unreadable cache statistics file: {self.path}")
+            return {}
+
+    def _write(self, pins: dict[str, dict[str, int]]) -> None:
+        import json
+        import tempfile
+
+        totals = {k: sum(entry[k] for entry in pins.values()) for k in self.fields}
+
+        # write to a temporary file first, so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=Path(self.path).parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({**totals, "pins": pins}, f)
+        os.replace(tmp_path, self.path)
+
+
+# statistics saved when the process exits. This is a weak set, so that caches which
+# are no longer used can be garbage collected.
+_stats_to_save: weakref.WeakSet[CacheStats] = weakref.WeakSet()
+
+
+def _save_cache_stats() -> None:
+    for stats in list(_stats_to_save):
+        try:
+            stats.save()
+        except Exception as e:
+            _log.warning(f"Could not save cache statistics to {stats.path}: {e!r}")
+
+
+def save_stats_at_exit(stats: CacheStats) -> None:
+    """Save statistics when the process exits, using one handler for all of them."""
+
+    import atexit
+
+    # unregistering first means the handler is only ever registered once
+    atexit.unregister(_save_cache_stats)
+    atexit.register(_save_cache_stats)
+
+    _stats_to_save.add(stats)
+
+
+# blob stores used by caches in this process, so cache_prune finds custom ones
+_blob_roots: set[str] = set()
+
+
+def _is_relative_to(path: str, root: str) -> bool:
+    return os.path.commonpath([path, root]) == root
+
+
 class PinsCache(SimpleCacheFileSystem):
+    """A cache of board files, which records hits and misses.
+
+    Parameters
+    ----------
+    hash_prefix:
+        The board path. Files are cached using their path relative to it.
+    mapper:
+        A class that maps board paths to paths in the cache directory.
+    persist_stats:
+        Whether to load and save cache statistics in the cache directory. Statistics
+        are saved when the process exits. Defaults to the PINS_CACHE_STATS
+        environment variable, or False.
+    dedup:
+        Whether to store identical files once, in a BlobStore shared by every board
+        in the cache root. Pin data whose hash matches a stored file is then linked
+        to it, rather than downloaded. Defaults to the PINS_CACHE_DEDUP environment
+        variable, or False.
+    blob_storage:
+        The directory of the BlobStore. Defaults to a directory named pins_blobs,
+        next to the cache directory.
+    **kwargs:
+        Passed to fsspec's SimpleCacheFileSystem.
+    """
+
     protocol = "pinscache"
 
-    def __init__(self, *args, hash_prefix=None, mapper=HashMapper, **kwargs):
+    def __init__(
+        self,
+        *args,
+        hash_prefix=None,
+        mapper=HashMapper,
+        persist_stats=None,
+        dedup=None,
+        blob_storage=None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.hash_prefix = hash_prefix
         self._mapper = mapper(hash_prefix)
 
+        if get_cache_dedup(dedup):
+            if blob_storage is None:
+                cache_root = os.path.dirname(os.path.abspath(self.storage[-1]))
+                blob_storage = os.path.join(cache_root, BLOB_DIR)
+
+            self.blobs = BlobStore(blob_storage)
+            _blob_roots.add(os.path.abspath(blob_storage))
+        else:
+            self.blobs = None
+
+        if get_cache_stats_persist(persist_stats):
+            self.stats = CacheStats(os.path.join(self.storage[-1], CACHE_STATS_FILE))
+            save_stats_at_exit(self.stats)
+        else:
+            self.stats = CacheStats()
+
     def hash_name(self, path, *args, **kwargs):
         return self._mapper(path)
 
-    def _open(self, path, *args, **kwargs):
+    def _open(self, path, mode="rb", **kwargs):
         # For some reason, the open method of SimpleCacheFileSystem doesn't
         # call _make_local_details, so we need to patch in here.
         # Note that methods like .cat() do call it. Other Caches don't have this issue.
         path = self._strip_protocol(path)
-        self._make_local_details(path)
 
-        return super()._open(path, *args, **kwargs)
+        if "r" not in mode:
+            self._make_local_details(path)
+            return super()._open(path, mode, **kwargs)
+
+        # only make local details on a miss, since they include file info from
+        # the wrapped filesystem (i.e. a request to the board).
+        fn = self._check_file(path)
+        hit = fn is not None
+        if not hit:
+            # fetch the file here, so the parent method only opens the cached copy
+            # (otherwise it fetches it, then calls this method again to open it).
+            fn = self._make_local_details(path)
+
+            # another process may have fetched it while this one waited
+            hit = not fill_cache(self.fs, [path], [fn], self.blobs)
+            self._cache_size = None
+
+        self.stats.record(stats_key(self, path), hit, os.path.getsize(fn))
+
+        return super()._open(path, mode, **kwargs)
 
     def _make_local_details(self, path):
         # modifies method to create any parent directories needed by the cached file
@@ -146,6 +773,30 @@ class PinsCache(SimpleCacheFileSystem):
                 return fn
 
 
+def cache_path(cache: PinsCache, path: str) -> str:
+    """Return the path a file is (or would be) cached at, without fetching it."""
+
+    path = cache._strip_protocol(path)
+    return os.path.join(cache.storage[-1], cache._mapper(path))
+
+
+def stats_key(cache: PinsCache, path: str) -> str:
+    """Return the name cache statistics for a file are recorded under (its pin).
+
+    Note that this is a function, since PinsCache sends most attribute lookups to
+    the filesystem it wraps.
+    """
+
+    # the first directory in the cache holds all the versions of a pin
+    key = Path(cache.hash_name(cache._strip_protocol(path), True)).parts[0]
+
+    if isinstance(cache._mapper, PinsRscCacheMapper):
+        # undo the mapper turning <user>/<content> into <user>+<content>
+        return key.replace("+", "/", 1)
+
+    return key
+
+
 class PinsUrlCache(PinsCache):
     protocol = "pinsurlcache"
 
@@ -176,19 +827,70 @@ class PinsUrlCache(PinsCache):
 
 
 class PinsAccessTimeCache(SimpleCacheFileSystem):
+    """A cache of files, which records when each file was last read.
+
+    Parameters
+    ----------
+    hash_prefix:
+        Passed to the mapper.
+    mapper:
+        A class that maps paths to paths in the cache directory.
+    max_age:
+        When wrapping an http filesystem, the number of seconds before a cached url
+        is checked for changes, using the ETag and Last-Modified headers of the
+        response it was cached from. Defaults to the PINS_URL_MAX_AGE environment
+        variable. If neither is set, cached urls are never checked.
+    offline:
+        Whether to only read files already in the cache, without contacting the
+        wrapped filesystem. Defaults to the PINS_OFFLINE environment variable.
+    **kwargs:
+        Passed to fsspec's SimpleCacheFileSystem.
+    """
+
     name = "pinsaccesstimecache"
 
     def __init__(
-        self, *args, hash_prefix=None, mapper=PinsAccessTimeCacheMapper, **kwargs
+        self,
+        *args,
+        hash_prefix=None,
+        mapper=PinsAccessTimeCacheMapper,
+        max_age=None,
+        offline=None,
+        **kwargs,
     ):
         super().__init__(*args, **kwargs)
         self.hash_prefix = hash_prefix
         self._mapper = mapper(hash_prefix)
+        self.offline = offline
+
+        max_age = get_url_max_age(max_age)
+        if max_age is not None:
+            from fsspec.implementations.http import HTTPFileSystem
+
+            if not isinstance(self.fs, HTTPFileSystem):
+                max_age = None
+
+        self.max_age = max_age
 
     def hash_name(self, path, *args, **kwargs):
         return self._mapper(path)
 
     def _open(self, path, mode="rb", **kwargs):
+        path = self._strip_protocol(path)
+        lpath = os.path.join(self.storage[-1], self._mapper(path))
+        if "r" in mode and get_offline(self.offline):
+            if self._check_file(path) is None:
+                raise PinsError(
+                    f"File {path} is not in the local cache, so cannot be read while "
+                    "offline."
+                )
+        elif "r" in mode and self.max_age is not None:
+            revalidate_http_file(self.fs, path, lpath, self.max_age)
+        elif "r" in mode and self._check_file(path) is None:
+            # fill the cache here, since the parent method writes directly to the
+            # cache path, which other processes could read partway through.
+            fill_cache(self.fs, [path], [lpath])
+
         f = super()._open(path, mode=mode, **kwargs)
         fn = self._check_file(path)
 
@@ -209,6 +911,107 @@ class PinsAccessTimeCache(SimpleCacheFileSystem):
                 return fn
 
 
+class MetaCache:
+    """An in-process, least recently used cache of pin metadata.
+
+    Pin versions do not change once written, so their metadata can be reused until
+    the version is deleted. Keys are (board, pin name, version) tuples, and
+    copies of the metadata are stored and returned, so callers may modify them.
+
+    Parameters
+    ----------
+    maxsize:
+        The maximum number of entries to keep. Set to 0 to disable caching.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable):
+        with self._lock:
+            try:
+                meta = self._entries[key]
+            except KeyError:
+                return None
+
+            self._entries.move_to_end(key)
+
+        return copy.deepcopy(meta)
+
+    def set(self, key: Hashable, meta) -> None:
+        if self.maxsize <= 0:
+            return
+
+        meta = copy.deepcopy(meta)
+        with self._lock:
+            self._entries[key] = meta
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def evict(self, board: str, pin_name: str, version: str | None = None) -> None:
+        """Remove a pin version, or every version of a pin if version is None."""
+
+        with self._lock:
+            for key in list(self._entries):
+                if key[:2] == (board, pin_name) and version in (None, key[2]):
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class LatestVersionCache:
+    """An in-process record of the latest version of pins.
+
+    Unlike versions, which never change, the latest version of a pin changes
+    whenever it is written to. So entries are only used for a limited time.
+    Keys are (board, pin name) tuples.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, ttl: float) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        version, set_time = entry
+        if time.monotonic() - set_time >= ttl:
+            return None
+
+        return version
+
+    def set(self, key: Hashable, version: str) -> None:
+        with self._lock:
+            self._entries[key] = (version, time.monotonic())
+
+    def evict(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# shared by all boards, since keys include the board
+meta_cache = MetaCache()
+latest_cache = LatestVersionCache()
+
+
 class CachePruner:
     """Prunes the cache directory, across multiple boards.
 
@@ -261,6 +1064,28 @@ class CachePruner:
         _log.info("Skipping cache deletion")
 
 
+def remove_orphan_sidecars(cache_dir: str | Path) -> None:
+    """Remove lock files and sidecars left next to cached files that are gone."""
+
+    suffixes = (*SIDECAR_SUFFIXES, "pins-lock")
+
+    lpaths = set()
+    for p in Path(cache_dir).glob("**/.*.pins-*"):
+        for suffix in suffixes:
+            if p.name.endswith(f".{suffix}"):
+                lpaths.add(str(p.parent / p.name[1 : -len(suffix) - 1]))
+
+    for lpath in sorted(lpaths):
+        # the file may be being filled, so wait for that before checking it
+        with cache_fill_lock([lpath]):
+            if os.path.exists(lpath):
+                continue
+
+            for suffix in SIDECAR_SUFFIXES:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(_sibling_path(lpath, suffix))
+
+
 def delete_version(path: str | Path):
     path = Path(path)
     shutil.rmtree(str(path.absolute()))
@@ -271,6 +1096,8 @@ def disk_usage(path):
 
 
 def prompt_cache_prune(to_prune, size) -> bool:
+    import humanize
+
     _log.info(f"Pruning items: {to_prune}")
     human_size = humanize.naturalsize(size, binary=True)
     resp = input(
@@ -283,9 +1110,11 @@ def prompt_cache_prune(to_prune, size) -> bool:
 
 
 def cache_info():
+    import humanize
+
     cache_root = get_cache_dir()
 
-    cache_boards = list(Path(cache_root).glob("*"))
+    cache_boards = [p for p in Path(cache_root).glob("*") if p.name != BLOB_DIR]
 
     print(f"Cache info: {cache_root}")
     for p_board in cache_boards:
@@ -295,12 +1124,35 @@ def cache_info():
         print(f"* {rel_path}: {human_size}")
 
 
-def cache_prune(days=30, cache_root=None, prompt=True):
+def cache_prune(days=30, cache_root=None, prompt=True, blob_storage=None):
+    """Delete cached pin versions not used in the last days, and unused blobs.
+
+    Parameters
+    ----------
+    days:
+        Versions last accessed over this many days ago are deleted.
+    cache_root:
+        The cache directory. Defaults to the PINS_CACHE_DIR environment variable.
+    prompt:
+        Whether to ask before deleting.
+    blob_storage:
+        Directories of blob stores outside the cache root, to prune too. The
+        pins_blobs directory in the cache root, and the stores inside the cache
+        root used by caches created in this process, are always pruned.
+    """
+
     if cache_root is None:
         cache_root = get_cache_dir()
 
+    if blob_storage is None:
+        blob_storage = []
+    elif isinstance(blob_storage, (str, Path)):
+        blob_storage = [blob_storage]
+
+    cache_boards = [p for p in Path(cache_root).glob("*") if p.name != BLOB_DIR]
+
     final_delete = []
-    for p_board in Path(cache_root).glob("*"):
+    for p_board in cache_boards:
         pruner = CachePruner(p_board)
         final_delete.extend(pruner.old_versions(days))
 
@@ -318,6 +1170,16 @@ def cache_prune(days=30, cache_root=None, prompt=True):
         inform(_log, "Deleting pins from cache.")
         for p in final_delete:
             delete_version(p)
+
+        for p_board in cache_boards:
+            remove_orphan_sidecars(p_board)
+
+        # deduplicated files are deleted once no cached version links to them
+        abs_root = os.path.abspath(cache_root)
+        registered = [p for p in _blob_roots if _is_relative_to(p, abs_root)]
+        blob_roots = [Path(cache_root) / BLOB_DIR, *registered, *blob_storage]
+        for root in {os.path.abspath(root) for root in blob_roots}:
+            BlobStore(root).prune()
     else:
         inform(_log, "Skipping deletion of pins from cache.")
 
@@ -9,6 +9,14 @@ PINS_ENV_CACHE_DIR = "PINS_CACHE_DIR"
 PINS_ENV_INSECURE_READ = "PINS_ALLOW_PICKLE_READ"
 PINS_ENV_ALLOW_RSC_SHORT_NAME = "PINS_ALLOW_RSC_SHORT_NAME"
 PINS_ENV_FEATURE_PREVIEW = "PINS_FEATURE_PREVIEW"
+PINS_ENV_LATEST_TTL = "PINS_LATEST_TTL"
+PINS_ENV_LATEST_MARKER = "PINS_LATEST_MARKER"
+PINS_ENV_CACHE_STATS = "PINS_CACHE_STATS"
+PINS_ENV_OFFLINE = "PINS_OFFLINE"
+PINS_ENV_CACHE_DEDUP = "PINS_CACHE_DEDUP"
+PINS_ENV_VERIFY_HASH = "PINS_VERIFY_HASH"
+PINS_ENV_URL_MAX_AGE = "PINS_URL_MAX_AGE"
+PINS_ENV_COMPRESS_WORKERS = "PINS_COMPRESS_WORKERS"
 
 pins_options = SimpleNamespace(quiet=False)
 
@@ -47,3 +55,86 @@ def get_allow_rsc_short_name():
 
 def get_feature_preview():
     return _interpret_int(PINS_ENV_FEATURE_PREVIEW)
+
+
+def get_latest_ttl(ttl):
+    if ttl is not None:
+        return ttl
+
+    env_var = os.environ.get(PINS_ENV_LATEST_TTL, "0")
+    try:
+        return float(env_var)
+    except ValueError:
+        raise ValueError(
+            f"{PINS_ENV_LATEST_TTL} must be a number of seconds, but was set to "
+            f"{repr(env_var)}."
+        )
+
+
+def get_latest_marker(flag):
+    if flag is None:
+        return _interpret_int(PINS_ENV_LATEST_MARKER)
+
+    return flag
+
+
+def get_cache_stats_persist(flag):
+    if flag is None:
+        return _interpret_int(PINS_ENV_CACHE_STATS)
+
+    return flag
+
+
+def get_offline(flag):
+    if flag is None:
+        return _interpret_int(PINS_ENV_OFFLINE)
+
+    return flag
+
+
+def get_cache_dedup(flag):
+    if flag is None:
+        return _interpret_int(PINS_ENV_CACHE_DEDUP)
+
+    return flag
+
+
+def get_verify_hash(flag):
+    if flag is None:
+        return _interpret_int(PINS_ENV_VERIFY_HASH)
+
+    return flag
+
+
+def get_url_max_age(max_age):
+    if max_age is not None:
+        return max_age
+
+    env_var = os.environ.get(PINS_ENV_URL_MAX_AGE)
+    if env_var is None:
+        return None
+
+    try:
+        return float(env_var)
+    except ValueError:
+        raise ValueError(
+            f"{PINS_ENV_URL_MAX_AGE} must be a number of seconds, but was set to "
+            f"{repr(env_var)}."
+        )
+
+
+def get_compress_workers(workers):
+    if workers is not None:
+        return workers
+
+    env_var = os.environ.get(PINS_ENV_COMPRESS_WORKERS)
+    if env_var is None:
+        return None
+
+    try:
+        return int(env_var)
+    except ValueError:
+        raise ValueError(
+            f"{PINS_ENV_COMPRESS_WORKERS} must be a number of threads, but was set to "
+            f"{repr(env_var)}."
+        )
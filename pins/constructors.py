@@ -34,6 +34,11 @@ def board(
     allow_pickle_read=None,
     storage_options: dict | None = None,
     board_factory: Callable | type[BaseBoard] | None = None,
+    *,
+    latest_ttl: float | None = None,
+    latest_marker: bool | None = None,
+    offline: bool | None = None,
+    verify_hash: bool | None = None,
 ):
     """General function for constructing a pins board.
 
@@ -67,6 +72,21 @@ def board(
         `fsspec.filesystem`.
     board_factory:
         An optional board class to use as the constructor.
+    latest_ttl: optional, float
+        How many seconds a pin's latest version may be reused for, before it is
+        looked up again. You can also set this using the `PINS_LATEST_TTL`
+        environment variable. By default, it is looked up on every read.
+    latest_marker: optional, bool
+        Whether writes record each pin's latest version in a file, which reads then
+        use, rather than listing every version. You can also set this using the
+        `PINS_LATEST_MARKER` environment variable.
+    offline: optional, bool
+        Whether to read pins only from the local cache, without contacting the board.
+        You can also set this using the `PINS_OFFLINE` environment variable.
+    verify_hash: optional, bool
+        Whether to check that the files read by `pin_read` and `pin_download` match
+        their pin's hash. You can also set this using the `PINS_VERIFY_HASH`
+        environment variable.
 
     Notes
     -----
@@ -130,21 +150,41 @@ def board(
 
     # construct board ----
 
-    pickle_kwargs = {"allow_pickle_read": allow_pickle_read}
+    # only options that are set are passed, since custom board factories may not
+    # accept them
+    options = dict(
+        latest_ttl=latest_ttl,
+        latest_marker=latest_marker,
+        offline=offline,
+        verify_hash=verify_hash,
+    )
+    board_kwargs = {
+        "allow_pickle_read": allow_pickle_read,
+        **{k: v for k, v in options.items() if v is not None},
+    }
+
     # TODO: should use a registry or something
     if board_factory is not None:
-        board = board_factory(path, fs, versioned, **pickle_kwargs)
+        board = board_factory(path, fs, versioned, **board_kwargs)
     elif protocol == "rsc":
-        board = BoardRsConnect(path, fs, versioned, **pickle_kwargs)
+        board = BoardRsConnect(path, fs, versioned, **board_kwargs)
     else:
-        board = BaseBoard(path, fs, versioned, **pickle_kwargs)
+        board = BaseBoard(path, fs, versioned, **board_kwargs)
     return board
 
 
 # TODO(#31): change file boards to unversioned once implemented
 
 
-def board_folder(path: str, versioned=True, allow_pickle_read=None):
+def board_folder(
+    path: str,
+    versioned=True,
+    allow_pickle_read=None,
+    *,
+    latest_ttl: float | None = None,
+    latest_marker: bool | None = None,
+    verify_hash: bool | None = None,
+):
     """Use a local folder as a board.
 
     Parameters
@@ -161,12 +201,40 @@ def board_folder(path: str, versioned=True, allow_pickle_read=None):
         You can enable reading pickles by setting this to `True`, or by setting the
         environment variable `PINS_ALLOW_PICKLE_READ`. If both are set, this argument
         takes precedence.
+    latest_ttl: optional, float
+        How many seconds a pin's latest version may be reused for, before it is
+        looked up again. You can also set this using the `PINS_LATEST_TTL`
+        environment variable. By default, it is looked up on every read.
+    latest_marker: optional, bool
+        Whether writes record each pin's latest version in a file, which reads then
+        use, rather than listing every version. You can also set this using the
+        `PINS_LATEST_MARKER` environment variable.
+    verify_hash: optional, bool
+        Whether to check that the files read by `pin_read` and `pin_download` match
+        their pin's hash. You can also set this using the `PINS_VERIFY_HASH`
+        environment variable.
     """
 
-    return board("file", path, versioned, cache=None, allow_pickle_read=allow_pickle_read)
+    return board(
+        "file",
+        path,
+        versioned,
+        cache=None,
+        allow_pickle_read=allow_pickle_read,
+        latest_ttl=latest_ttl,
+        latest_marker=latest_marker,
+        verify_hash=verify_hash,
+    )
 
 
-def board_temp(versioned=True, allow_pickle_read=None):
+def board_temp(
+    versioned=True,
+    allow_pickle_read=None,
+    *,
+    latest_ttl: float | None = None,
+    latest_marker: bool | None = None,
+    verify_hash: bool | None = None,
+):
     """Use a local temporary directory as a board.
 
     Parameters
@@ -181,12 +249,31 @@ def board_temp(versioned=True, allow_pickle_read=None):
         You can enable reading pickles by setting this to `True`, or by setting the
         environment variable `PINS_ALLOW_PICKLE_READ`. If both are set, this argument
         takes precedence.
+    latest_ttl: optional, float
+        How many seconds a pin's latest version may be reused for, before it is
+        looked up again. You can also set this using the `PINS_LATEST_TTL`
+        environment variable. By default, it is looked up on every read.
+    latest_marker: optional, bool
+        Whether writes record each pin's latest version in a file, which reads then
+        use, rather than listing every version. You can also set this using the
+        `PINS_LATEST_MARKER` environment variable.
+    verify_hash: optional, bool
+        Whether to check that the files read by `pin_read` and `pin_download` match
+        their pin's hash. You can also set this using the `PINS_VERIFY_HASH`
+        environment variable.
     """
 
     tmp_dir = tempfile.TemporaryDirectory()
 
     board_obj = board(
-        "file", tmp_dir.name, versioned, cache=None, allow_pickle_read=allow_pickle_read
+        "file",
+        tmp_dir.name,
+        versioned,
+        cache=None,
+        allow_pickle_read=allow_pickle_read,
+        latest_ttl=latest_ttl,
+        latest_marker=latest_marker,
+        verify_hash=verify_hash,
     )
 
     # TODO: this is necessary to ensure the temporary directory dir persists.
@@ -197,7 +284,14 @@ def board_temp(versioned=True, allow_pickle_read=None):
     return board_obj
 
 
-def board_local(versioned=True, allow_pickle_read=None):
+def board_local(
+    versioned=True,
+    allow_pickle_read=None,
+    *,
+    latest_ttl: float | None = None,
+    latest_marker: bool | None = None,
+    verify_hash: bool | None = None,
+):
     """Use a local folder as a board.
 
     Parameters
@@ -212,10 +306,31 @@ def board_local(versioned=True, allow_pickle_read=None):
         You can enable reading pickles by setting this to `True`, or by setting the
         environment variable `PINS_ALLOW_PICKLE_READ`. If both are set, this argument
         takes precedence.
+    latest_ttl: optional, float
+        How many seconds a pin's latest version may be reused for, before it is
+        looked up again. You can also set this using the `PINS_LATEST_TTL`
+        environment variable. By default, it is looked up on every read.
+    latest_marker: optional, bool
+        Whether writes record each pin's latest version in a file, which reads then
+        use, rather than listing every version. You can also set this using the
+        `PINS_LATEST_MARKER` environment variable.
+    verify_hash: optional, bool
+        Whether to check that the files read by `pin_read` and `pin_download` match
+        their pin's hash. You can also set this using the `PINS_VERIFY_HASH`
+        environment variable.
     """
     path = get_data_dir()
 
-    return board("file", path, versioned, cache=None, allow_pickle_read=allow_pickle_read)
+    return board(
+        "file",
+        path,
+        versioned,
+        cache=None,
+        allow_pickle_read=allow_pickle_read,
+        latest_ttl=latest_ttl,
+        latest_marker=latest_marker,
+        verify_hash=verify_hash,
+    )
 
 
 def board_github(
@@ -226,6 +341,11 @@ def board_github(
     versioned=True,
     cache=DEFAULT,
     allow_pickle_read=None,
+    *,
+    latest_ttl: float | None = None,
+    latest_marker: bool | None = None,
+    offline: bool | None = None,
+    verify_hash: bool | None = None,
 ):
     """Create a board to read and write pins from GitHub.
 
@@ -251,6 +371,21 @@ def board_github(
         You can enable reading pickles by setting this to `True`, or by setting the
         environment variable `PINS_ALLOW_PICKLE_READ`. If both are set, this argument
         takes precedence.
+    latest_ttl: optional, float
+        How many seconds a pin's latest version may be reused for, before it is
+        looked up again. You can also set this using the `PINS_LATEST_TTL`
+        environment variable. By default, it is looked up on every read.
+    latest_marker: optional, bool
+        Whether writes record each pin's latest version in a file, which reads then
+        use, rather than listing every version. You can also set this using the
+        `PINS_LATEST_MARKER` environment variable.
+    offline: optional, bool
+        Whether to read pins only from the local cache, without contacting the board.
+        You can also set this using the `PINS_OFFLINE` environment variable.
+    verify_hash: optional, bool
+        Whether to check that the files read by `pin_read` and `pin_download` match
+        their pin's hash. You can also set this using the `PINS_VERIFY_HASH`
+        environment variable.
 
 
     Notes
@@ -283,6 +418,10 @@ def board_github(
         cache,
         allow_pickle_read=allow_pickle_read,
         storage_options={"org": org, "repo": repo, "listings_expiry_time": 0},
+        latest_ttl=latest_ttl,
+        latest_marker=latest_marker,
+        offline=offline,
+        verify_hash=verify_hash,
     )
 
 
@@ -297,7 +436,16 @@ def board_urls(*args, **kwargs):
     return board_url(*args, **kwargs)
 
 
-def board_url(path: str, pin_paths: dict, cache=DEFAULT, allow_pickle_read=None):
+def board_url(
+    path: str,
+    pin_paths: dict,
+    cache=DEFAULT,
+    allow_pickle_read=None,
+    *,
+    max_age: float | None = None,
+    offline: bool | None = None,
+    verify_hash: bool | None = None,
+):
     """Create a board from individual URLs.
 
     Parameters
@@ -318,6 +466,19 @@ def board_url(path: str, pin_paths: dict, cache=DEFAULT, allow_pickle_read=None)
         You can enable reading pickles by setting this to `True`, or by setting the
         environment variable `PINS_ALLOW_PICKLE_READ`. If both are set, this argument
         takes precedence.
+    max_age: optional, float
+        The number of seconds before cached files are checked for changes. Checks
+        use the ETag and Last-Modified headers the server sent with a file, so an
+        unchanged file is not downloaded again. You can also set this using the
+        `PINS_URL_MAX_AGE` environment variable. By default, cached files are never
+        checked.
+    offline: optional, bool
+        Whether to read pins only from the local cache, without contacting the board.
+        You can also set this using the `PINS_OFFLINE` environment variable.
+    verify_hash: optional, bool
+        Whether to check that the files read by `pin_read` and `pin_download` match
+        their pin's hash. You can also set this using the `PINS_VERIFY_HASH`
+        environment variable.
 
 
     Examples
@@ -345,7 +506,11 @@ def board_url(path: str, pin_paths: dict, cache=DEFAULT, allow_pickle_read=None)
         sub_dir = prefix_cache("http", path)
         sub_cache = f"{cache_dir}/{sub_dir}"
         fs = PinsAccessTimeCache(
-            target_protocol="http", cache_storage=sub_cache, same_names=False
+            target_protocol="http",
+            cache_storage=sub_cache,
+            same_names=False,
+            max_age=max_age,
+            offline=offline,
         )
     else:
         raise NotImplementedError("Can't currently pass own cache object")
@@ -356,11 +521,22 @@ def board_url(path: str, pin_paths: dict, cache=DEFAULT, allow_pickle_read=None)
         versioned=False,
         allow_pickle_read=allow_pickle_read,
         pin_paths=pin_paths,
+        offline=offline,
+        verify_hash=verify_hash,
     )
 
 
 def board_connect(
-    server_url=None, versioned=True, api_key=None, cache=DEFAULT, allow_pickle_read=None
+    server_url=None,
+    versioned=True,
+    api_key=None,
+    cache=DEFAULT,
+    allow_pickle_read=None,
+    *,
+    latest_ttl: float | None = None,
+    offline: bool | None = None,
+    verify_hash: bool | None = None,
+    compress_workers: int | None = None,
 ):
     """Create a board to read and write pins from a Posit Connect server.
 
@@ -385,6 +561,21 @@ def board_connect(
         You can enable reading pickles by setting this to `True`, or by setting the
         environment variable `PINS_ALLOW_PICKLE_READ`. If both are set, this argument
         takes precedence.
+    latest_ttl: optional, float
+        How many seconds a pin's latest version may be reused for, before it is
+        looked up again. You can also set this using the `PINS_LATEST_TTL`
+        environment variable. By default, it is looked up on every read.
+    offline: optional, bool
+        Whether to read pins only from the local cache, without contacting the board.
+        You can also set this using the `PINS_OFFLINE` environment variable.
+    verify_hash: optional, bool
+        Whether to check that the files read by `pin_read` and `pin_download` match
+        their pin's hash. You can also set this using the `PINS_VERIFY_HASH`
+        environment variable.
+    compress_workers: optional, int
+        The number of threads used to compress pins as they are uploaded. You can
+        also set this using the `PINS_COMPRESS_WORKERS` environment variable. By
+        default, pins are compressed on a single core.
 
 
     Examples
@@ -431,15 +622,36 @@ def board_connect(
         # TODO: this should be inside the api class
         server_url = os.environ.get("CONNECT_SERVER")
 
-    kwargs = dict(server_url=server_url, api_key=api_key)
-    return board("rsc", None, versioned, cache, allow_pickle_read, storage_options=kwargs)
+    kwargs = dict(
+        server_url=server_url, api_key=api_key, compress_workers=compress_workers
+    )
+    return board(
+        "rsc",
+        None,
+        versioned,
+        cache,
+        allow_pickle_read,
+        storage_options=kwargs,
+        latest_ttl=latest_ttl,
+        offline=offline,
+        verify_hash=verify_hash,
+    )
 
 
 board_rsconnect = board_connect
 
 
 def board_s3(
-    path, versioned=True, cache=DEFAULT, allow_pickle_read=None, **storage_options
+    path,
+    versioned=True,
+    cache=DEFAULT,
+    allow_pickle_read=None,
+    *,
+    latest_ttl: float | None = None,
+    latest_marker: bool | None = None,
+    offline: bool | None = None,
+    verify_hash: bool | None = None,
+    **storage_options,
 ):
     """Create a board to read and write pins from an AWS S3 bucket folder.
 
@@ -461,6 +673,21 @@ def board_s3(
         You can enable reading pickles by setting this to `True`, or by setting the
         environment variable `PINS_ALLOW_PICKLE_READ`. If both are set, this argument
         takes precedence.
+    latest_ttl: optional, float
+        How many seconds a pin's latest version may be reused for, before it is
+        looked up again. You can also set this using the `PINS_LATEST_TTL`
+        environment variable. By default, it is looked up on every read.
+    latest_marker: optional, bool
+        Whether writes record each pin's latest version in a file, which reads then
+        use, rather than listing every version. You can also set this using the
+        `PINS_LATEST_MARKER` environment variable.
+    offline: optional, bool
+        Whether to read pins only from the local cache, without contacting the board.
+        You can also set this using the `PINS_OFFLINE` environment variable.
+    verify_hash: optional, bool
+        Whether to check that the files read by `pin_read` and `pin_download` match
+        their pin's hash. You can also set this using the `PINS_VERIFY_HASH`
+        environment variable.
     storage_options:
         Additional keyword arguments to be passed to the underlying fsspec S3FileSystem.
 
@@ -502,10 +729,31 @@ but we strongly recommend setting it to 0 for optimal performance.
     # Set listings_expiry_time based on what's provided by user
     # or the default value of 0.
     opts.update({"listings_expiry_time": listings_expiry_time})
-    return board("s3", path, versioned, cache, allow_pickle_read, storage_options=opts)
+    return board(
+        "s3",
+        path,
+        versioned,
+        cache,
+        allow_pickle_read,
+        storage_options=opts,
+        latest_ttl=latest_ttl,
+        latest_marker=latest_marker,
+        offline=offline,
+        verify_hash=verify_hash,
+    )
 
 
-def board_gcs(path, versioned=True, cache=DEFAULT, allow_pickle_read=None):
+def board_gcs(
+    path,
+    versioned=True,
+    cache=DEFAULT,
+    allow_pickle_read=None,
+    *,
+    latest_ttl: float | None = None,
+    latest_marker: bool | None = None,
+    offline: bool | None = None,
+    verify_hash: bool | None = None,
+):
     """Create a board to read and write pins from a Google Cloud Storage bucket folder.
 
     Parameters
@@ -526,6 +774,21 @@ def board_gcs(path, versioned=True, cache=DEFAULT, allow_pickle_read=None):
         You can enable reading pickles by setting this to `True`, or by setting the
         environment variable `PINS_ALLOW_PICKLE_READ`. If both are set, this argument
         takes precedence.
+    latest_ttl: optional, float
+        How many seconds a pin's latest version may be reused for, before it is
+        looked up again. You can also set this using the `PINS_LATEST_TTL`
+        environment variable. By default, it is looked up on every read.
+    latest_marker: optional, bool
+        Whether writes record each pin's latest version in a file, which reads then
+        use, rather than listing every version. You can also set this using the
+        `PINS_LATEST_MARKER` environment variable.
+    offline: optional, bool
+        Whether to read pins only from the local cache, without contacting the board.
+        You can also set this using the `PINS_OFFLINE` environment variable.
+    verify_hash: optional, bool
+        Whether to check that the files read by `pin_read` and `pin_download` match
+        their pin's hash. You can also set this using the `PINS_VERIFY_HASH`
+        environment variable.
 
     Notes
     -----
@@ -539,10 +802,31 @@ def board_gcs(path, versioned=True, cache=DEFAULT, allow_pickle_read=None):
     # GCSFS uses a different name for listings_expiry_time, and then
     # fixes it under the hood
     opts = {"cache_timeout": 0}
-    return board("gcs", path, versioned, cache, allow_pickle_read, storage_options=opts)
+    return board(
+        "gcs",
+        path,
+        versioned,
+        cache,
+        allow_pickle_read,
+        storage_options=opts,
+        latest_ttl=latest_ttl,
+        latest_marker=latest_marker,
+        offline=offline,
+        verify_hash=verify_hash,
+    )
 
 
-def board_azure(path, versioned=True, cache=DEFAULT, allow_pickle_read=None):
+def board_azure(
+    path,
+    versioned=True,
+    cache=DEFAULT,
+    allow_pickle_read=None,
+    *,
+    latest_ttl: float | None = None,
+    latest_marker: bool | None = None,
+    offline: bool | None = None,
+    verify_hash: bool | None = None,
+):
     """Create a board to read and write pins from an Azure Datalake Filesystem folder.
 
     Parameters
@@ -563,6 +847,21 @@ def board_azure(path, versioned=True, cache=DEFAULT, allow_pickle_read=None):
         You can enable reading pickles by setting this to `True`, or by setting the
         environment variable `PINS_ALLOW_PICKLE_READ`. If both are set, this argument
         takes precedence.
+    latest_ttl: optional, float
+        How many seconds a pin's latest version may be reused for, before it is
+        looked up again. You can also set this using the `PINS_LATEST_TTL`
+        environment variable. By default, it is looked up on every read.
+    latest_marker: optional, bool
+        Whether writes record each pin's latest version in a file, which reads then
+        use, rather than listing every version. You can also set this using the
+        `PINS_LATEST_MARKER` environment variable.
+    offline: optional, bool
+        Whether to read pins only from the local cache, without contacting the board.
+        You can also set this using the `PINS_OFFLINE` environment variable.
+    verify_hash: optional, bool
+        Whether to check that the files read by `pin_read` and `pin_download` match
+        their pin's hash. You can also set this using the `PINS_VERIFY_HASH`
+        environment variable.
 
     Notes
     -----
@@ -574,10 +873,31 @@ def board_azure(path, versioned=True, cache=DEFAULT, allow_pickle_read=None):
     """
 
     opts = {"use_listings_cache": False}
-    return board("abfs", path, versioned, cache, allow_pickle_read, storage_options=opts)
+    return board(
+        "abfs",
+        path,
+        versioned,
+        cache,
+        allow_pickle_read,
+        storage_options=opts,
+        latest_ttl=latest_ttl,
+        latest_marker=latest_marker,
+        offline=offline,
+        verify_hash=verify_hash,
+    )
 
 
-def board_databricks(path, versioned=True, cache=DEFAULT, allow_pickle_read=None):
+def board_databricks(
+    path,
+    versioned=True,
+    cache=DEFAULT,
+    allow_pickle_read=None,
+    *,
+    latest_ttl: float | None = None,
+    latest_marker: bool | None = None,
+    offline: bool | None = None,
+    verify_hash: bool | None = None,
+):
     """Create a board to read and write pins from an Databricks Volume folder.
 
     Parameters
@@ -600,6 +920,21 @@ def board_databricks(path, versioned=True, cache=DEFAULT, allow_pickle_read=None
         You can enable reading pickles by setting this to `True`, or by setting the
         environment variable `PINS_ALLOW_PICKLE_READ`. If both are set, this argument
         takes precedence.
+    latest_ttl: optional, float
+        How many seconds a pin's latest version may be reused for, before it is
+        looked up again. You can also set this using the `PINS_LATEST_TTL`
+        environment variable. By default, it is looked up on every read.
+    latest_marker: optional, bool
+        Whether writes record each pin's latest version in a file, which reads then
+        use, rather than listing every version. You can also set this using the
+        `PINS_LATEST_MARKER` environment variable.
+    offline: optional, bool
+        Whether to read pins only from the local cache, without contacting the board.
+        You can also set this using the `PINS_OFFLINE` environment variable.
+    verify_hash: optional, bool
+        Whether to check that the files read by `pin_read` and `pin_download` match
+        their pin's hash. You can also set this using the `PINS_VERIFY_HASH`
+        environment variable.
 
     Notes
     -----
@@ -632,4 +967,14 @@ def board_databricks(path, versioned=True, cache=DEFAULT, allow_pickle_read=None
         raise PinsError(
             "Install the `databricks-sdk` package for Databricks board support."
         )
-    return board("dbc", path, versioned, cache, allow_pickle_read)
+    return board(
+        "dbc",
+        path,
+        versioned,
+        cache,
+        allow_pickle_read,
+        latest_ttl=latest_ttl,
+        latest_marker=latest_marker,
+        offline=offline,
+        verify_hash=verify_hash,
+    )
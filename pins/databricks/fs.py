@@ -1,4 +1,6 @@
+import functools
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path, PurePath
 
@@ -6,10 +8,45 @@ from fsspec import AbstractFileSystem
 
 from pins.errors import PinsError
 
+LISTINGS_EXPIRY_TIME = 10
+
 
 class DatabricksFs(AbstractFileSystem):
+    """A filesystem for Databricks Unity Catalog volumes.
+
+    Parameters
+    ----------
+    client:
+        A `databricks.sdk.WorkspaceClient`. If not specified, one is created the
+        first time it is needed, and reused for every later call.
+    max_workers:
+        The maximum number of threads used to transfer or delete files, when
+        putting, getting or removing a directory.
+    **kwargs:
+        Passed to fsspec.AbstractFileSystem. Directory listings are cached for
+        listings_expiry_time seconds (default 10), and writes through this
+        filesystem clear the affected listings. Set use_listings_cache=False to
+        disable this cache.
+    """
+
     protocol = "dbc"
 
+    def __init__(self, client=None, max_workers=None, **kwargs):
+        kwargs.setdefault("listings_expiry_time", LISTINGS_EXPIRY_TIME)
+        super().__init__(**kwargs)
+
+        self._client = client
+        self.max_workers = max_workers
+
+    @functools.cached_property
+    def client(self):
+        if self._client is not None:
+            return self._client
+
+        from databricks.sdk import WorkspaceClient
+
+        return WorkspaceClient()
+
     def ls(self, path, detail=False, **kwargs):
         return self._databricks_ls(path, detail)
 
@@ -28,6 +65,7 @@ class DatabricksFs(AbstractFileSystem):
         if not create_parents:
             raise NotImplementedError
         self._databricks_mkdir(path)
+        self.invalidate_cache(path)
 
     def put(
         self,
@@ -42,6 +80,11 @@ class DatabricksFs(AbstractFileSystem):
         if maxdepth is not None:
             raise NotImplementedError
         self._databricks_put(lpath, rpath)
+        self.invalidate_cache(rpath)
+
+    def pipe_file(self, path, value, **kwargs):
+        self.client.files.upload(path, BytesIO(value), overwrite=True)
+        self.invalidate_cache(path)
 
     def rm(self, path, recursive=True, maxdepth=None) -> None:
         if not recursive:
@@ -50,62 +93,87 @@ class DatabricksFs(AbstractFileSystem):
             raise NotImplementedError
         if self._databricks_exists(path):
             self._databricks_rm_dir(path)
+            self.invalidate_cache(path)
 
-    @staticmethod
-    def _databricks_put(lpath, rpath):
-        from databricks.sdk import WorkspaceClient
+    def invalidate_cache(self, path=None):
+        if path is None:
+            self.dircache.clear()
+            return
 
-        w = WorkspaceClient()
-        path = Path(lpath).absolute()
-        orig_path = path
-
-        def _upload_files(path):
-            contents = Path(path)
-            for item in contents.iterdir():
-                abs_path = PurePath(path).joinpath(item)
-                is_file = Path(abs_path).is_file()
-                if is_file:
-                    rel_path = abs_path.relative_to(orig_path)
-                    db_path = PurePath(rpath).joinpath(rel_path)
-                    file = open(abs_path, "rb")
-                    w.files.upload(str(db_path), BytesIO(file.read()), overwrite=True)
-                else:
-                    _upload_files(abs_path)
+        path = self._strip_protocol(path)
 
-        _upload_files(path)
+        # listings of the path, its children, and every parent may have changed
+        for cached in list(self.dircache):
+            if cached == path or cached.startswith(path + "/"):
+                self.dircache.pop(cached, None)
 
-    def _databricks_get(self, board, rpath, lpath, recursive=False, **kwargs):
-        from databricks.sdk import WorkspaceClient
+        while path:
+            path = self._parent(path)
+            self.dircache.pop(path, None)
+
+    def _map(self, f, items):
+        """Call f on each item using a thread pool, raising the first error."""
+
+        items = list(items)
+        if len(items) <= 1:
+            return [f(item) for item in items]
 
-        w = WorkspaceClient()
+        with ThreadPoolExecutor(self.max_workers) as pool:
+            return list(pool.map(f, items))
+
+    def _databricks_put(self, lpath, rpath):
+        orig_path = Path(lpath).absolute()
+
+        def _upload_file(abs_path):
+            rel_path = abs_path.relative_to(orig_path)
+            db_path = PurePath(rpath).joinpath(rel_path)
+
+            # the sdk streams file objects, so there is no need to read them first
+            with open(abs_path, "rb") as f:
+                self.client.files.upload(str(db_path), f, overwrite=True)
+
+        self._map(_upload_file, (p for p in orig_path.rglob("*") if p.is_file()))
+
+    def _databricks_get(self, rpath, lpath, recursive=False, **kwargs):
         file_type = self._databricks_is_type(rpath)
         if file_type == "file":
-            board.fs.get(rpath, lpath, **kwargs)
+            self._databricks_get_file(rpath, lpath)
             return
-
-        def _get_files(path, recursive, **kwargs):
-            raw_contents = w.files.list_directory_contents(path)
-            contents = list(raw_contents)
-            details = list(map(self._databricks_content_details, contents))
-            for item in details:
-                item_path = item.get("path")
-                if item.get("is_directory"):
+        elif file_type == "nothing":
+            raise PinsError(f"File or directory does not exist at path: {rpath}")
+
+        def _list_files(path):
+            # listings are cached, so walking a directory that was already
+            # listed (e.g. by pin_versions) does not contact the server
+            for item in self._databricks_ls(path, detail=True):
+                if item["type"] == "directory":
                     if recursive:
-                        _get_files(item_path, recursive=recursive, **kwargs)
+                        yield from _list_files(item["name"])
                 else:
-                    rel_path = PurePath(item_path).relative_to(rpath)
-                    target_path = PurePath(lpath).joinpath(rel_path)
-                    board.fs.get(item_path, str(target_path))
+                    yield item["name"]
+
+        def _get_file(item_path):
+            rel_path = PurePath(item_path).relative_to(rpath)
+            self._databricks_get_file(item_path, str(PurePath(lpath) / rel_path))
+
+        self._map(_get_file, _list_files(rpath))
 
-        _get_files(rpath, recursive, **kwargs)
+    def _databricks_get_file(self, rpath, lpath):
+        resp = self.client.files.download(rpath)
+
+        Path(lpath).parent.mkdir(parents=True, exist_ok=True)
+        with open(lpath, "wb") as f:
+            shutil.copyfileobj(resp.contents, f)
 
     def _databricks_open(self, path):
-        from databricks.sdk import WorkspaceClient
+        from databricks.sdk.errors import NotFound
 
-        if not self._databricks_exists(path):
+        # download directly, rather than first checking the file exists
+        try:
+            resp = self.client.files.download(path)
+        except NotFound:
             raise PinsError(f"File or directory does not exist at path: {path}")
-        w = WorkspaceClient()
-        resp = w.files.download(path)
+
         f = BytesIO()
         shutil.copyfileobj(resp.contents, f)
         f.seek(0)
@@ -117,80 +185,108 @@ class DatabricksFs(AbstractFileSystem):
         else:
             return True
 
-    @staticmethod
-    def _databricks_is_type(path: str):
-        from databricks.sdk import WorkspaceClient
+    def _databricks_is_type(self, path: str):
+        path = self._strip_protocol(path)
+
+        # use a cached listing of the path, or of its parent directory
+        if path in self.dircache:
+            return "directory"
+
+        parent = self._parent(path)
+        if parent in self.dircache:
+            for item in self.dircache[parent]:
+                if item["name"] == path:
+                    return item["type"]
+            return "nothing"
+
+        return self._databricks_probe(path)
+
+    def _databricks_probe(self, path: str):
         from databricks.sdk.errors import NotFound
 
-        w = WorkspaceClient()
-        try:
-            w.files.get_metadata(path)
-        except NotFound:
+        # pins and versions are directories, while pin files usually have an
+        # extension. Checking the likely type first usually needs one call.
+        checks = [
+            ("file", self.client.files.get_metadata),
+            ("directory", self.client.files.get_directory_metadata),
+        ]
+        if not PurePath(path).suffix:
+            checks.reverse()
+
+        for kind, get_metadata in checks:
             try:
-                w.files.get_directory_metadata(path)
+                get_metadata(path)
             except NotFound:
-                return "nothing"
+                continue
             else:
-                return "directory"
-        else:
-            return "file"
+                return kind
+
+        return "nothing"
 
     def _databricks_ls(self, path, detail):
-        from databricks.sdk import WorkspaceClient
+        from databricks.sdk.errors import BadRequest, NotFound
 
-        if not self._databricks_exists(path):
-            raise PinsError(f"File or directory does not exist at path: {path}")
-        w = WorkspaceClient()
-        if self._databricks_is_type(path) == "file":
-            if detail:
-                return [dict(name=path, size=None, type="file")]
-            else:
-                return path
-
-        contents_raw = w.files.list_directory_contents(path)
-        contents = list(contents_raw)
-        items = []
-        for item in contents:
-            item = self._databricks_content_details(item)
-            item_path = item.get("path")
-            item_path = item_path.rstrip("/")
-            if detail:
-                if item.get("is_directory"):
-                    item_type = "directory"
-                else:
-                    item_type = "file"
-                items.append(dict(name=item_path, size=None, type=item_type))
-            else:
-                items.append(item_path)
-        return items
+        path = self._strip_protocol(path)
+
+        if path in self.dircache:
+            items = self.dircache[path]
+        else:
+            # list first, since pins mostly lists directories. This both checks
+            # the path is a directory and fetches its contents in one call.
+            try:
+                items = self._databricks_list_dir(path)
+            except (NotFound, BadRequest):
+                if self._databricks_probe(path) == "file":
+                    if detail:
+                        return [dict(name=path, size=None, type="file")]
+                    else:
+                        return path
+
+                raise PinsError(f"File or directory does not exist at path: {path}")
+
+            self.dircache[path] = items
+
+        if detail:
+            return items
+
+        return [item["name"] for item in items]
 
     def _databricks_rm_dir(self, path):
-        from databricks.sdk import WorkspaceClient
+        files = []
+        dirs = []
 
-        w = WorkspaceClient()
-        raw_contents = w.files.list_directory_contents(path)
-        contents = list(raw_contents)
-        details = list(map(self._databricks_content_details, contents))
-        for item in details:
-            item_path = item.get("path")
-            if item.get("is_directory"):
-                self._databricks_rm_dir(item_path)
-            else:
-                w.files.delete(item_path)
-        w.files.delete_directory(path)
+        def _walk(path):
+            for item in self._databricks_list_dir(path):
+                if item["type"] == "directory":
+                    _walk(item["name"])
+                else:
+                    files.append(item["name"])
 
-    @staticmethod
-    def _databricks_mkdir(path):
-        from databricks.sdk import WorkspaceClient
+            # children are appended before their parents
+            dirs.append(path)
+
+        _walk(path)
+
+        self._map(self.client.files.delete, files)
+
+        # directories must be empty before deleting them, so go deepest first
+        for dir_path in dirs:
+            self.client.files.delete_directory(dir_path)
+
+    def _databricks_mkdir(self, path):
+        self.client.files.create_directory(path)
+
+    def _databricks_list_dir(self, path):
+        """List a directory, returning fsspec style entries."""
 
-        w = WorkspaceClient()
-        w.files.create_directory(path)
+        contents = self.client.files.list_directory_contents(path)
+        return list(map(self._databricks_content_details, contents))
 
     @staticmethod
     def _databricks_content_details(item):
         details = {
-            "path": item.path,
-            "name": item.name,
-            "is_directory": item.is_directory,
+            "name": item.path.rstrip("/"),
+            "size": item.file_size,
+            "type": "directory" if item.is_directory else "file",
         }
         return details
@@ -7,6 +7,7 @@ from pins._adaptors import Adaptor, create_adaptor
 from .config import PINS_ENV_INSECURE_READ, get_allow_pickle_read
 from .errors import PinsInsecureReadError
 from .meta import Meta
+from .tracing import file_size, path_size, span
 
 # TODO: move IFileSystem out of boards, to fix circular import
 # from .boards import IFileSystem
@@ -35,7 +36,18 @@ def load_path(filename: str, path_to_version, pin_type=None):
 
 
 def load_file(filename: str, fs, path_to_version, pin_type):
-    return fs.open(load_path(filename, path_to_version, pin_type))
+    path = load_path(filename, path_to_version, pin_type)
+
+    with span("load_file", path=path) as s:
+        if s.active and hasattr(fs, "_check_file"):
+            s.cache_hit = fs._check_file(path) is not None
+
+        f = fs.open(path)
+
+        if s.active:
+            s.bytes = file_size(f)
+
+    return f
 
 
 def load_data(
@@ -55,7 +67,16 @@ def load_data(
         A filepath used as the parent directory the data to-be-loaded lives in.
     """
 
-    # TODO: extandable loading with deferred importing
+    check_pickle_read(meta, allow_pickle_read)
+
+    with span("load_data", type=meta.type):
+        with load_file(meta.file, fs, path_to_version, meta.type) as f:
+            return read_data(meta, f)
+
+
+def check_pickle_read(meta: Meta, allow_pickle_read: "bool | None" = None) -> None:
+    """Raise an error if reading a pin would unpickle data, without permission."""
+
     if meta.type in UNSAFE_TYPES and not get_allow_pickle_read(allow_pickle_read):
         raise PinsInsecureReadError(
             f"Reading pin type {meta.type} involves reading a pickle file, so is NOT secure."
@@ -66,63 +87,80 @@ def load_data(
             "  * https://scikit-learn.org/stable/modules/model_persistence.html#security-maintainability-limitations"
         )
 
-    with load_file(meta.file, fs, path_to_version, meta.type) as f:
-        if meta.type == "csv":
-            import pandas as pd
 
-            return pd.read_csv(f)
+def read_data(meta: Meta, f):
+    """Return data read from an open pin file, based on meta type."""
 
-        elif meta.type == "arrow":
-            import pandas as pd
+    # TODO: extandable loading with deferred importing
+    if meta.type == "csv":
+        import pandas as pd
 
-            return pd.read_feather(f)
+        return pd.read_csv(f)
 
-        elif meta.type == "feather":
-            import pandas as pd
+    elif meta.type == "arrow":
+        import pandas as pd
 
-            return pd.read_feather(f)
+        return pd.read_feather(f)
 
-        elif meta.type == "parquet":
-            import pandas as pd
+    elif meta.type == "feather":
+        import pandas as pd
 
-            return pd.read_parquet(f)
+        return pd.read_feather(f)
 
-        elif meta.type == "table":
-            import pandas as pd
+    elif meta.type == "parquet":
+        import pandas as pd
 
-            return pd.read_csv(f)
+        return pd.read_parquet(f)
 
-        elif meta.type == "joblib":
-            import joblib
+    elif meta.type == "table":
+        import pandas as pd
 
-            return joblib.load(f)
+        return pd.read_csv(f)
 
-        elif meta.type == "json":
-            import json
+    elif meta.type == "joblib":
+        import joblib
 
-            return json.load(f)
+        return joblib.load(f)
 
-        elif meta.type == "file":
-            raise NotImplementedError(
-                "Methods like `.pin_read()` are not able to read 'file' type pins."
-                " Use `.pin_download()` to download the file."
-            )
+    elif meta.type == "json":
+        import json
 
-        elif meta.type == "rds":
-            try:
-                import rdata  # pyright: ignore[reportMissingImports]
+        return json.load(f)
 
-                return rdata.read_rds(f)
-            except ModuleNotFoundError:
-                raise ModuleNotFoundError(
-                    "Install the 'rdata' package to attempt to convert 'rds' files into Python objects."
-                )
+    elif meta.type == "file":
+        raise NotImplementedError(
+            "Methods like `.pin_read()` are not able to read 'file' type pins."
+            " Use `.pin_download()` to download the file."
+        )
+
+    elif meta.type == "rds":
+        try:
+            import rdata  # pyright: ignore[reportMissingImports]
+
+            return rdata.read_rds(f)
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(
+                "Install the 'rdata' package to attempt to convert 'rds' files into Python objects."
+            )
 
     raise NotImplementedError(f"No driver for type {meta.type}")
 
 
 def save_data(
     obj: "Adaptor | Any", fname, pin_type=None, apply_suffix: bool = True
+) -> "str | Sequence[str]":
+    with span("save_data", type=pin_type) as s:
+        final_name = _save_data(obj, fname, pin_type, apply_suffix)
+
+        if s.active:
+            names = [final_name] if isinstance(final_name, str) else final_name
+            s.bytes = sum(path_size(str(name)) for name in names)
+
+    return final_name
+
+
+def _save_data(
+    obj: "Adaptor | Any", fname, pin_type=None, apply_suffix: bool = True
 ) -> "str | Sequence[str]":
     # TODO: extensible saving with deferred importing
     # TODO: how to encode arguments to saving / loading drivers?
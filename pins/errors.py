@@ -8,3 +8,7 @@ class PinsVersionError(PinsError):
 
 class PinsInsecureReadError(PinsError):
     pass
+
+
+class PinsHashError(PinsError):
+    pass
@@ -8,12 +8,63 @@ from typing import Any, ClassVar
 import yaml
 
 from ._types import IOBase, StrOrFile
+from .utils import slotted
 from .versions import Version, VersionRaw, guess_version
 
 META_FILENAME = "data.txt"
 DEFAULT_API_VERSION = 1
 
+# use libyaml's C parser and emitter when pyyaml was built with it
+try:
+    from yaml import CDumper as _CDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
+    _CDumper = None
+
+
+def _is_simple_yaml(data) -> bool:
+    """Return whether libyaml would emit data exactly as pure-python pyyaml does.
+
+    The two emitters differ in how they fold long quoted strings, and in when they
+    use complex (?) keys. Neither happens for printable ascii strings and short,
+    non-empty keys, so those are emitted with libyaml.
+    """
+
+    if isinstance(data, str):
+        return data.isascii() and data.isprintable()
+    elif data is None or isinstance(data, (bool, int, float)):
+        return True
+    elif isinstance(data, list):
+        return all(_is_simple_yaml(x) for x in data)
+    elif isinstance(data, dict):
+        return all(
+            (not isinstance(k, str) or 0 < len(k) <= 100)
+            and _is_simple_yaml(k)
+            and _is_simple_yaml(v)
+            for k, v in data.items()
+        )
+
+    return False
+
+
+def yaml_dump(data, f: IOBase | None = None) -> str | None:
+    """Dump data to yaml, as yaml.dump does, but using libyaml when possible."""
+
+    if _CDumper is not None and _is_simple_yaml(data):
+        return yaml.dump(data, f, Dumper=_CDumper)
+
+    return yaml.dump(data, f, Dumper=yaml.Dumper)
+
+
+def yaml_load(f: StrOrFile):
+    """Load yaml, as yaml.safe_load does, but using libyaml when possible."""
+
+    return yaml.load(f, Loader=_SafeLoader)
+
+
+@slotted()
 @dataclass
 class MetaRaw:
     """Absolute minimum metadata for a pin.
@@ -32,6 +83,7 @@ class MetaRaw:
     name: str
 
 
+@slotted("_unknown_fields")
 @dataclass
 class Meta:
     """Represent metadata for a pin version.
@@ -100,6 +152,10 @@ class Meta:
         self._unknown_fields = unknown_fields
 
     def __getattr__(self, k):
+        if k == "_unknown_fields":
+            # not set yet, e.g. while copying or unpickling
+            raise AttributeError(k)
+
         try:
             return self._unknown_fields[k]
         except KeyError:
@@ -148,9 +204,10 @@ class Meta:
     def to_pin_yaml(self, f: IOBase | None = None) -> str | None:
         data = self.to_pin_dict()
 
-        return yaml.dump(data, f)
+        return yaml_dump(data, f)
 
 
+@slotted()
 @dataclass
 class MetaV0:
     file: str | Sequence[str]
@@ -282,7 +339,7 @@ class MetaFactory:
         else:
             version_obj = version
 
-        data = yaml.safe_load(f)
+        data = yaml_load(f)
 
         api_version = data.get("api_version", 0)
         if api_version >= 2:
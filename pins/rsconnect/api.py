@@ -1,22 +1,32 @@
 from __future__ import annotations
 
 import logging
+import math
 import os
+import struct
 import tempfile
-from collections.abc import Mapping, Sequence
+import time
+import zlib
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from functools import partial
 from io import IOBase
 from pathlib import Path
-from typing import Generic, Literal, TypeVar, overload
+from typing import Callable, Generic, Literal, TypeVar, overload
 from urllib.parse import urlencode
 
 import requests
 
+from ..config import get_compress_workers
+from ..tracing import span
+
 RSC_API_KEY = "CONNECT_API_KEY"
 RSC_CODE_OBJECT_DOES_NOT_EXIST = 4
 RSC_CODE_INVALID_NUMERIC_PATH = 3
 
+# longest time (in seconds) the tasks endpoint is asked to wait for new output
+MAX_TASK_WAIT = 10
+
 _log = logging.getLogger(__name__)
 
 
@@ -37,6 +47,108 @@ def _download_file(response, local_fname):
             shutil.copyfileobj(response.raw, f)
 
 
+class _ParallelGzipWriter:
+    """Write a single gzip member, deflating blocks of input on a thread pool.
+
+    This follows the approach used by pigz: each block is compressed independently,
+    primed with the tail of the previous block as a dictionary, and ended with a
+    sync flush so the compressed blocks can be concatenated into one valid deflate
+    stream. The result can be read by any gzip decoder.
+
+    Note that this class does not close the underlying file object.
+    """
+
+    # deflate can only look back 32KiB, so this is all the dictionary it can use
+    DICT_SIZE = 32 * 1024
+
+    def __init__(
+        self,
+        f_out: IOBase,
+        workers: int,
+        block_size: int = 1024 * 1024,
+        compresslevel: int = 9,
+    ):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.f_out = f_out
+        self.workers = workers
+        self.block_size = block_size
+        self.compresslevel = compresslevel
+
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._pending = []
+        self._buf = bytearray()
+        self._prev_tail = b""
+        self._crc = 0
+        self._size = 0
+
+        # header: magic, deflate, no flags, mtime, max compression, unknown OS
+        header = struct.pack("<BBBBLBB", 0x1F, 0x8B, 8, 0, int(time.time()), 2, 255)
+        self.f_out.write(header)
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._crc = zlib.crc32(data, self._crc)
+        self._size += len(data)
+        self._buf.extend(data)
+
+        while len(self._buf) >= self.block_size:
+            self._submit(bytes(self._buf[: self.block_size]))
+            del self._buf[: self.block_size]
+
+        return len(data)
+
+    def tell(self) -> int:
+        return self._size
+
+    def close(self) -> None:
+        if self._executor is None:
+            return
+
+        if self._buf:
+            self._submit(bytes(self._buf))
+            self._buf = bytearray()
+
+        self._drain(0)
+        self._executor.shutdown()
+        self._executor = None
+
+        # an empty final block ends the deflate stream, followed by the trailer
+        self.f_out.write(b"\x03\x00")
+        self.f_out.write(struct.pack("<LL", self._crc, self._size & 0xFFFFFFFF))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _submit(self, block: bytes):
+        fut = self._executor.submit(
+            self._deflate_block, block, self._prev_tail, self.compresslevel
+        )
+        self._prev_tail = block[-self.DICT_SIZE :]
+        self._pending.append(fut)
+
+        # bound the amount of data held in memory by in-flight blocks
+        self._drain(2 * self.workers)
+
+    def _drain(self, max_pending: int):
+        while len(self._pending) > max_pending:
+            self.f_out.write(self._pending.pop(0).result())
+
+    @staticmethod
+    def _deflate_block(block: bytes, zdict: bytes, compresslevel: int) -> bytes:
+        if zdict:
+            c = zlib.compressobj(
+                compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=zdict
+            )
+        else:
+            c = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+
+        return c.compress(block) + c.flush(zlib.Z_SYNC_FLUSH)
+
+
 # Exceptions ------------------------------------------------------------------
 
 
@@ -56,10 +168,16 @@ class RsConnectApiMissingContentError(RsConnectApiError):
     pass
 
 
+class RsConnectApiTimeoutError(RsConnectApiError):
+    pass
+
+
 # Data ------------------------------------------------------------------------
 
 
 class BaseEntity(Mapping):
+    __slots__ = ("_d",)
+
     def __init__(self, d: Mapping):
         self._d = d
 
@@ -83,6 +201,8 @@ class BaseEntity(Mapping):
 
 
 class User(BaseEntity):
+    __slots__ = ()
+
     def get_id(self) -> str:
         return self._d["guid"]
 
@@ -91,6 +211,8 @@ class User(BaseEntity):
 
 
 class Content(BaseEntity):
+    __slots__ = ()
+
     def get_id(self) -> str:
         return self._d["guid"]
 
@@ -99,6 +221,8 @@ class Content(BaseEntity):
 
 
 class Bundle(BaseEntity):
+    __slots__ = ()
+
     def get_id(self) -> str:
         return self._d["id"]
 
@@ -107,6 +231,8 @@ class Bundle(BaseEntity):
 
 
 class Task(BaseEntity):
+    __slots__ = ()
+
     def get_id(self) -> str:
         return self._d["id"]
 
@@ -135,15 +261,20 @@ class RsConnectApi:
     api_key: str | None
     server_url: str
 
+    # number of threads used to gzip bundles. None uses tarfile's single-threaded gzip.
+    compress_workers: int | None = None
+
     def __init__(
         self,
         server_url: str | None = os.getenv("CONNECT_SERVER"),
         api_key: str | None = os.getenv("CONNECT_API_KEY"),
         session: requests.Session | None = None,
+        compress_workers: int | None = None,
     ):
         self.server_url = server_url
         self.api_key = api_key
         self.session = requests.Session() if session is None else session
+        self.compress_workers = compress_workers
 
     # utility functions -------------------------------------------------------
 
@@ -230,7 +361,17 @@ class RsConnectApi:
         headers = self._get_headers()
 
         _log.debug(f"RSConnect API {method}: {url} -- {kwargs}")
-        r = self.session.request(method, url, headers=headers, **kwargs)
+        with span("rsc_query", method=method, url=url) as s:
+            r = self.session.request(method, url, headers=headers, **kwargs)
+
+            if s.active:
+                # streamed responses are timed until their headers arrive
+                size = r.headers.get("content-length")
+                if size is not None:
+                    s.bytes = int(size)
+                elif not kwargs.get("stream"):
+                    s.bytes = len(r.content)
+
         if return_request:
             return r
         else:
@@ -299,7 +440,9 @@ class RsConnectApi:
 
     # content ----
 
-    def get_content(self, owner_guid: str = None, name: str = None) -> Sequence[Content]:
+    def get_content(
+        self, owner_guid: str = None, name: str = None, include: str = None
+    ) -> Sequence[Content]:
         params = self._get_params(locals())
 
         results = self.query_v1("content", params=params)
@@ -366,10 +509,31 @@ class RsConnectApi:
         r.raise_for_status()
         _download_file(r, f_obj)
 
-    def post_content_bundle(self, guid, fname, gzip=True) -> Bundle:
+    def post_content_bundle(
+        self, guid, fname, gzip=True, compress_workers: int | None = None
+    ) -> Bundle:
+        """Upload a file or directory as a new content bundle.
+
+        Parameters
+        ----------
+        guid:
+            The content guid to create the bundle for.
+        fname:
+            Path to a bundle archive, or to a directory to archive.
+        gzip:
+            Whether to archive and gzip a directory before uploading it.
+        compress_workers:
+            Number of threads used to gzip the archive. Defaults to the
+            compress_workers set on this object, then the PINS_COMPRESS_WORKERS
+            environment variable. If none are set, gzip runs on a single core.
+        """
+
         route = f"content/{guid}/bundles"
         f_request = partial(self.query_v1, route, "POST")
 
+        if compress_workers is None:
+            compress_workers = get_compress_workers(self.compress_workers)
+
         p = Path(fname)
         if p.is_dir() and gzip:
             import tarfile
@@ -377,8 +541,14 @@ class RsConnectApi:
             with tempfile.TemporaryDirectory() as tmp_dir:
                 p_archive = Path(tmp_dir) / "bundle.tar.gz"
 
-                with tarfile.open(p_archive, mode="w:gz") as tar:
-                    tar.add(str(p.absolute()), arcname="")
+                if compress_workers is None:
+                    with tarfile.open(p_archive, mode="w:gz") as tar:
+                        tar.add(str(p.absolute()), arcname="")
+                else:
+                    with open(p_archive, "wb") as f_archive:
+                        with _ParallelGzipWriter(f_archive, compress_workers) as f_gz:
+                            with tarfile.open(fileobj=f_gz, mode="w") as tar:
+                                tar.add(str(p.absolute()), arcname="")
 
                 with open(p_archive, "rb") as f:
                     result = f_request(data=f)
@@ -396,14 +566,59 @@ class RsConnectApi:
 
         return self.query_v1(f"tasks/{id}", params=params)
 
-    def poll_tasks(self, id: str, first: int = None, wait: int = 1) -> Task:
-        """Poll a task until complete."""
+    def poll_tasks(
+        self,
+        id: str,
+        first: int = None,
+        wait: int | None = None,
+        timeout: float | None = None,
+        on_output: Callable[[str], None] | None = None,
+    ) -> Task:
+        """Poll a task until complete.
+
+        Parameters
+        ----------
+        id:
+            The task id.
+        first:
+            The first line of task output to fetch.
+        wait:
+            Seconds the server may hold each request open waiting for new output.
+            If None, start by returning immediately, and back off (up to
+            MAX_TASK_WAIT seconds) while the task produces no new output.
+        timeout:
+            Seconds to wait for the task to finish, before raising an
+            RsConnectApiTimeoutError. If None, wait indefinitely.
+        on_output:
+            A function called on each line of task output, as it arrives.
+        """
 
-        json = self.get_tasks(id, first, wait)
-        while not json["finished"]:
-            json = self.get_tasks(id, json["last"], wait)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        crnt_wait = 0 if wait is None else wait
 
-        return json
+        json = self.get_tasks(id, first, crnt_wait)
+        while True:
+            output = json.get("output") or []
+            if on_output is not None:
+                for line in output:
+                    on_output(line)
+
+            if json["finished"]:
+                return json
+
+            if wait is None:
+                # new output suggests more is coming soon, otherwise back off
+                crnt_wait = 1 if output else min(max(1, 2 * crnt_wait), MAX_TASK_WAIT)
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise RsConnectApiTimeoutError(
+                        f"Task {id} did not finish within {timeout} seconds."
+                    )
+                crnt_wait = min(crnt_wait, math.ceil(remaining))
+
+            json = self.get_tasks(id, json["last"], crnt_wait)
 
     # non-api endpointsmisc ----
 
@@ -424,10 +639,17 @@ class RsConnectApi:
         _download_file(r, f_obj)
 
     def misc_get_applications(
-        self, filter: str, count: int = 1000, search: str = None
+        self,
+        filter: str,
+        count: int = 1000,
+        search: str = None,
+        start: int = None,
+        cont: str = None,
     ) -> Paginated[Sequence[Content]]:
-        # TODO(question): R pins does not handle pagination, but we could do it here.
-        #       Note that R pins also just gets first 1000 entries
+        """Fetch a single page of content from the applications endpoint.
+
+        See misc_walk_applications to fetch all pages.
+        """
         raw_params = self._get_params(locals())
         params = urlencode(raw_params, safe=":+")
         result = self.query("applications", params=params)
@@ -436,6 +658,30 @@ class RsConnectApi:
             {k: v for k, v in result.items() if k != "applications"},
         )
 
+    def misc_walk_applications(
+        self, filter: str, count: int = 1000, search: str = None
+    ) -> Iterator[Paginated[Sequence[Content]]]:
+        """Lazily fetch every page of content from the applications endpoint.
+
+        Pages are only requested as the generator is iterated, so stopping early
+        avoids fetching the remaining pages.
+        """
+
+        n_seen = 0
+        page = self.misc_get_applications(filter, count, search)
+
+        while page.results:
+            yield page
+
+            n_seen += len(page.results)
+            total = page.cursor.get("total")
+            if total is not None and n_seen >= total:
+                break
+
+            page = self.misc_get_applications(
+                filter, count, search, start=n_seen, cont=page.cursor.get("continuation")
+            )
+
 
 # ported from github.com/rstudio/connectapi
 # TODO: no longer used here, only in other packages' test suites.
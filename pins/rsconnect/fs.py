@@ -367,12 +367,14 @@ class RsConnectFs(AbstractFileSystem):
 
         # note this sequence of ifs is essentially a case statement going down
         # a line from parent -> child -> grandchild
-        if isinstance(parsed, UserPath):
+        if isinstance(parsed, ContentPath) and parsed.username in self._user_name_cache:
+            # a user's guid never changes, so skip fetching the user
+            user_guid = self._user_name_cache[parsed.username]
+        else:
             crnt = user = self._get_user_from_name(parsed.username)
-
-        if isinstance(parsed, ContentPath):
             user_guid = user["guid"]
 
+        if isinstance(parsed, ContentPath):
             # user_guid + content name should uniquely identify content, but
             # double check to be safe.
             crnt = content = self._get_content_from_name(user_guid, parsed.content)
@@ -1,5 +1,6 @@
 import os
 import tempfile
+from http.server import ThreadingHTTPServer
 from pathlib import Path
 
 import pytest
@@ -9,6 +10,7 @@ from pytest import mark as m
 from pins.tests.helpers import (
     BoardBuilder,
     DbcBoardBuilder,
+    ETagHandler,
     RscBoardBuilder,
     Snapshot,
     rm_env,
@@ -86,5 +88,21 @@ def tmp_data_dir():
             yield Path(tmp_dir)
 
 
+@pytest.fixture
+def http_dir(tmp_path):
+    import threading
+    from functools import partial
+
+    p_served = tmp_path / "served"
+    p_served.mkdir()
+
+    ETagHandler.requests = []
+    handler = partial(ETagHandler, directory=str(p_served))
+    with ThreadingHTTPServer(("127.0.0.1", 0), handler) as server:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        yield p_served, f"http://127.0.0.1:{server.server_address[1]}"
+        server.shutdown()
+
+
 def pytest_addoption(parser):
     parser.addoption("--snapshot-update", action="store_true")
@@ -1,20 +1,32 @@
+import asyncio
 import contextlib
 import functools
+import io
+import itertools
 import json
 import os
+import re
 import shutil
+import tarfile
+import threading
+import urllib.parse
 import uuid
 from datetime import datetime
 from functools import wraps
+from http.server import SimpleHTTPRequestHandler
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import pytest
+import requests
 from fsspec import filesystem
+from fsspec.asyn import AsyncFileSystem
+from fsspec.implementations.local import LocalFileSystem
 from importlib_resources import files
 
 from pins.boards import BaseBoard, BoardRsConnect
 from pins.constructors import board_databricks
+from pins.rsconnect.api import RSC_CODE_OBJECT_DOES_NOT_EXIST
 
 DEFAULT_CREATION_DATE = datetime(2020, 1, 13, 23, 58, 59)
 
@@ -278,6 +290,554 @@ class DbcBoardBuilder(BoardBuilder):
         # board.fs.rm(self.current_board.board)
 
 
+# Mock Posit Connect ==========================================================
+
+
+class _MockRaw(io.BytesIO):
+    # requests' raw response reads accept a decode_content argument
+    def read(self, *args, decode_content=False):
+        return super().read(*args)
+
+
+class MockResponse:
+    def __init__(self, status_code=200, data=None, content=None):
+        self.status_code = status_code
+        self._data = data
+        self.content = content if content is not None else b""
+        self.raw = _MockRaw(self.content)
+        self.headers = {}
+
+    def json(self):
+        if self._data is None:
+            raise requests.JSONDecodeError("No json in response", "", 0)
+        return self._data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error")
+
+
+class MockRsConnectSession:
+    """A stand-in for requests.Session, which serves an in-memory Posit Connect.
+
+    It supports just enough of the API for pins to read and write content, and
+    records every request made in .requests, as (method, path, query) tuples.
+    """
+
+    server_url = "http://connect.mock"
+
+    # the largest page the applications endpoint will return
+    max_page_size = 1000
+
+    # number of times a deploy task is polled before it finishes
+    task_polls = 1
+
+    def __init__(self):
+        self.cookies = {}
+        self.requests = []
+
+        self.users = {}
+        self.content = {}
+        self.bundles = {}
+        self.tasks = {}
+        self.current_user = None
+
+        self._ids = itertools.count(1)
+        self._routes = [
+            ("GET", r"__ping__", self._get_ping),
+            ("GET", r"__api__/applications", self._get_applications),
+            ("GET", r"__api__/v1/user", self._get_user),
+            ("GET", r"__api__/v1/users", self._get_users),
+            ("GET", r"__api__/v1/users/([^/]+)", self._get_user),
+            ("GET", r"__api__/v1/content", self._get_content),
+            ("POST", r"__api__/v1/content", self._post_content),
+            ("GET", r"__api__/v1/content/([^/]+)", self._get_content_item),
+            ("PATCH", r"__api__/v1/content/([^/]+)", self._patch_content_item),
+            ("DELETE", r"__api__/v1/content/([^/]+)", self._delete_content_item),
+            ("POST", r"__api__/v1/content/([^/]+)/deploy", self._post_deploy),
+            ("GET", r"__api__/v1/content/([^/]+)/bundles", self._get_bundles),
+            ("POST", r"__api__/v1/content/([^/]+)/bundles", self._post_bundle),
+            ("GET", r"__api__/v1/content/([^/]+)/bundles/([^/]+)", self._get_bundle),
+            (
+                "DELETE",
+                r"__api__/v1/content/([^/]+)/bundles/([^/]+)",
+                self._delete_bundle,
+            ),
+            (
+                "GET",
+                r"__api__/v1/content/([^/]+)/bundles/([^/]+)/download",
+                self._get_bundle_download,
+            ),
+            ("GET", r"__api__/v1/tasks/([^/]+)", self._get_task),
+            ("GET", r"content/([^/]+)/_rev([^/]+)/(.+)", self._get_bundle_file),
+        ]
+
+    # state -------------------------------------------------------------------
+
+    def _new_id(self) -> str:
+        return str(next(self._ids))
+
+    def add_user(self, username: str) -> dict:
+        user = {"guid": f"user-{self._new_id()}", "username": username}
+        self.users[user["guid"]] = user
+
+        if self.current_user is None:
+            self.current_user = user
+
+        return user
+
+    def count_requests(self, method=None) -> int:
+        return len([r for r in self.requests if method is None or r[0] == method])
+
+    # requests.Session interface ----------------------------------------------
+
+    def request(
+        self, method, url, headers=None, params=None, json=None, data=None, **kwargs
+    ):
+        parsed = urllib.parse.urlsplit(url)
+        path = parsed.path.lstrip("/")
+
+        if isinstance(params, str):
+            query = dict(urllib.parse.parse_qsl(params))
+        else:
+            query = {k: str(v) for k, v in (params or {}).items()}
+
+        self.requests.append((method, path, query))
+
+        for route_method, pattern, handler in self._routes:
+            match = re.fullmatch(pattern, path)
+            if route_method == method and match:
+                if hasattr(data, "read"):
+                    data = data.read()
+                return handler(*match.groups(), query=query, body=json, data=data)
+
+        return MockResponse(404, {"code": 1, "error": f"Unknown route: {method} {path}"})
+
+    # handlers ----------------------------------------------------------------
+
+    @staticmethod
+    def _missing(kind, id_):
+        return MockResponse(
+            404, {"code": RSC_CODE_OBJECT_DOES_NOT_EXIST, "error": f"No {kind}: {id_}"}
+        )
+
+    def _get_ping(self, **kwargs):
+        return MockResponse(200, {})
+
+    def _get_user(self, guid=None, **kwargs):
+        if guid is None:
+            return MockResponse(200, self.current_user)
+        if guid not in self.users:
+            return self._missing("user", guid)
+        return MockResponse(200, self.users[guid])
+
+    def _get_users(self, query, **kwargs):
+        prefix = query.get("prefix", "")
+        page_number = int(query.get("page_number", 1))
+        results = [u for u in self.users.values() if u["username"].startswith(prefix)]
+
+        # all results fit on the first page
+        return MockResponse(
+            200,
+            {
+                "results": results if page_number == 1 else [],
+                "current_page": page_number,
+                "total": len(results),
+            },
+        )
+
+    def _get_content(self, query, **kwargs):
+        results = []
+        for cont in self.content.values():
+            if "owner_guid" in query and cont["owner_guid"] != query["owner_guid"]:
+                continue
+            if "name" in query and cont["name"] != query["name"]:
+                continue
+
+            if "owner" in query.get("include", ""):
+                cont = {**cont, "owner": self.users[cont["owner_guid"]]}
+
+            results.append(cont)
+
+        return MockResponse(200, results)
+
+    def _post_content(self, body, **kwargs):
+        owner = self.current_user
+        for cont in self.content.values():
+            if cont["owner_guid"] == owner["guid"] and cont["name"] == body["name"]:
+                return MockResponse(409, {"code": 26, "error": "Content name in use"})
+
+        guid = f"content-{self._new_id()}"
+        cont = {
+            "guid": guid,
+            "name": body["name"],
+            "title": body.get("title") or None,
+            "description": body.get("description", ""),
+            "access_type": body.get("access_type", "acl"),
+            "owner_guid": owner["guid"],
+            "content_category": "",
+            "bundle_id": None,
+            "content_url": f"{self.server_url}/content/{guid}/",
+        }
+        self.content[guid] = cont
+        self.bundles[guid] = {}
+
+        return MockResponse(200, cont)
+
+    def _get_content_item(self, guid, **kwargs):
+        if guid not in self.content:
+            return self._missing("content", guid)
+        return MockResponse(200, self.content[guid])
+
+    def _patch_content_item(self, guid, body, **kwargs):
+        if guid not in self.content:
+            return self._missing("content", guid)
+        self.content[guid].update(body)
+        return MockResponse(200, self.content[guid])
+
+    def _delete_content_item(self, guid, **kwargs):
+        if guid not in self.content:
+            return self._missing("content", guid)
+        del self.content[guid]
+        del self.bundles[guid]
+        return MockResponse(204)
+
+    def _get_bundles(self, guid, **kwargs):
+        if guid not in self.content:
+            return self._missing("content", guid)
+        return MockResponse(200, [b["meta"] for b in self.bundles[guid].values()])
+
+    def _post_bundle(self, guid, data, **kwargs):
+        if guid not in self.content:
+            return self._missing("content", guid)
+
+        files = {}
+        with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as tar:
+            for member in tar.getmembers():
+                if member.isfile():
+                    files[member.name] = tar.extractfile(member).read()
+
+        bundle_id = self._new_id()
+        meta = {
+            "id": bundle_id,
+            "content_guid": guid,
+            "created_time": datetime.now().isoformat(),
+            "size": len(data),
+            "active": False,
+        }
+        self.bundles[guid][bundle_id] = {"meta": meta, "files": files, "archive": data}
+
+        return MockResponse(200, meta)
+
+    def _get_bundle(self, guid, id, **kwargs):
+        if guid not in self.bundles or id not in self.bundles[guid]:
+            return self._missing("bundle", id)
+        return MockResponse(200, self.bundles[guid][id]["meta"])
+
+    def _delete_bundle(self, guid, id, **kwargs):
+        if guid not in self.bundles or id not in self.bundles[guid]:
+            return self._missing("bundle", id)
+        if self.bundles[guid][id]["meta"]["active"]:
+            return MockResponse(400, {"code": 75, "error": "Cannot delete active bundle"})
+        del self.bundles[guid][id]
+        return MockResponse(204)
+
+    def _get_bundle_download(self, guid, id, **kwargs):
+        if guid not in self.bundles or id not in self.bundles[guid]:
+            return self._missing("bundle", id)
+        return MockResponse(200, content=self.bundles[guid][id]["archive"])
+
+    def _post_deploy(self, guid, body, **kwargs):
+        if guid not in self.content:
+            return self._missing("content", guid)
+
+        bundle_id = body["bundle_id"]
+        for bundle in self.bundles[guid].values():
+            bundle["meta"]["active"] = bundle["meta"]["id"] == bundle_id
+
+        files = self.bundles[guid][bundle_id]["files"]
+        manifest = json.loads(files.get("manifest.json", b"{}"))
+        category = manifest.get("metadata", {}).get("content_category", "")
+        self.content[guid].update(bundle_id=bundle_id, content_category=category)
+
+        task_id = f"task-{self._new_id()}"
+        self.tasks[task_id] = {
+            "id": task_id,
+            "output": [],
+            "finished": False,
+            "code": 0,
+            "error": "",
+            "last": 0,
+            "polls_left": self.task_polls,
+        }
+        return MockResponse(200, {"task_id": task_id})
+
+    def _get_task(self, id, query, **kwargs):
+        if id not in self.tasks:
+            return self._missing("task", id)
+
+        # each poll produces a line of output, until the task finishes
+        task = self.tasks[id]
+        if not task["finished"]:
+            task["polls_left"] -= 1
+            task["output"].append(f"Deploying bundle, step {len(task['output']) + 1}")
+            task["finished"] = task["polls_left"] <= 0
+            task["last"] = len(task["output"])
+
+        first = int(query.get("first", 0))
+        data = {k: v for k, v in task.items() if k != "polls_left"}
+        return MockResponse(200, {**data, "output": task["output"][first:]})
+
+    def _get_applications(self, query, **kwargs):
+        pins = [
+            cont
+            for cont in self.content.values()
+            if cont["content_category"] == "pin"
+            if query.get("search", "") in cont["name"]
+        ]
+
+        start = int(query.get("start", 0))
+        count = min(int(query.get("count", 1000)), self.max_page_size)
+        page = pins[start : start + count]
+
+        apps = [
+            {**cont, "owner_username": self.users[cont["owner_guid"]]["username"]}
+            for cont in page
+        ]
+        return MockResponse(
+            200,
+            {
+                "applications": apps,
+                "count": len(apps),
+                "total": len(pins),
+                "continuation": start + len(apps),
+            },
+        )
+
+    def _get_bundle_file(self, guid, id, fname, **kwargs):
+        try:
+            content = self.bundles[guid][id]["files"][fname]
+        except KeyError:
+            return MockResponse(404)
+
+        return MockResponse(200, content=content)
+
+
+# Mock Databricks =============================================================
+
+
+class MockDatabricksFiles:
+    """An in-memory stand-in for the Databricks sdk's Files API.
+
+    Directories are created implicitly when uploading a file, and every call is
+    recorded in .calls as a (method, path) tuple.
+    """
+
+    def __init__(self):
+        self.files = {}
+        self.dirs = set()
+        self.calls = []
+        self.upload_types = set()
+        self.threads = set()
+
+        self._lock = threading.Lock()
+
+    def _record(self, method, path):
+        with self._lock:
+            self.calls.append((method, path))
+            self.threads.add(threading.get_ident())
+
+    def count_calls(self, method=None):
+        return len([call for call in self.calls if method in (None, call[0])])
+
+    @staticmethod
+    def _norm(path):
+        return "/" + str(path).strip("/")
+
+    @staticmethod
+    def _not_found(path):
+        from databricks.sdk.errors import NotFound
+
+        return NotFound(f"No such file or directory: {path}")
+
+    def _add_parents(self, path):
+        parent = os.path.dirname(path)
+        while parent not in ("/", ""):
+            self.dirs.add(parent)
+            parent = os.path.dirname(parent)
+
+    def upload(self, file_path, contents, *, overwrite=None):
+        self._record("upload", file_path)
+        path = self._norm(file_path)
+
+        data = contents.read()
+        with self._lock:
+            self.upload_types.add(type(contents))
+            if path in self.files and not overwrite:
+                from databricks.sdk.errors import AlreadyExists
+
+                raise AlreadyExists(f"File already exists: {file_path}")
+
+            self.files[path] = data
+            self._add_parents(path)
+
+    def download(self, file_path):
+        from databricks.sdk.service.files import DownloadResponse
+
+        self._record("download", file_path)
+        path = self._norm(file_path)
+        if path not in self.files:
+            raise self._not_found(file_path)
+
+        return DownloadResponse(contents=io.BytesIO(self.files[path]))
+
+    def get_metadata(self, file_path):
+        self._record("get_metadata", file_path)
+        if self._norm(file_path) not in self.files:
+            raise self._not_found(file_path)
+
+    def get_directory_metadata(self, directory_path):
+        self._record("get_directory_metadata", directory_path)
+        if self._norm(directory_path) not in self.dirs:
+            raise self._not_found(directory_path)
+
+    def list_directory_contents(self, directory_path):
+        from databricks.sdk.service.files import DirectoryEntry
+
+        self._record("list_directory_contents", directory_path)
+        path = self._norm(directory_path)
+        if path not in self.dirs:
+            raise self._not_found(directory_path)
+
+        with self._lock:
+            entries = [
+                DirectoryEntry(path=f"{p}/", name=os.path.basename(p), is_directory=True)
+                for p in sorted(self.dirs)
+                if os.path.dirname(p) == path
+            ]
+            entries.extend(
+                DirectoryEntry(
+                    path=p,
+                    name=os.path.basename(p),
+                    is_directory=False,
+                    file_size=len(data),
+                )
+                for p, data in sorted(self.files.items())
+                if os.path.dirname(p) == path
+            )
+
+        # the sdk returns an iterator, which pages through results
+        return iter(entries)
+
+    def create_directory(self, directory_path):
+        self._record("create_directory", directory_path)
+        path = self._norm(directory_path)
+        with self._lock:
+            self.dirs.add(path)
+            self._add_parents(path)
+
+    def delete(self, file_path):
+        self._record("delete", file_path)
+        with self._lock:
+            if self.files.pop(self._norm(file_path), None) is None:
+                raise self._not_found(file_path)
+
+    def delete_directory(self, directory_path):
+        from databricks.sdk.errors import BadRequest
+
+        self._record("delete_directory", directory_path)
+        path = self._norm(directory_path)
+        with self._lock:
+            if path not in self.dirs:
+                raise self._not_found(directory_path)
+
+            children = [p for p in [*self.files, *self.dirs] if p.startswith(path + "/")]
+            if children:
+                raise BadRequest(f"Directory is not empty: {directory_path}")
+
+            self.dirs.remove(path)
+
+
+class MockWorkspaceClient:
+    """A stand-in for databricks.sdk.WorkspaceClient, with only a files API."""
+
+    def __init__(self, files=None):
+        self.files = MockDatabricksFiles() if files is None else files
+
+
+# Async filesystem ============================================================
+
+
+class AsyncLocalFileSystem(AsyncFileSystem):
+    """A local filesystem with coroutine methods, like s3fs or gcsfs.
+
+    It records the greatest number of requests that were in flight at once.
+    """
+
+    protocol = "async-file"
+    root_marker = "/"
+
+    # separate instances, so that request counts are not shared
+    cachable = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.local = LocalFileSystem()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @contextlib.asynccontextmanager
+    async def _request(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # give other requests a chance to start, as a network call would
+            await asyncio.sleep(0)
+            yield
+        finally:
+            self.in_flight -= 1
+
+    async def _info(self, path, **kwargs):
+        async with self._request():
+            return self.local.info(path)
+
+    async def _ls(self, path, detail=True, **kwargs):
+        async with self._request():
+            return self.local.ls(path, detail=detail)
+
+    async def _cat_file(self, path, start=None, end=None, **kwargs):
+        async with self._request():
+            return self.local.cat_file(path, start=start, end=end)
+
+    async def _pipe_file(self, path, value, **kwargs):
+        async with self._request():
+            self.local.pipe_file(path, value)
+
+    async def _put_file(self, lpath, rpath, **kwargs):
+        async with self._request():
+            self.local.put_file(lpath, rpath)
+
+    async def _get_file(self, rpath, lpath, **kwargs):
+        async with self._request():
+            self.local.get_file(rpath, lpath)
+
+    async def _mkdir(self, path, create_parents=True, **kwargs):
+        self.local.mkdir(path, create_parents=create_parents)
+
+    async def _makedirs(self, path, exist_ok=False):
+        self.local.makedirs(path, exist_ok=exist_ok)
+
+    async def _rm_file(self, path, **kwargs):
+        self.local.rm_file(path)
+
+    async def _rm(self, path, recursive=False, **kwargs):
+        self.local.rm(path, recursive=recursive)
+
+    def _open(self, path, mode="rb", **kwargs):
+        return self.local._open(path, mode=mode, **kwargs)
+
+
 # Snapshot ====================================================================
 
 
@@ -348,3 +908,29 @@ def rm_env(*args):
     finally:
         os.environ.clear()
         os.environ.update(old_environ)
+
+
+class ETagHandler(SimpleHTTPRequestHandler):
+    """Serves files, answering requests with a matching ETag with a 304."""
+
+    requests = []
+
+    def do_GET(self):
+        p_file = Path(self.translate_path(self.path))
+        etag = f'"{p_file.stat().st_mtime_ns}"'
+        self.requests.append(self.headers.get("If-None-Match"))
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = p_file.read_bytes()
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
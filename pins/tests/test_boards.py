@@ -13,7 +13,12 @@ import pytest
 from pytest_cases import fixture, parametrize
 
 from pins.config import PINS_ENV_INSECURE_READ
-from pins.errors import PinsError, PinsInsecureReadError, PinsVersionError
+from pins.errors import (
+    PinsError,
+    PinsHashError,
+    PinsInsecureReadError,
+    PinsVersionError,
+)
 from pins.meta import MetaRaw
 from pins.tests.helpers import DEFAULT_CREATION_DATE, rm_env, skip_if_dbc
 
@@ -627,6 +632,31 @@ def test_board_pin_search_name(board, df, search, matches):
     assert sorted_meta_names == sorted(matches)
 
 
+# pin_read_many ---------------------------------------------------------------
+
+
+@skip_if_dbc
+def test_board_pin_read_many(board, df):
+    names = ["x", "y"]
+    if board.fs.protocol == "rsc":
+        names = ["derek/" + name for name in names]
+
+    meta = board.pin_write(df, names[0], type="csv")
+    board.pin_write(df.assign(z=1), names[1], type="csv")
+
+    missing = names[1] + "-missing"
+    res = board.pin_read_many([*names, missing], max_workers=2)
+
+    assert list(res) == [*names, missing]
+    assert res[names[0]].equals(df)
+    assert res[names[1]].equals(df.assign(z=1))
+    assert isinstance(res[missing], PinsError)
+
+    metas = board.pin_meta_many(names, {names[0]: meta.version.version})
+    assert metas[names[0]].version.version == meta.version.version
+    assert metas[names[1]].name == names[1]
+
+
 # BaseBoard specific ==========================================================
 
 from pins.boards import BaseBoard  # noqa
@@ -660,6 +690,406 @@ def test_board_base_pin_meta_cache_touch(tmp_path: Path, df):
     assert orig_access < new_access
 
 
+def _fail_on_call(*args, **kwargs):
+    raise AssertionError("Unexpected filesystem call")
+
+
+def _cached_board(tmp_path: Path, name: str = "board", **kwargs) -> BaseBoard:
+    """Return a board in tmp_path / name, cached in tmp_path / "cache"."""
+
+    (tmp_path / name).mkdir(exist_ok=True)
+    kwargs.setdefault("cache_storage", str(tmp_path / "cache"))
+    cache = fsspec.filesystem(
+        "pinscache",
+        target_protocol="file",
+        same_names=True,
+        hash_prefix=str(tmp_path / name),
+        **kwargs,
+    )
+    return BaseBoard(str(tmp_path / name), fs=cache)
+
+
+def test_board_base_pin_meta_memoized(tmp_path: Path, df, monkeypatch):
+    board = BaseBoard(str(tmp_path), fs=fsspec.filesystem("file"))
+
+    meta = board.pin_write(df, "some_df", type="csv")
+    v = meta.version.version
+    board.pin_read("some_df", v)
+
+    # versions do not change, so their metadata is not read again
+    monkeypatch.setattr(board.fs, "exists", _fail_on_call)
+    monkeypatch.setattr(board.fs, "open", _fail_on_call)
+
+    meta2 = board.pin_meta("some_df", v)
+    assert meta2.pin_hash == meta.pin_hash
+
+    # changes to the returned metadata do not affect later calls
+    meta2.title = "changed"
+    assert board.pin_meta("some_df", v).title == meta.title
+
+
+def test_board_base_pin_meta_memoized_local_cache(tmp_path: Path, df, monkeypatch):
+    from pins.cache import meta_cache
+
+    board = _cached_board(tmp_path)
+
+    v = board.pin_write(df, "some_df", type="csv").version.version
+    board.pin_meta("some_df", v)
+    meta_cache.clear()
+
+    # the metadata file is already in the cache directory, so it is read from there
+    monkeypatch.setattr(board.fs.fs, "exists", _fail_on_call)
+    monkeypatch.setattr(board.fs.fs, "open", _fail_on_call)
+    monkeypatch.setattr(board.fs.fs, "_open", _fail_on_call)
+
+    assert board.pin_meta("some_df", v).version.version == v
+
+
+def test_board_base_pin_meta_memoized_relative_path(tmp_path: Path, df, monkeypatch):
+    created = datetime(2020, 1, 1)
+
+    boards = {}
+    for title in ["a", "b"]:
+        (tmp_path / title).mkdir()
+        monkeypatch.chdir(tmp_path / title)
+
+        boards[title] = BaseBoard("board", fs=fsspec.filesystem("file"))
+        meta = boards[title].pin_write(df, "x", type="csv", title=title, created=created)
+        v = meta.version.version
+
+    # the same relative path names a different board from each directory
+    assert boards["b"].pin_meta("x", v).title == "b"
+
+    monkeypatch.chdir(tmp_path / "a")
+    assert boards["a"].pin_meta("x", v).title == "a"
+
+
+def test_board_base_pin_meta_many_one_listing(tmp_path: Path, df, monkeypatch):
+    board = BaseBoard(str(tmp_path), fs=fsspec.filesystem("file"))
+    v = board.pin_write(df, "x", type="csv").version.version
+    board.pin_write(df, "y", type="csv")
+
+    # existence is checked from a single listing of the board
+    monkeypatch.setattr(board.fs, "exists", _fail_on_call)
+
+    metas = board.pin_meta_many(["x", "y", "z"], [v, None, None])
+    assert metas["x"].version.version == v
+    assert metas["y"].name == "y"
+    assert isinstance(metas["z"], PinsError)
+
+    metas = board.pin_meta_many(["x"], ["20200101T000000Z-abcde"])
+    assert isinstance(metas["x"], PinsError)
+
+    with pytest.raises(ValueError):
+        board.pin_meta_many(["x", "y"], [v])
+
+
+def test_board_base_cache_stats(tmp_path: Path, df):
+    from pins.cache import CACHE_STATS_FILE, meta_cache
+
+    board = _cached_board(tmp_path, persist_stats=True)
+
+    board.pin_write(df, "some_df", type="csv")
+    board.pin_read("some_df")
+    meta_cache.clear()
+    board.pin_read("some_df")
+
+    stats = board.cache_stats(reset=True)
+
+    # metadata and data files are each fetched once, then read from the cache
+    assert (stats["hits"], stats["misses"]) == (2, 2)
+    assert stats["bytes_fetched"] == stats["bytes_served"] > 0
+    assert list(stats["pins"]) == ["some_df"]
+
+    assert board.cache_stats()["hits"] == 0
+    assert (tmp_path / "cache" / CACHE_STATS_FILE).exists()
+
+    assert BaseBoard(str(tmp_path), fs=fsspec.filesystem("file")).cache_stats() is None
+
+
+def test_board_base_pin_prefetch(tmp_path: Path, df, monkeypatch):
+    from pins.cache import meta_cache
+
+    board = _cached_board(tmp_path)
+
+    board.pin_write(df, "x", type="csv")
+    board.pin_write(df, "y", type="csv")
+    meta_cache.clear()
+
+    res = board.pin_prefetch(["x", "y", "z"], max_workers=2)
+
+    assert isinstance(res["z"], PinsError)
+    for name in ["x", "y"]:
+        (fname,) = res[name]
+        assert Path(fname).is_file()
+        assert fname.startswith(str(tmp_path / "cache"))
+
+    # prefetching fetches every file, without reading the data
+    assert board.cache_stats()["hits"] == 0
+
+    # everything is now read from the cache
+    meta_cache.clear()
+    monkeypatch.setattr(board.fs.fs, "open", _fail_on_call)
+    monkeypatch.setattr(board.fs.fs, "_open", _fail_on_call)
+    monkeypatch.setattr(board.fs.fs, "get_file", _fail_on_call)
+
+    assert board.pin_read("x", board.pin_meta("x").version.version).equals(df)
+
+    future = board.pin_prefetch("x", wait=False)
+    assert list(future.result()) == ["x"]
+
+
+def test_board_base_pin_prefetch_no_cache(tmp_path: Path):
+    board = BaseBoard(str(tmp_path), fs=fsspec.filesystem("file"))
+
+    with pytest.raises(PinsError):
+        board.pin_prefetch(["x"])
+
+
+def test_board_base_offline(tmp_path: Path, df, monkeypatch):
+    from pins.cache import meta_cache
+
+    board = _cached_board(tmp_path)
+
+    v1 = board.pin_write(df, "x", type="csv", created=datetime(2020, 1, 1))
+    board.pin_read("x", v1.version.version)
+    board.pin_write(df.assign(y=1), "x", type="csv", created=datetime(2020, 1, 2))
+    board.pin_write(df, "y", type="csv")
+    meta_cache.clear()
+
+    # nothing is read from the board
+    for method in ["exists", "ls", "info", "open", "_open", "get_file", "ukey"]:
+        monkeypatch.setattr(board.fs.fs, method, _fail_on_call)
+    board.offline = True
+
+    # the latest version is the latest one in the cache
+    assert board.pin_exists("x")
+    assert not board.pin_exists("y")
+    assert [v.version for v in board.pin_versions("x", as_df=False)] == [
+        v1.version.version
+    ]
+    assert board.pin_meta("x").version.version == v1.version.version
+    assert board.pin_read("x").equals(df)
+
+    with pytest.raises(PinsError, match="offline"):
+        board.pin_read("y")
+
+    with pytest.raises(PinsError, match="offline"):
+        board.pin_meta("x", "20200102T000000Z-abcde")
+
+
+def test_board_base_offline_no_cache(tmp_path: Path, df, monkeypatch):
+    from pins import board_folder
+    from pins.config import PINS_ENV_OFFLINE
+
+    # boards without a cache are not affected by offline mode
+    monkeypatch.setenv(PINS_ENV_OFFLINE, "1")
+    board = board_folder(str(tmp_path))
+
+    board.pin_write(df, "x", type="csv")
+    assert board.pin_exists("x")
+    assert board.pin_read("x").equals(df)
+
+
+def test_board_base_cache_dedup(tmp_path: Path, df, monkeypatch):
+    from pins.cache import BLOB_DIR, cache_prune
+
+    def make_board(name):
+        return _cached_board(
+            tmp_path,
+            name,
+            cache_storage=str(tmp_path / "cache" / name),
+            dedup=True,
+            skip_instance_cache=True,
+        )
+
+    board_a, board_b = make_board("a"), make_board("b")
+    meta_a = board_a.pin_write(df, "x", type="csv")
+    meta_b = board_b.pin_write(df, "x", type="csv", title="a different title")
+
+    (p_a,) = board_a.pin_download("x")
+
+    # the identical file on board b is linked, rather than downloaded
+    board_b.pin_meta("x")
+    monkeypatch.setattr(board_b.fs.fs, "get_file", _fail_on_call)
+    (p_b,) = board_b.pin_download("x")
+
+    assert meta_a.pin_hash == meta_b.pin_hash
+    assert Path(p_a).stat().st_ino == Path(p_b).stat().st_ino
+    assert board_b.pin_read("x").equals(df)
+
+    blob_dir = tmp_path / "cache" / BLOB_DIR
+    assert meta_a.pin_hash in [p.name for p in blob_dir.iterdir()]
+
+    # the blob is deleted along with the last version that links to it
+    cache_prune(days=0, cache_root=str(tmp_path / "cache"), prompt=False)
+    assert list(blob_dir.iterdir()) == []
+
+
+def test_board_base_pin_download_many(tmp_path: Path, df, monkeypatch):
+    from fsspec.callbacks import Callback
+
+    board = _cached_board(tmp_path)
+
+    paths = []
+    for ii in range(4):
+        paths.append(tmp_path / f"data{ii}.csv")
+        df.assign(ii=ii).to_csv(paths[-1], index=False)
+
+    meta = board.pin_upload(paths, "x")
+
+    # the first download of each file fails
+    get_file = board.fs.fs.get_file
+    failed = set()
+
+    def flaky_get_file(rpath, lpath, **kwargs):
+        if rpath.endswith(".csv") and rpath not in failed:
+            failed.add(rpath)
+            raise ConnectionError("flaky")
+        return get_file(rpath, lpath, **kwargs)
+
+    monkeypatch.setattr(board.fs.fs, "get_file", flaky_get_file)
+    monkeypatch.setattr("pins.boards.DOWNLOAD_RETRY_WAIT", 0)
+
+    callback = Callback()
+    files = board.pin_download("x", max_workers=4, retries=1, callback=callback)
+
+    assert [Path(f).name for f in files] == meta.file
+    assert all(f.startswith(str(tmp_path / "cache")) for f in files)
+    assert (callback.size, callback.value) == (4, 4)
+
+    # errors are raised once files run out of retries
+    for f in files:
+        Path(f).unlink()
+    failed.clear()
+
+    with pytest.raises(ConnectionError):
+        board.pin_download("x")
+
+
+def test_board_base_verify_hash(tmp_path: Path, df):
+    board = BaseBoard(str(tmp_path), fs=fsspec.filesystem("file"))
+    meta = board.pin_write(df, "x", type="csv")
+
+    assert board.pin_read("x", hash=meta.pin_hash).equals(df)
+    assert board.pin_download("x", hash=meta.pin_hash[:5])
+
+    with pytest.raises(PinsHashError):
+        board.pin_read("x", hash="abc")
+
+    # a corrupt file on the board always fails
+    (tmp_path / "x" / meta.version.version / meta.file).write_text("y\n1\n")
+    board.verify_hash = True
+    with pytest.raises(PinsHashError):
+        board.pin_read("x")
+
+
+def test_board_base_verify_hash_read_once(tmp_path: Path, df, monkeypatch):
+    fs = fsspec.filesystem("file")
+    board = BaseBoard(str(tmp_path), fs=fs)
+    meta = board.pin_write(df, "x", type="csv")
+
+    opened = []
+    fs_open = fs.open
+
+    def open_counted(path, *args, **kwargs):
+        opened.append(path)
+        return fs_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(fs, "open", open_counted)
+
+    # without a cache, the file is downloaded once, then hashed and loaded
+    assert board.pin_read("x", hash=meta.pin_hash).equals(df)
+    assert len([p for p in opened if p.endswith(meta.file)]) == 1
+
+
+def test_board_base_verify_hash_cache(tmp_path: Path, df, monkeypatch):
+    board = _cached_board(tmp_path)
+    board.verify_hash = True
+
+    meta = board.pin_write(df, "x", type="csv")
+    (p_cached,) = board.pin_download("x")
+
+    # cached files are not read again to check them
+    with monkeypatch.context() as m:
+        m.setattr("pins.cache._hash_local_file", _fail_on_call)
+        assert board.pin_read("x", hash=meta.pin_hash).equals(df)
+
+    # corrupt cached files are fetched again
+    Path(p_cached).write_text("y\n1\n")
+    assert board.pin_read("x").equals(df)
+    assert Path(p_cached).read_text() == df.to_csv(index=False)
+
+
+def test_board_base_pin_meta_memoized_delete(tmp_path: Path, df):
+    board = BaseBoard(str(tmp_path), fs=fsspec.filesystem("file"))
+
+    meta_old = board.pin_write(df, "some_df", type="csv")
+    board.pin_write(df.assign(z=1), "some_df", type="csv")
+
+    v_old = meta_old.version.version
+    board.pin_meta("some_df", v_old)
+    board.pin_version_delete("some_df", v_old)
+
+    with pytest.raises(PinsError):
+        board.pin_meta("some_df", v_old)
+
+
+def test_board_base_pin_meta_latest_ttl(tmp_path: Path, df, monkeypatch):
+    board = BaseBoard(str(tmp_path), fs=fsspec.filesystem("file"))
+    board.latest_ttl = 60
+
+    board.pin_write(df, "some_df", type="csv", created=DEFAULT_CREATION_DATE)
+    v = board.pin_meta("some_df").version.version
+
+    # the latest version was seen recently, so versions are not listed
+    with monkeypatch.context() as m:
+        m.setattr(board.fs, "ls", _fail_on_call)
+        assert board.pin_meta("some_df").version.version == v
+
+    # writing through the board forgets the latest version
+    meta_new = board.pin_write(df.assign(z=1), "some_df", type="csv")
+    assert board.pin_meta("some_df").version.version == meta_new.version.version
+
+
+def test_board_base_pin_meta_latest_marker(tmp_path: Path, df, monkeypatch):
+    board = BaseBoard(str(tmp_path), fs=fsspec.filesystem("file"))
+    board.latest_marker = True
+
+    p_marker = tmp_path / "some_df" / board.latest_marker_name
+
+    meta_new = board.pin_write(df, "some_df", type="csv")
+    v_new = meta_new.version.version
+
+    # an older version does not move the marker back
+    v_old = board.pin_write(
+        df.assign(z=1), "some_df", type="csv", created=DEFAULT_CREATION_DATE
+    ).version.version
+
+    assert p_marker.read_text() == v_new
+    assert len(board.pin_versions("some_df")) == 2
+
+    with monkeypatch.context() as m:
+        m.setattr(board.fs, "ls", _fail_on_call)
+        assert board.pin_meta("some_df").version.version == v_new
+
+    # deleting the latest version removes the marker
+    board.pin_version_delete("some_df", v_new)
+    assert not p_marker.exists()
+    assert board.pin_meta("some_df").version.version == v_old
+
+
+def test_board_base_pin_write_unversioned_no_parse(tmp_path: Path, df, monkeypatch):
+    board = BaseBoard(str(tmp_path), fs=fsspec.filesystem("file"), versioned=False)
+    board.pin_write(df, "some_df", type="csv")
+
+    # replacing a version only needs version names, not parsed versions
+    monkeypatch.setattr(board, "pin_versions", _fail_on_call)
+    board.pin_write(df.assign(z=1), "some_df", type="csv")
+
+    assert len(list((tmp_path / "some_df").iterdir())) == 1
+
+
 # Posit Connect specific ====================================================
 
 # import fixture that builds / tearsdown user "susan"
@@ -814,6 +1244,24 @@ def test_board_manual_http_file_download():
     assert len(board2.pin_download("license"))
 
 
+def test_board_manual_pin_download_hash(tmp_cache, http_dir):
+    from pins.constructors import board_url
+    from pins.versions import Version
+
+    p_served, url = http_dir
+    (p_served / "a.txt").write_text("abc")
+    board = board_url(url, {"a": "a.txt"})
+
+    # files without metadata can be checked against a hash the user gives
+    (p_file,) = board.pin_download("a", retries=2, max_workers=1)
+    with open(p_file, "rb") as f:
+        hash_ = Version.hash_file(f)
+
+    assert board.pin_download("a", hash=hash_[:8]) == [p_file]
+    with pytest.raises(PinsHashError):
+        board.pin_download("a", hash="abc")
+
+
 def test_board_manual_pin_read():
     # TODO: block size must be set to 0 to handle gzip encoding from github
     # see https://github.com/fsspec/filesystem_spec/issues/389
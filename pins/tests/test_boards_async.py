@@ -0,0 +1,236 @@
+import asyncio
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from pins.boards import AsyncBoard, BaseBoard
+from pins.errors import PinsError, PinsHashError
+from pins.tests.helpers import AsyncLocalFileSystem
+
+# Tests in this file use a local filesystem with coroutine methods, so that
+# they run the same requests as boards on s3, gcs, or azure.
+
+
+@pytest.fixture
+def board(tmp_path):
+    return BaseBoard(str(tmp_path), fs=AsyncLocalFileSystem())
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_board_async_is_native(board, tmp_path):
+    assert isinstance(board.aio, AsyncBoard)
+    assert board.aio is board.aio
+    assert board.aio.is_native
+
+    from fsspec import filesystem
+
+    assert not BaseBoard(str(tmp_path), fs=filesystem("file")).aio.is_native
+
+
+def test_board_async_pin_write_read(board):
+    df = pd.DataFrame({"x": [1, 2, 3]})
+
+    meta = run(board.aio.pin_write(df, "df", type="csv", title="a"))
+    assert meta.title == "a"
+
+    # the sync methods see pins written by the async ones
+    assert board.pin_read("df").equals(df)
+    assert run(board.aio.pin_read("df")).equals(df)
+    assert run(board.aio.pin_meta("df")).version.version == meta.version.version
+
+
+def test_board_async_pin_write_identical(board):
+    meta = run(board.aio.pin_write({"a": 1}, "x", type="json"))
+    meta2 = run(board.aio.pin_write({"a": 1}, "x", type="json"))
+
+    assert meta2.version.version == meta.version.version
+    assert len(board.pin_versions("x")) == 1
+
+
+def test_board_async_pin_versions(board):
+    for ii in range(3):
+        board.pin_write({"a": ii}, "x", type="json", created=datetime(2020, 1, ii + 1))
+
+    versions = run(board.aio.pin_versions("x", as_df=False))
+    assert [v.version for v in versions] == [
+        v.version for v in board.pin_versions("x", as_df=False)
+    ]
+    assert run(board.aio.pin_read("x")) == {"a": 2}
+    assert run(board.aio.pin_read("x", versions[0].version)) == {"a": 0}
+
+
+def test_board_async_pin_exists_list(board):
+    board.pin_write({"a": 1}, "x", type="json")
+
+    assert run(board.aio.pin_exists("x"))
+    assert not run(board.aio.pin_exists("y"))
+    assert run(board.aio.pin_list()) == ["x"]
+
+    with pytest.raises(PinsError):
+        run(board.aio.pin_versions("y"))
+
+
+def test_board_async_pin_meta_missing_version(board):
+    board.pin_write({"a": 1}, "x", type="json")
+
+    with pytest.raises(PinsError):
+        run(board.aio.pin_meta("x", "20200101T000000Z-abcde"))
+
+
+def test_board_async_pin_read_gather(board):
+    for ii in range(10):
+        board.pin_write({"a": ii}, f"x-{ii}", type="json")
+
+    async def read_all():
+        return await asyncio.gather(*[board.aio.pin_read(f"x-{ii}") for ii in range(10)])
+
+    assert run(read_all()) == [{"a": ii} for ii in range(10)]
+
+    # reads were in flight at the same time
+    assert board.fs.max_in_flight > 1
+
+
+def test_board_async_pin_search(board):
+    board.pin_write({"a": 1}, "x", type="json", title="some title")
+    board.pin_write({"a": 1}, "y", type="json", title="other")
+
+    metas = run(board.aio.pin_search("some", as_df=False))
+    assert [meta.name for meta in metas] == ["x"]
+
+
+def test_board_async_pin_read_pickle(board):
+    board.pin_write({"a": 1}, "x", type="joblib")
+    board.allow_pickle_read = False
+
+    with pytest.raises(PinsError):
+        run(board.aio.pin_read("x"))
+
+
+def test_board_async_pin_read_hash(board):
+    meta = board.pin_write({"a": 1}, "x", type="json")
+
+    assert run(board.aio.pin_read("x", hash=meta.pin_hash)) == {"a": 1}
+
+    with pytest.raises(PinsHashError):
+        run(board.aio.pin_read("x", hash="abc"))
+
+
+def test_board_async_thread_fallback(tmp_path):
+    from fsspec import filesystem
+
+    board = BaseBoard(str(tmp_path), fs=filesystem("file"))
+    run(board.aio.pin_write({"a": 1}, "x", type="json"))
+
+    assert run(board.aio.pin_read("x")) == {"a": 1}
+    assert run(board.aio.pin_list()) == ["x"]
+
+
+def _cached_board(tmp_path) -> BaseBoard:
+    from pins.cache import PinsCache
+
+    fs = AsyncLocalFileSystem()
+    cache = PinsCache(
+        cache_storage=str(tmp_path / "cache"),
+        fs=fs,
+        hash_prefix=str(tmp_path / "board"),
+        same_names=True,
+    )
+    fs.makedirs(str(tmp_path / "board"))
+    return BaseBoard(str(tmp_path / "board"), fs=cache)
+
+
+def test_board_async_fs_pin_read_many_cache(tmp_path):
+    board = _cached_board(tmp_path)
+    fs = board.fs.fs
+
+    names = [f"x-{ii}" for ii in range(5)]
+    for ii, name in enumerate(names):
+        board.pin_write({"a": ii}, name, type="json")
+
+    # files are downloaded into the cache together
+    fs.max_in_flight = 0
+    res = board.pin_read_many(names)
+
+    assert res == {name: {"a": ii} for ii, name in enumerate(names)}
+    assert fs.max_in_flight > 1
+    assert all(board._get_cache_path(name) is not None for name in names)
+
+    # prefetched data files are misses, then read from the cache as hits
+    stats = board.cache_stats()
+    assert (stats["hits"], stats["misses"]) == (5, 10)
+
+
+def test_board_async_fs_pin_prefetch(tmp_path):
+    board = _cached_board(tmp_path)
+    fs = board.fs.fs
+
+    names = [f"x-{ii}" for ii in range(5)]
+    for ii, name in enumerate(names):
+        board.pin_write({"a": ii}, name, type="json")
+
+    # files are downloaded into the cache together
+    fs.max_in_flight = 0
+    res = board.pin_prefetch(names)
+
+    assert fs.max_in_flight > 1
+    assert all(len(res[name]) == 1 for name in names)
+    assert board.cache_stats()["hits"] == 0
+
+
+def test_board_async_fs_get_many_no_info(tmp_path, monkeypatch):
+    board = _cached_board(tmp_path)
+    fs = board.fs.fs
+
+    metas = [board.pin_write({"a": ii}, f"x-{ii}", type="json") for ii in range(3)]
+    paths = [p for meta in metas for p in board._pin_file_paths(meta.name, meta)]
+
+    # files are put in the cache without first requesting their details
+    def fail(*args, **kwargs):
+        raise AssertionError("requested file details")
+
+    monkeypatch.setattr(fs, "ukey", fail)
+    monkeypatch.setattr(fs, "_info", fail)
+    board._get_many(paths)
+
+    assert all(board._is_cached(path) for path in paths)
+
+
+def test_board_async_fs_offline(tmp_path, monkeypatch):
+    from pins.cache import meta_cache
+
+    board = _cached_board(tmp_path)
+    fs = board.fs.fs
+
+    board.pin_write({"a": 1}, "x", type="json")
+    board.pin_read("x")
+    board.pin_write({"a": 2}, "y", type="json")
+    meta_cache.clear()
+
+    # offline boards read from the cache, like the sync methods
+    board.offline = True
+    assert not board.aio.is_native
+
+    monkeypatch.setattr(fs, "_cat_file", None)
+    assert run(board.aio.pin_read("x")) == {"a": 1}
+
+    with pytest.raises(PinsError, match="offline"):
+        run(board.aio.pin_read("y"))
+
+
+def test_board_async_fs_pin_write_cache(tmp_path):
+    board = _cached_board(tmp_path)
+    meta = board.pin_write({"a": 1}, "x", type="json", created=datetime(2020, 1, 1))
+
+    # the last version is checked through the cache, like the sync pin_write
+    meta2 = run(
+        board.aio.pin_write({"a": 2}, "x", type="json", created=datetime(2020, 1, 2))
+    )
+    assert board._get_cache_path("x", meta.version.version) is not None
+    assert board.pin_read("x") == {"a": 2}
+
+    meta3 = run(board.aio.pin_write({"a": 2}, "x", type="json"))
+    assert meta3.version.version == meta2.version.version
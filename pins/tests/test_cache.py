@@ -3,14 +3,20 @@ from pathlib import Path
 
 import pytest
 from fsspec import filesystem
+from fsspec.implementations.local import LocalFileSystem
 
 from pins.cache import (
     CachePruner,
+    CacheStats,
+    MetaCache,
+    PinsAccessTimeCache,
     PinsCache,
     PinsUrlCache,
+    cache_info,
     cache_prune,
     touch_access_time,
 )
+from pins.tests.helpers import ETagHandler
 
 # NOTE: windows time.time() implementation appears to have 16 millisecond precision, so
 # we need to add a small delay, in order to avoid prune checks appearing to happen at the
@@ -83,6 +89,351 @@ def test_pins_cache_open():
     pass
 
 
+# Filling the cache ===========================================================
+
+
+class SlowLocalFileSystem(LocalFileSystem):
+    """Count downloads, which take long enough that readers overlap."""
+
+    def __init__(self, *args, fail=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fail = fail
+        self.n_get_file = 0
+
+    def get_file(self, rpath, lpath, **kwargs):
+        self.n_get_file += 1
+        time.sleep(0.2)
+
+        if self.fail:
+            Path(lpath).write_text("partial")
+            raise OSError("connection lost")
+
+        super().get_file(rpath, lpath, **kwargs)
+
+
+def _slow_cache(tmp_path, fail=False):
+    (tmp_path / "board" / "a").mkdir(parents=True)
+    (tmp_path / "board" / "a" / "x.txt").write_text("abc")
+
+    fs = SlowLocalFileSystem(fail=fail, skip_instance_cache=True)
+    cache = PinsCache(
+        cache_storage=str(tmp_path / "cache"),
+        fs=fs,
+        hash_prefix=str(tmp_path / "board"),
+        same_names=True,
+    )
+    return fs, cache
+
+
+def test_pins_cache_fill_once(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    fs, cache = _slow_cache(tmp_path)
+
+    def read(_):
+        with cache.open(str(tmp_path / "board" / "a" / "x.txt")) as f:
+            return f.read()
+
+    with ThreadPoolExecutor(4) as pool:
+        res = list(pool.map(read, range(4)))
+
+    # readers wait for one download, then read the finished file
+    assert res == [b"abc"] * 4
+    assert fs.n_get_file == 1
+
+    # lock files are removed once the file is filled
+    assert not list((tmp_path / "cache" / "a").glob("*.pins-lock"))
+
+    stats = cache.stats.to_dict()
+    assert (stats["hits"], stats["misses"]) == (3, 1)
+
+
+def test_pins_cache_fill_failed(tmp_path):
+    fs, cache = _slow_cache(tmp_path, fail=True)
+
+    with pytest.raises(OSError):
+        cache.open(str(tmp_path / "board" / "a" / "x.txt"))
+
+    # the partial download is not left in the cache
+    assert not (tmp_path / "cache" / "a" / "x.txt").exists()
+    assert not list((tmp_path / "cache" / "a").glob("*.pins-tmp"))
+
+
+def test_cached_file_hash(tmp_path, monkeypatch):
+    from pins.cache import cached_file_hash, evict_cached_file
+    from pins.versions import Version
+
+    p_file = tmp_path / "a.txt"
+    p_file.write_text("abc")
+
+    # the hash is recorded next to the file, and used while the file is unchanged
+    hash_ = cached_file_hash(str(p_file))
+    assert hash_ == Version.hash_file(p_file.open("rb"))
+    assert (tmp_path / ".a.txt.pins-xxh64").exists()
+
+    with monkeypatch.context() as m:
+        m.setattr("pins.cache._hash_local_file", None)
+        assert cached_file_hash(str(p_file)) == hash_
+
+    p_file.write_text("abcd")
+    assert cached_file_hash(str(p_file)) != hash_
+
+    (tmp_path / ".a.txt.pins-http").write_text("{}")
+    evict_cached_file(str(p_file))
+
+    # the file, its sidecars, and its lock file are all removed
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cached_file_hash_threads(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from pins.cache import cached_file_hash
+
+    p_file = tmp_path / "a.txt"
+    p_file.write_text("abc")
+
+    # threads hashing the same file each write their own temporary file
+    with ThreadPoolExecutor(8) as pool:
+        hashes = set(pool.map(lambda _: cached_file_hash(str(p_file)), range(32)))
+
+    assert len(hashes) == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".a.txt.pins-xxh64", "a.txt"]
+
+
+def test_file_lock_remove(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from pins.cache import file_lock
+
+    p_lock = str(tmp_path / ".a.txt.pins-lock")
+    holders = []
+
+    def hold(i):
+        with file_lock(p_lock, remove=True):
+            holders.append(i)
+            time.sleep(0.01)
+            # no other thread got the lock, even though the file was removed
+            assert holders[-1] == i
+
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(hold, range(8)))
+
+    assert len(holders) == 8
+    assert not Path(p_lock).exists()
+
+
+# HTTP revalidation ===========================================================
+
+
+def test_pins_access_time_cache_revalidate(tmp_path, http_dir):
+    p_served, url = http_dir
+    (p_served / "a.txt").write_text("abc")
+
+    cache = PinsAccessTimeCache(
+        target_protocol="http",
+        cache_storage=str(tmp_path / "cache"),
+        same_names=False,
+        max_age=0,
+        skip_instance_cache=True,
+    )
+
+    def read(path):
+        with cache.open(path) as f:
+            return f.read()
+
+    assert read(f"{url}/a.txt") == b"abc"
+
+    # an unchanged file is checked, but not downloaded again
+    assert read(f"{url}/a.txt") == b"abc"
+    assert ETagHandler.requests[0] is None
+    assert ETagHandler.requests[1] is not None
+
+    time.sleep(0.01)
+    (p_served / "a.txt").write_text("abcd")
+    assert read(f"{url}/a.txt") == b"abcd"
+    assert len(ETagHandler.requests) == 3
+
+    # files are only checked once they are older than max_age
+    cache.max_age = 60
+    assert read(f"{url}/a.txt") == b"abcd"
+    assert len(ETagHandler.requests) == 3
+
+
+def test_pins_access_time_cache_revalidate_unreachable(
+    tmp_path, http_dir, monkeypatch, caplog
+):
+    from aiohttp import ClientConnectionError
+
+    p_served, url = http_dir
+    (p_served / "a.txt").write_text("abc")
+
+    cache = PinsAccessTimeCache(
+        target_protocol="http",
+        cache_storage=str(tmp_path / "cache"),
+        same_names=False,
+        max_age=0,
+        skip_instance_cache=True,
+    )
+
+    def read(path):
+        with cache.open(path) as f:
+            return f.read()
+
+    assert read(f"{url}/a.txt") == b"abc"
+
+    async def unreachable(*args, **kwargs):
+        raise ClientConnectionError("server down")
+
+    monkeypatch.setattr("pins.cache._http_get_if_modified", unreachable)
+
+    # the stale copy is used, but files not in the cache cannot be read
+    with caplog.at_level("WARNING", logger="pins.cache"):
+        assert read(f"{url}/a.txt") == b"abc"
+    assert "stale" in caplog.text
+
+    (p_served / "b.txt").write_text("b")
+    with pytest.raises(ClientConnectionError):
+        read(f"{url}/b.txt")
+
+    # the file is checked again once the server is back
+    monkeypatch.undo()
+    assert read(f"{url}/a.txt") == b"abc"
+    assert len(ETagHandler.requests) == 2
+
+
+# Blob store ==================================================================
+
+
+def test_blob_store_dedup(tmp_path):
+    from pins.cache import BlobStore
+
+    blobs = BlobStore(tmp_path / "blobs")
+    p_a, p_b = tmp_path / "a.txt", tmp_path / "b.txt"
+    p_a.write_text("abc")
+    p_b.write_text("abc")
+
+    hash_a = blobs.add(str(p_a))
+    hash_b = blobs.add(str(p_b))
+
+    # identical files are links to one blob
+    assert hash_a == hash_b
+    assert p_a.stat().st_ino == p_b.stat().st_ino
+    assert blobs.refcount(hash_a) == 2
+
+    p_c = tmp_path / "c.txt"
+    assert blobs.link(hash_a, str(p_c))
+    assert p_c.read_text() == "abc"
+    assert not blobs.link("not-a-hash", str(tmp_path / "d.txt"))
+
+    # blobs are only pruned once nothing links to them
+    for p in [p_a, p_b]:
+        p.unlink()
+    assert blobs.prune() == []
+
+    p_c.unlink()
+    assert blobs.prune() == [hash_a]
+    assert blobs.refcount(hash_a) == 0
+
+
+# Cache statistics ============================================================
+
+
+def test_cache_stats_record():
+    stats = CacheStats()
+    stats.record("a", True, 10)
+    stats.record("a", False, 5)
+    stats.record("b", False)
+
+    res = stats.to_dict()
+    assert (res["hits"], res["misses"]) == (1, 2)
+    assert (res["bytes_served"], res["bytes_fetched"]) == (10, 5)
+    assert res["pins"]["a"]["hits"] == 1
+    assert res["pins"]["b"]["misses"] == 1
+
+    stats.reset()
+    assert stats.to_dict() == {**dict.fromkeys(CacheStats.fields, 0), "pins": {}}
+
+
+def test_cache_stats_persist(tmp_path):
+    p_stats = str(tmp_path / "stats.json")
+
+    stats = CacheStats(p_stats)
+    stats.record("a", True, 10)
+    stats.save()
+
+    stats2 = CacheStats(p_stats)
+    stats2.record("a", True, 10)
+    assert stats2.to_dict()["pins"]["a"]["hits"] == 2
+
+
+def test_cache_stats_persist_merge(tmp_path):
+    p_stats = str(tmp_path / "stats.json")
+
+    # two caches sharing a file each add their counts to it
+    stats_a, stats_b = CacheStats(p_stats), CacheStats(p_stats)
+    stats_a.record("a", True, 10)
+    stats_b.record("a", False, 5)
+    stats_b.record("b", True)
+
+    for stats in [stats_a, stats_b, stats_a]:
+        stats.save()
+
+    res = CacheStats(p_stats).to_dict()
+    assert (res["hits"], res["misses"], res["bytes_served"]) == (2, 1, 10)
+    assert res["pins"]["a"]["hits"] == 1
+
+
+def test_cache_stats_save_at_exit(tmp_path, monkeypatch):
+    import atexit
+    import gc
+
+    from pins.cache import _save_cache_stats, _stats_to_save, save_stats_at_exit
+
+    handlers = []
+    monkeypatch.setattr(atexit, "register", handlers.append)
+    monkeypatch.setattr(
+        atexit, "unregister", lambda f: handlers.remove(f) if f in handlers else None
+    )
+
+    p_stats = str(tmp_path / "stats.json")
+    stats = CacheStats(p_stats)
+    save_stats_at_exit(stats)
+    save_stats_at_exit(CacheStats(p_stats))
+    gc.collect()
+
+    # only one exit handler is registered, and unused statistics are released
+    assert handlers == [_save_cache_stats]
+    assert [x for x in _stats_to_save if x.path == p_stats] == [stats]
+
+
+def test_cache_stats_unreadable(tmp_path):
+    p_stats = tmp_path / "stats.json"
+    p_stats.write_text("{")
+
+    assert CacheStats(str(p_stats)).to_dict()["pins"] == {}
+
+
+def test_pins_cache_stats(tmp_path):
+    (tmp_path / "board" / "a").mkdir(parents=True)
+    (tmp_path / "board" / "a" / "x.txt").write_text("abc")
+
+    cache = PinsCache(
+        cache_storage=str(tmp_path / "cache"),
+        fs=filesystem("file"),
+        hash_prefix=str(tmp_path / "board"),
+        same_names=True,
+    )
+
+    for _ in range(2):
+        with cache.open(str(tmp_path / "board" / "a" / "x.txt")) as f:
+            f.read()
+
+    assert cache.stats.to_dict()["pins"] == {
+        "a": {"hits": 1, "misses": 1, "bytes_fetched": 3, "bytes_served": 3}
+    }
+
+
 # Cache pruning ===============================================================
 
 
@@ -174,3 +525,109 @@ def test_cache_prune_prompt(a_cache, pin1_v1, pin2_v3, monkeypatch):
 
     # pin2_v3 deleted
     assert len(versions) == 1
+
+
+def test_cache_prune_blob_storage(tmp_path, a_cache, pin1_v1):
+    from pins.cache import BlobStore
+
+    blobs = BlobStore(tmp_path / "custom_blobs")
+    blobs.add(str(pin1_v1 / "data.txt"), "linked")
+
+    Path(blobs.root).mkdir(exist_ok=True)
+    (Path(blobs.root) / "unlinked").write_text("abc")
+
+    cache_prune(days=1, cache_root=a_cache.parent, prompt=False, blob_storage=blobs.root)
+
+    assert sorted(p.name for p in Path(blobs.root).iterdir()) == ["linked"]
+
+
+def test_cache_prune_registered_blob_storage(tmp_path, a_cache, pin1_v1, monkeypatch):
+    from pins.cache import BlobStore
+
+    inside = BlobStore(tmp_path / "custom_blobs")
+    outside = BlobStore(tmp_path.parent / f"{tmp_path.name}_other_blobs")
+    monkeypatch.setattr("pins.cache._blob_roots", {inside.root, outside.root})
+
+    for blobs in [inside, outside]:
+        Path(blobs.root).mkdir(exist_ok=True)
+        (Path(blobs.root) / "unlinked").write_text("abc")
+
+    cache_prune(days=1, cache_root=a_cache.parent, prompt=False)
+
+    assert list(Path(inside.root).iterdir()) == []
+    assert [p.name for p in Path(outside.root).iterdir()] == ["unlinked"]
+
+
+def test_cache_prune_orphan_sidecars(a_cache, pin1_v1):
+    _sleep()
+
+    (pin1_v1 / ".data.txt.pins-xxh64").write_text("")
+    (pin1_v1 / ".gone.txt.pins-xxh64").write_text("")
+    (pin1_v1 / ".gone.txt.pins-lock").write_text("")
+
+    cache_prune(days=1, cache_root=a_cache.parent, prompt=False)
+
+    assert sorted(p.name for p in pin1_v1.iterdir()) == [
+        ".data.txt.pins-xxh64",
+        "data.txt",
+    ]
+
+
+def test_cache_info_skips_blobs(tmp_path, a_cache, pin1_v1, monkeypatch, capsys):
+    monkeypatch.setenv("PINS_CACHE_DIR", str(tmp_path))
+    (tmp_path / "pins_blobs").mkdir()
+
+    cache_info()
+
+    out = capsys.readouterr().out
+    assert "board_cache" in out
+    assert "pins_blobs" not in out
+
+
+# MetaCache ===================================================================
+
+
+def test_meta_cache_lru():
+    cache = MetaCache(maxsize=2)
+
+    cache.set(("b", "a", "1"), {"x": 1})
+    cache.set(("b", "a", "2"), {"x": 2})
+
+    # reading a key makes it most recently used
+    assert cache.get(("b", "a", "1")) == {"x": 1}
+    cache.set(("b", "a", "3"), {"x": 3})
+
+    assert cache.get(("b", "a", "2")) is None
+    assert len(cache) == 2
+
+
+def test_meta_cache_copies():
+    cache = MetaCache()
+
+    meta = {"x": 1}
+    cache.set(("b", "a", "1"), meta)
+    meta["x"] = 2
+    cache.get(("b", "a", "1"))["x"] = 3
+
+    assert cache.get(("b", "a", "1")) == {"x": 1}
+
+
+def test_meta_cache_evict():
+    cache = MetaCache()
+    for key in [("b", "a", "1"), ("b", "a", "2"), ("b", "c", "1"), ("d", "a", "1")]:
+        cache.set(key, {})
+
+    cache.evict("b", "a", "1")
+    assert cache.get(("b", "a", "1")) is None
+    assert cache.get(("b", "a", "2")) is not None
+
+    cache.evict("b", "a")
+    assert cache.get(("b", "a", "2")) is None
+    assert len(cache) == 2
+
+
+def test_meta_cache_disabled():
+    cache = MetaCache(maxsize=0)
+    cache.set(("b", "a", "1"), {})
+
+    assert cache.get(("b", "a", "1")) is None
@@ -12,6 +12,14 @@ def env_unset():
         config.PINS_ENV_DATA_DIR,
         config.PINS_ENV_CACHE_DIR,
         config.PINS_ENV_INSECURE_READ,
+        config.PINS_ENV_LATEST_TTL,
+        config.PINS_ENV_LATEST_MARKER,
+        config.PINS_ENV_CACHE_STATS,
+        config.PINS_ENV_OFFLINE,
+        config.PINS_ENV_CACHE_DEDUP,
+        config.PINS_ENV_VERIFY_HASH,
+        config.PINS_ENV_URL_MAX_AGE,
+        config.PINS_ENV_COMPRESS_WORKERS,
     ):
         yield
 
@@ -35,3 +43,80 @@ def test_allow_pickle_read_env_0(env_unset):
     assert config.get_allow_pickle_read(True) is True
     assert config.get_allow_pickle_read(False) is False
     assert config.get_allow_pickle_read(None) is False
+
+
+def test_latest_ttl(env_unset):
+    assert config.get_latest_ttl(None) == 0
+    assert config.get_latest_ttl(5) == 5
+
+    os.environ[config.PINS_ENV_LATEST_TTL] = "2.5"
+    assert config.get_latest_ttl(None) == 2.5
+    assert config.get_latest_ttl(0) == 0
+
+    os.environ[config.PINS_ENV_LATEST_TTL] = "soon"
+    with pytest.raises(ValueError):
+        config.get_latest_ttl(None)
+
+
+def test_latest_marker(env_unset):
+    assert config.get_latest_marker(None) is False
+
+    os.environ[config.PINS_ENV_LATEST_MARKER] = "1"
+    assert config.get_latest_marker(None) is True
+    assert config.get_latest_marker(False) is False
+
+
+def test_cache_stats_persist(env_unset):
+    assert config.get_cache_stats_persist(None) is False
+
+    os.environ[config.PINS_ENV_CACHE_STATS] = "1"
+    assert config.get_cache_stats_persist(None) is True
+    assert config.get_cache_stats_persist(False) is False
+
+
+def test_offline(env_unset):
+    assert config.get_offline(None) is False
+
+    os.environ[config.PINS_ENV_OFFLINE] = "1"
+    assert config.get_offline(None) is True
+    assert config.get_offline(False) is False
+
+
+def test_cache_dedup(env_unset):
+    assert config.get_cache_dedup(None) is False
+
+    os.environ[config.PINS_ENV_CACHE_DEDUP] = "1"
+    assert config.get_cache_dedup(None) is True
+    assert config.get_cache_dedup(False) is False
+
+
+def test_verify_hash(env_unset):
+    assert config.get_verify_hash(None) is False
+
+    os.environ[config.PINS_ENV_VERIFY_HASH] = "1"
+    assert config.get_verify_hash(None) is True
+    assert config.get_verify_hash(False) is False
+
+
+def test_url_max_age(env_unset):
+    assert config.get_url_max_age(None) is None
+    assert config.get_url_max_age(10) == 10
+
+    os.environ[config.PINS_ENV_URL_MAX_AGE] = "60"
+    assert config.get_url_max_age(None) == 60.0
+
+    os.environ[config.PINS_ENV_URL_MAX_AGE] = "an hour"
+    with pytest.raises(ValueError):
+        config.get_url_max_age(None)
+
+
+def test_compress_workers(env_unset):
+    assert config.get_compress_workers(None) is None
+    assert config.get_compress_workers(4) == 4
+
+    os.environ[config.PINS_ENV_COMPRESS_WORKERS] = "2"
+    assert config.get_compress_workers(None) == 2
+
+    os.environ[config.PINS_ENV_COMPRESS_WORKERS] = "many"
+    with pytest.raises(ValueError):
+        config.get_compress_workers(None)
@@ -6,6 +6,7 @@ import pytest
 from pandas.testing import assert_frame_equal
 
 from pins import constructors as c
+from pins.boards import BaseBoard
 from pins.tests.conftest import (
     EXAMPLE_REL_PATH,
     PATH_TO_EXAMPLE_BOARD,
@@ -292,6 +293,57 @@ def test_board_constructor_folder(tmp_path: Path, df):
     assert df.equals(df2)
 
 
+def test_board_constructor_options(tmp_path: Path):
+    board = c.board_folder(str(tmp_path), latest_ttl=60, verify_hash=True)
+    assert (board.latest_ttl, board.latest_marker, board.verify_hash) == (60, None, True)
+
+    board = c.board("file", str(tmp_path), cache=None, offline=True)
+    assert board.offline is True
+
+
+def test_board_connect_compress_workers():
+    board = c.board_connect(
+        "http://connect.mock", api_key="a", cache=None, compress_workers=2
+    )
+    assert board.fs.api.compress_workers == 2
+
+
+def test_board_constructor_options_factory(tmp_path: Path):
+    # factories that do not take the options still work, unless one is set
+    def factory(path, fs, versioned, allow_pickle_read=None):
+        return BaseBoard(path, fs, versioned, allow_pickle_read)
+
+    board = c.board("file", str(tmp_path), cache=None, board_factory=factory)
+    assert board.offline is None
+
+    with pytest.raises(TypeError):
+        c.board("file", str(tmp_path), cache=None, board_factory=factory, offline=True)
+
+
+def test_board_url_offline(tmp_cache, http_dir, df_csv):
+    import shutil
+
+    from pins.errors import PinsError
+    from pins.tests.helpers import ETagHandler
+
+    p_served, url = http_dir
+    shutil.copytree(str(PATH_TO_EXAMPLE_VERSION), str(p_served / "df_csv"))
+    pin_paths = {"df_csv": "df_csv/", "other": "other/"}
+
+    board = c.board_url(url, pin_paths, max_age=0)
+    assert_frame_equal(board.pin_read("df_csv"), df_csv)
+    n_requests = len(ETagHandler.requests)
+
+    # cached pins are read without checking the server, even though max_age is 0
+    board = c.board_url(url, pin_paths, max_age=0, offline=True)
+    assert board._is_offline()
+    assert_frame_equal(board.pin_read("df_csv"), df_csv)
+    assert len(ETagHandler.requests) == n_requests
+
+    with pytest.raises(PinsError, match="offline"):
+        board.pin_read("other")
+
+
 # Deparsing ===================================================================
 
 
@@ -0,0 +1,149 @@
+import io
+import threading
+
+import pandas as pd
+import pytest
+
+from pins.boards import BaseBoard
+from pins.errors import PinsError
+from pins.tests.helpers import MockWorkspaceClient
+
+pytest.importorskip("databricks.sdk")
+
+from pins.databricks.fs import DatabricksFs  # noqa: E402
+
+# Tests in this file do not need a Databricks workspace.
+
+
+@pytest.fixture
+def client():
+    return MockWorkspaceClient()
+
+
+@pytest.fixture
+def fs(client):
+    # skip_instance_cache, so each test gets its own client
+    return DatabricksFs(client=client, max_workers=4, skip_instance_cache=True)
+
+
+@pytest.fixture
+def board_dbc(fs):
+    return BaseBoard("/Volumes/cat/schema/vol/board", fs=fs)
+
+
+@pytest.fixture
+def local_dir(tmp_path):
+    p_src = tmp_path / "src"
+    (p_src / "sub").mkdir(parents=True)
+    for ii in range(6):
+        (p_src / f"file-{ii}.txt").write_text(f"file {ii}")
+    (p_src / "sub" / "nested.txt").write_text("nested")
+
+    return p_src
+
+
+def test_databricks_fs_reuses_client(fs, client):
+    assert fs.client is client
+    assert fs.client is fs.client
+
+
+def test_databricks_fs_put_streams(fs, client, local_dir):
+    fs.put(str(local_dir), "/Volumes/a/b")
+
+    assert client.files.count_calls("upload") == 7
+    assert client.files.files["/Volumes/a/b/sub/nested.txt"] == b"nested"
+
+    # files are uploaded from open file handles, not buffered into memory
+    assert io.BytesIO not in client.files.upload_types
+
+
+def test_databricks_fs_put_get_rm_threaded(fs, client, local_dir, tmp_path):
+    fs.put(str(local_dir), "/Volumes/a/b")
+
+    # uploads happen in worker threads
+    assert threading.get_ident() not in client.files.threads
+
+    fs.get("/Volumes/a/b", str(tmp_path / "dst"), recursive=True)
+    assert (tmp_path / "dst" / "file-3.txt").read_text() == "file 3"
+    assert (tmp_path / "dst" / "sub" / "nested.txt").read_text() == "nested"
+
+    fs.rm("/Volumes/a/b")
+    assert not fs.exists("/Volumes/a/b")
+    assert client.files.files == {}
+    assert "/Volumes/a" in client.files.dirs
+
+
+def test_databricks_fs_get_file(fs, local_dir, tmp_path):
+    fs.put(str(local_dir), "/Volumes/a/b")
+
+    fs.get("/Volumes/a/b/sub/nested.txt", str(tmp_path / "out" / "nested.txt"))
+    assert (tmp_path / "out" / "nested.txt").read_text() == "nested"
+
+    with pytest.raises(PinsError):
+        fs.get("/Volumes/a/b/missing.txt", str(tmp_path / "missing.txt"))
+
+
+def test_databricks_fs_ls(fs, local_dir):
+    fs.put(str(local_dir), "/Volumes/a/b")
+
+    assert "/Volumes/a/b/sub" in fs.ls("/Volumes/a/b")
+    assert {"name": "/Volumes/a/b/sub", "size": None, "type": "directory"} in fs.ls(
+        "/Volumes/a/b", detail=True
+    )
+
+
+def test_databricks_board_roundtrip(board_dbc):
+    df = pd.DataFrame({"x": [1, 2, 3]})
+
+    meta = board_dbc.pin_write(df, "df", type="csv")
+    board_dbc.pin_write(df.assign(y=1), "df", type="csv")
+
+    assert board_dbc.pin_exists("df")
+    assert len(board_dbc.pin_versions("df", as_df=False)) == 2
+    assert board_dbc.pin_read("df", version=meta.version.version).equals(df)
+
+    board_dbc.pin_delete("df")
+    assert not board_dbc.pin_exists("df")
+
+
+def test_databricks_fs_listing_cache(fs, client, local_dir):
+    fs.put(str(local_dir), "/Volumes/a/b")
+    client.files.calls.clear()
+
+    fs.ls("/Volumes/a/b")
+    assert fs.exists("/Volumes/a/b/sub")
+    assert fs.exists("/Volumes/a/b/file-1.txt")
+    assert not fs.exists("/Volumes/a/b/missing.txt")
+    fs.ls("/Volumes/a/b")
+
+    assert client.files.calls == [("list_directory_contents", "/Volumes/a/b")]
+
+    # writes clear the listing of the directory and its parents
+    fs.put(str(local_dir / "sub"), "/Volumes/a/b/other")
+    assert "/Volumes/a/b/other" in fs.ls("/Volumes/a/b")
+
+
+def test_databricks_fs_listing_cache_disabled(client, local_dir):
+    fs = DatabricksFs(client=client, use_listings_cache=False, skip_instance_cache=True)
+    fs.put(str(local_dir), "/Volumes/a/b")
+    client.files.calls.clear()
+
+    fs.ls("/Volumes/a/b")
+    fs.ls("/Volumes/a/b")
+    assert client.files.count_calls("list_directory_contents") == 2
+
+
+def test_databricks_board_pin_read_calls(board_dbc, client):
+    board_dbc.pin_write(pd.DataFrame({"x": [1]}), "df", type="csv")
+    board_dbc.fs.invalidate_cache()
+    client.files.calls.clear()
+
+    board_dbc.pin_read("df")
+
+    # check the pin exists, list versions, then download metadata and data
+    assert [method for method, _ in client.files.calls] == [
+        "get_directory_metadata",
+        "list_directory_contents",
+        "download",
+        "download",
+    ]
@@ -0,0 +1,84 @@
+import subprocess
+import sys
+
+import pytest
+
+# the most time importing pins itself may take, in microseconds. This is well
+# above the current time, so it only fails when a heavy import is added.
+IMPORT_BUDGET_US = 50_000
+
+HEAVY_MODULES = ["fsspec", "yaml", "humanize", "xxhash", "importlib_metadata"]
+
+
+def import_times(code: str) -> dict[str, int]:
+    """Return the cumulative import time of each module imported by code."""
+
+    res = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # lines look like "import time: <self us> | <cumulative us> | <indent><module>"
+    times = {}
+    for line in res.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+
+    return times
+
+
+def test_import_pins_is_lazy():
+    times = import_times("import pins")
+
+    assert "pins" in times
+    assert not set(HEAVY_MODULES) & set(times)
+
+
+def test_import_pins_budget():
+    times = import_times("import pins")
+
+    assert times["pins"] < IMPORT_BUDGET_US
+
+
+@pytest.mark.parametrize("name", ["board_folder", "cache_prune", "board_deparse"])
+def test_import_pins_lazy_attrs(name):
+    import pins
+
+    assert callable(getattr(pins, name))
+    assert name in dir(pins)
+
+
+def test_import_pins_version():
+    import pins
+
+    assert isinstance(pins.__version__, str)
+
+
+def test_import_pins_missing_attr():
+    import pins
+
+    with pytest.raises(AttributeError):
+        pins.not_a_real_attribute
+
+
+def test_import_pins_type_checking_imports():
+    # static tools see the lazy attributes through imports under TYPE_CHECKING
+    import ast
+    import inspect
+
+    import pins
+
+    tree = ast.parse(inspect.getsource(pins))
+    imported = {
+        alias.name: node.module
+        for block in tree.body
+        if isinstance(block, ast.If) and getattr(block.test, "id", "") == "TYPE_CHECKING"
+        for node in block.body
+        for alias in node.names
+    }
+
+    assert imported == pins._LAZY_ATTRS
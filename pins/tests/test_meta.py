@@ -5,7 +5,8 @@ from io import StringIO
 import pytest
 import yaml
 
-from pins.meta import Meta, MetaFactory
+from pins import meta as pins_meta
+from pins.meta import Meta, MetaFactory, yaml_dump, yaml_load
 from pins.versions import Version
 
 META_DEFAULTS = {
@@ -99,3 +100,41 @@ def test_meta_factory_roundtrip_unknown(meta):
 
     assert meta2 == meta
     assert meta2.some_other_field == 1
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"title": "some title", "file": ["a.csv", "b.csv"], "api_version": 1.0},
+        {"user": {"n": 1, "x": None, "ok": True, "nested": [{"a": 1.5}]}},
+        {"title": "quoted: #, 'single' and \"double\"", "empty": ""},
+        {"description": "x " * 200},
+        # the emitters differ for these, so pure-python pyyaml is used
+        {"description": "line one\nline two\tand a tab"},
+        {"title": "unicode \u00e9\u4e2d" * 20},
+        {"": 1, "k" * 200: 2},
+    ],
+)
+def test_yaml_dump_matches_pyyaml(data):
+    expected = yaml.dump(data, Dumper=yaml.Dumper)
+
+    assert yaml_dump(data) == expected
+    assert yaml_load(expected) == yaml.safe_load(expected)
+
+
+def test_yaml_dump_without_libyaml(monkeypatch, meta):
+    expected = meta.to_pin_yaml()
+
+    monkeypatch.setattr(pins_meta, "_CDumper", None)
+    assert meta.to_pin_yaml() == expected
+
+
+def test_meta_is_slotted():
+    import pickle
+
+    m = Meta(**META_DEFAULTS, unknown_fields={"some_other_field": 1})
+    m2 = pickle.loads(pickle.dumps(m))
+
+    assert not hasattr(m, "__dict__")
+    assert m2 == m
+    assert m2.some_other_field == 1
@@ -0,0 +1,397 @@
+import gzip
+import io
+import tarfile
+import zlib
+
+import pandas as pd
+import pytest
+
+from pins.boards import BoardRsConnect, RsConnectDeployment
+from pins.cache import meta_cache
+from pins.rsconnect.api import (
+    RsConnectApi,
+    RsConnectApiTimeoutError,
+    _ParallelGzipWriter,
+)
+from pins.rsconnect.fs import RsConnectFs
+from pins.tests.helpers import MockRsConnectSession
+
+# Tests in this file do not need a running Posit Connect server.
+
+
+# Bundle compression ----------------------------------------------------------
+
+
+@pytest.fixture
+def bundle_bytes():
+    # compressible, but not trivially so
+    return b"".join(f"row {i},{i * 7 % 13}\n".encode() for i in range(50_000))
+
+
+@pytest.mark.parametrize("block_size", [1000, 64 * 1024, 10_000_000])
+def test_parallel_gzip_roundtrip(bundle_bytes, block_size):
+    f = io.BytesIO()
+    with _ParallelGzipWriter(f, workers=4, block_size=block_size) as f_gz:
+        f_gz.write(bundle_bytes[:123])
+        f_gz.write(bundle_bytes[123:])
+
+    assert gzip.decompress(f.getvalue()) == bundle_bytes
+
+
+def test_parallel_gzip_single_member(bundle_bytes):
+    f = io.BytesIO()
+    with _ParallelGzipWriter(f, workers=2, block_size=1000) as f_gz:
+        f_gz.write(bundle_bytes)
+
+    # a single gzip member leaves nothing unused after decompressing
+    d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    assert d.decompress(f.getvalue()) == bundle_bytes
+    assert d.eof
+    assert d.unused_data == b""
+
+
+def test_parallel_gzip_empty():
+    f = io.BytesIO()
+    with _ParallelGzipWriter(f, workers=2):
+        pass
+
+    assert gzip.decompress(f.getvalue()) == b""
+
+
+def test_parallel_gzip_tarfile(tmp_path, bundle_bytes):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "data.csv").write_bytes(bundle_bytes)
+    (tmp_path / "src" / "data.txt").write_text("type: csv")
+
+    f = io.BytesIO()
+    with _ParallelGzipWriter(f, workers=4, block_size=4096) as f_gz:
+        with tarfile.open(fileobj=f_gz, mode="w") as tar:
+            tar.add(str(tmp_path / "src"), arcname="")
+
+    f.seek(0)
+    with tarfile.open(fileobj=f, mode="r:gz") as tar:
+        assert sorted(tar.getnames()) == ["", "data.csv", "data.txt"]
+        assert tar.extractfile("data.csv").read() == bundle_bytes
+
+
+# Mock Connect server ---------------------------------------------------------
+
+
+@pytest.fixture
+def mock_session():
+    # every mock server has the same url and bundle ids, so forget cached metadata
+    meta_cache.clear()
+
+    session = MockRsConnectSession()
+    session.add_user("susan")
+    session.add_user("derek")
+    return session
+
+
+def mock_board(session, username) -> BoardRsConnect:
+    session.current_user = next(
+        u for u in session.users.values() if u["username"] == username
+    )
+    api = RsConnectApi(session.server_url, "some-key", session=session)
+    return BoardRsConnect("", RsConnectFs(api))
+
+
+@pytest.fixture
+def board_mock(mock_session):
+    return mock_board(mock_session, "susan")
+
+
+@pytest.fixture
+def many_pins(mock_session):
+    df = pd.DataFrame({"x": [1, 2, 3]})
+    for user, n in [("derek", 3), ("susan", 2)]:
+        board = mock_board(mock_session, user)
+        for ii in range(n):
+            board.pin_write(df, f"{user}/pin-{ii}", type="csv")
+
+    # switch back to the default user, and forget any setup requests
+    mock_board(mock_session, "susan")
+    mock_session.requests.clear()
+
+
+# pin_list ----
+
+
+def test_rsconnect_api_walk_applications_pages(mock_session, board_mock, many_pins):
+    pages = list(board_mock.fs.api.misc_walk_applications("content_type:pin", count=2))
+
+    assert [len(page.results) for page in pages] == [2, 2, 1]
+    assert mock_session.count_requests() == 3
+
+
+def test_rsconnect_api_walk_applications_lazy(mock_session, board_mock, many_pins):
+    pages = board_mock.fs.api.misc_walk_applications("content_type:pin", count=2)
+    next(pages)
+
+    assert mock_session.count_requests() == 1
+
+
+def test_board_rsc_pin_list_all_pages(mock_session, board_mock, many_pins):
+    mock_session.max_page_size = 2
+
+    assert sorted(board_mock.pin_list()) == [
+        "derek/pin-0",
+        "derek/pin-1",
+        "derek/pin-2",
+        "susan/pin-0",
+        "susan/pin-1",
+    ]
+
+
+def test_board_rsc_pin_search_all_pages(mock_session, board_mock, many_pins):
+    mock_session.max_page_size = 2
+
+    metas = board_mock.pin_search(as_df=False)
+    assert len(metas) == 5
+
+
+def test_board_rsc_pin_list_owner(mock_session, board_mock, many_pins):
+    names = board_mock.pin_list(owner="derek")
+
+    assert sorted(names) == ["derek/pin-0", "derek/pin-1", "derek/pin-2"]
+    assert not any(path.endswith("applications") for _, path, _ in mock_session.requests)
+
+
+def test_board_rsc_pin_list_name(board_mock, many_pins):
+    assert sorted(board_mock.pin_list(name="pin-1")) == ["derek/pin-1", "susan/pin-1"]
+    assert board_mock.pin_list(owner="susan", name="pin-2") == []
+    assert board_mock.pin_list(owner="nobody") == []
+
+
+def test_board_rsc_pin_write_compress_workers(board_mock, monkeypatch):
+    import pins.rsconnect.api
+
+    used = []
+
+    class Writer(_ParallelGzipWriter):
+        def __init__(self, f_out, workers, **kwargs):
+            used.append(workers)
+            super().__init__(f_out, workers, **kwargs)
+
+    monkeypatch.setattr(pins.rsconnect.api, "_ParallelGzipWriter", Writer)
+    monkeypatch.setenv("PINS_COMPRESS_WORKERS", "2")
+
+    df = pd.DataFrame({"x": [1, 2, 3]})
+    meta = board_mock.pin_write(df, "susan/df", type="csv")
+
+    assert used == [2]
+    assert board_mock.pin_read("susan/df", meta.version.version).equals(df)
+
+
+# deployment ----
+
+
+def test_rsconnect_api_poll_tasks_output(mock_session, board_mock, many_pins):
+    mock_session.task_polls = 3
+    api = board_mock.fs.api
+    content = board_mock.fs.info("susan/pin-0")
+    bundle_id = content["bundle_id"]
+
+    task = api.post_content_item_deploy(content["guid"], bundle_id)
+
+    lines = []
+    res = api.poll_tasks(task["task_id"], on_output=lines.append)
+
+    assert res["finished"]
+    assert lines == [f"Deploying bundle, step {ii}" for ii in [1, 2, 3]]
+
+    # first poll does not wait on the server, and later ones back off
+    waits = [q["wait"] for _, path, q in mock_session.requests if "tasks" in path]
+    assert waits == ["0", "1", "1"]
+
+
+def test_rsconnect_api_poll_tasks_timeout(mock_session, board_mock, many_pins):
+    mock_session.task_polls = 10**9
+    api = board_mock.fs.api
+    content = board_mock.fs.info("susan/pin-0")
+
+    task = api.post_content_item_deploy(content["guid"], content["bundle_id"])
+
+    with pytest.raises(RsConnectApiTimeoutError):
+        api.poll_tasks(task["task_id"], timeout=0.05)
+
+
+def test_board_rsc_pin_write_no_deploy(mock_session, board_mock):
+    mock_session.task_polls = 2
+    df = pd.DataFrame({"x": [1, 2, 3]})
+
+    deployment = board_mock.pin_write(df, "susan/df", type="csv", deploy=False)
+    assert isinstance(deployment, RsConnectDeployment)
+    assert not deployment.done()
+
+    lines = []
+    meta = deployment.wait(on_output=lines.append)
+    assert deployment.done()
+    assert lines == ["Deploying bundle, step 2"]
+
+    assert board_mock.pin_read("susan/df", meta.version.version).equals(df)
+
+
+def test_board_rsc_pin_write_no_deploy_await(board_mock):
+    import asyncio
+
+    df = pd.DataFrame({"x": [1, 2, 3]})
+    deployment = board_mock.pin_write(df, "susan/df", type="csv", deploy=False)
+
+    async def f():
+        return await deployment
+
+    meta = asyncio.run(f())
+    assert meta.name == "susan/df"
+
+
+def test_board_rsc_pin_write_no_deploy_dropped(board_mock):
+    import threading
+
+    df = pd.DataFrame({"x": [1, 2, 3]})
+    board_mock.pin_write(df, "susan/df", type="csv", versioned=False)
+
+    # the deployment is never waited on, but the old version is still replaced
+    board_mock.pin_write(
+        df.assign(y=1), "susan/df", type="csv", versioned=False, deploy=False
+    )
+    for thread in threading.enumerate():
+        if thread.name.startswith("pins-deploy-"):
+            thread.join()
+
+    meta_cache.clear()
+    assert len(board_mock.pin_versions("susan/df")) == 1
+    assert board_mock.pin_read("susan/df").equals(df.assign(y=1))
+
+
+def test_board_rsc_pin_write_deploy_timeout_dropped(
+    mock_session, board_mock, monkeypatch
+):
+    import gc
+    import threading
+
+    started = []
+
+    class Thread(threading.Thread):
+        def start(self):
+            started.append(self)
+            super().start()
+
+    monkeypatch.setattr(threading, "Thread", Thread)
+    mock_session.task_polls = 10**9
+    df = pd.DataFrame({"x": [1, 2, 3]})
+
+    with pytest.raises(RsConnectApiTimeoutError):
+        board_mock.pin_write(df, "susan/df", type="csv", deploy_timeout=0.05)
+    gc.collect()
+
+    # the dropped deployment is only waited on for the same timeout, and does not
+    # stop python exiting
+    (thread,) = started
+    assert thread.daemon
+    thread.join(5)
+    assert not thread.is_alive()
+
+
+def test_board_rsc_pin_write_no_deploy_failed(mock_session, board_mock):
+    from pins.rsconnect.api import RsConnectApiError
+
+    df = pd.DataFrame({"x": [1, 2, 3]})
+    deployment = board_mock.pin_write(df, "susan/df", type="csv", deploy=False)
+    mock_session.tasks[deployment.task_id]["code"] = 1
+
+    # a failed deployment keeps raising, rather than returning its metadata
+    for _ in range(2):
+        with pytest.raises(RsConnectApiError):
+            deployment.wait()
+
+
+def test_board_rsc_pin_write_no_deploy_identical(board_mock):
+    df = pd.DataFrame({"x": [1, 2, 3]})
+    meta = board_mock.pin_write(df, "susan/df", type="csv")
+
+    deployment = board_mock.pin_write(df, "susan/df", type="csv", deploy=False)
+    assert deployment.task_id is None
+    assert deployment.wait().version.version == meta.version.version
+
+
+# pin_write requests ----
+
+
+def test_board_rsc_pin_write_request_count(mock_session, board_mock):
+    board_mock.pin_write(pd.DataFrame({"x": [1]}), "susan/df", type="csv", title="a")
+    mock_session.requests.clear()
+
+    # content, last meta, bundle, deploy, task
+    board_mock.pin_write(pd.DataFrame({"x": [2]}), "susan/df", type="csv", title="a")
+    assert mock_session.count_requests() == 5
+    assert mock_session.count_requests("PATCH") == 0
+
+    mock_session.requests.clear()
+    board_mock.pin_write(
+        pd.DataFrame({"x": [3]}),
+        "susan/df",
+        type="csv",
+        title="a",
+        force_identical_write=True,
+    )
+    assert mock_session.count_requests() == 4
+
+
+def test_board_rsc_pin_write_title_change(mock_session, board_mock):
+    board_mock.pin_write(pd.DataFrame({"x": [1]}), "susan/df", type="csv", title="a")
+    mock_session.requests.clear()
+
+    board_mock.pin_write(pd.DataFrame({"x": [2]}), "susan/df", type="csv", title="b")
+    assert mock_session.count_requests("PATCH") == 1
+    assert board_mock.fs.info("susan/df")["title"] == "b"
+
+
+# pin_versions ----
+
+
+def test_board_rsc_pin_versions_bundle_fields(mock_session, board_mock):
+    for ii in range(3):
+        board_mock.pin_write(pd.DataFrame({"x": [ii]}), "susan/df", type="csv")
+
+    meta_cache.clear()
+    mock_session.requests.clear()
+    versions = board_mock.pin_versions("susan/df", as_df=False)
+
+    # content and bundle listing
+    assert mock_session.count_requests() == 2
+    assert len(versions) == 3
+    assert [v.active for v in versions] == [False, False, True]
+    assert all(v.size > 0 for v in versions)
+    assert versions[0].created <= versions[-1].created
+    assert all(v.hash is None for v in versions)
+
+
+def test_board_rsc_pin_versions_prefetch_meta(mock_session, board_mock):
+    metas = [
+        board_mock.pin_write(pd.DataFrame({"x": [ii]}), "susan/df", type="csv")
+        for ii in range(3)
+    ]
+
+    meta_cache.clear()
+    mock_session.requests.clear()
+    df = board_mock.pin_versions("susan/df", prefetch_meta=True, max_workers=2)
+
+    assert list(df.hash) == [meta.pin_hash for meta in metas]
+    assert mock_session.count_requests() == 2 + 3
+
+    # bundles do not change, so metadata is not fetched again
+    mock_session.requests.clear()
+    meta = board_mock.pin_meta("susan/df", metas[0].version.version)
+    board_mock.pin_versions("susan/df", prefetch_meta=True)
+
+    assert meta.pin_hash == metas[0].pin_hash
+    assert mock_session.count_requests() == 2
+
+
+def test_rsconnect_version_bundle_parse_created():
+    from pins.versions import VersionBundle
+
+    assert VersionBundle.parse_created(None) is None
+    assert VersionBundle.parse_created("2021-09-01T12:00:00").hour == 12
+    assert VersionBundle.parse_created("2021-09-01T12:00:00Z").tzinfo is None
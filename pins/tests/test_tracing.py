@@ -0,0 +1,154 @@
+import logging
+
+import fsspec
+import pandas as pd
+import pytest
+
+from pins import tracing
+from pins.boards import BaseBoard
+
+
+@pytest.fixture
+def spans():
+    spans = []
+    with tracing.use_sink(spans.append):
+        yield spans
+
+
+def test_span_noop_without_sinks():
+    s = tracing.span("a", x=1)
+
+    assert not s.active
+    with s:
+        s.bytes = 10
+
+    assert tracing.span("b") is s
+
+
+def test_span_reports_to_sinks(spans):
+    with tracing.span("a", x=1) as s:
+        assert s.active
+        s.bytes = 10
+
+    assert len(spans) == 1
+    assert spans[0].name == "a"
+    assert spans[0].attrs == {"x": 1}
+    assert spans[0].bytes == 10
+    assert spans[0].duration >= 0
+    assert spans[0].error is None
+
+
+def test_span_records_error(spans):
+    with pytest.raises(ValueError):
+        with tracing.span("a"):
+            raise ValueError()
+
+    assert isinstance(spans[0].error, ValueError)
+
+
+def test_span_broken_sink(spans):
+    def broken_sink(span):
+        raise Exception("oh no")
+
+    with tracing.use_sink(broken_sink):
+        with tracing.span("a"):
+            pass
+
+    assert len(spans) == 1
+
+
+def test_span_remove_sink():
+    spans = []
+    tracing.add_sink(spans.append)
+    tracing.remove_sink(spans.append)
+
+    with tracing.span("a"):
+        pass
+
+    assert spans == []
+
+
+def test_logging_sink(caplog):
+    with caplog.at_level(logging.INFO, logger="pins.tracing"):
+        with tracing.use_sink(tracing.LoggingSink()):
+            with tracing.span("a", path="some/path") as s:
+                s.bytes = 10
+                s.cache_hit = False
+
+    assert "a: " in caplog.text
+    assert "10 bytes" in caplog.text
+    assert "cache miss" in caplog.text
+    assert "path=some/path" in caplog.text
+
+
+def test_span_counter():
+    counter = tracing.SpanCounter()
+    with tracing.use_sink(counter):
+        for hit in [True, False, False]:
+            with tracing.span("a") as s:
+                s.bytes = 2
+                s.cache_hit = hit
+
+    entry = counter.totals["a"]
+    assert entry["count"] == 3
+    assert entry["bytes"] == 6
+    assert (entry["hits"], entry["misses"]) == (1, 2)
+
+
+# Boards ======================================================================
+
+
+def test_board_pin_spans(tmp_path, spans):
+    cache = fsspec.filesystem(
+        "pinscache",
+        target_protocol="file",
+        same_names=True,
+        hash_prefix=str(tmp_path / "board"),
+        cache_storage=str(tmp_path / "cache"),
+    )
+    (tmp_path / "board").mkdir()
+    board = BaseBoard(str(tmp_path / "board"), fs=cache)
+    df = pd.DataFrame({"x": [1, 2, 3]})
+
+    board.pin_write(df, "df", type="csv")
+    names = [s.name for s in spans]
+    assert "save_data" in names
+    assert "put" in names
+    assert next(s for s in spans if s.name == "put").bytes > 0
+
+    spans.clear()
+    board.pin_read("df")
+    board.pin_read("df")
+
+    by_name = {}
+    for s in spans:
+        by_name.setdefault(s.name, []).append(s)
+
+    assert {
+        "pin_exists",
+        "pin_versions",
+        "open_pin_meta",
+        "load_file",
+        "load_data",
+    } <= set(by_name)
+    assert [s.cache_hit for s in by_name["load_file"]] == [False, True]
+    assert all(s.bytes > 0 for s in by_name["load_file"])
+    assert by_name["open_pin_meta"][0].cache_hit is False
+
+
+def test_board_rsc_query_spans(spans):
+    from pins.boards import BoardRsConnect
+    from pins.rsconnect.api import RsConnectApi
+    from pins.rsconnect.fs import RsConnectFs
+    from pins.tests.helpers import MockRsConnectSession
+
+    session = MockRsConnectSession()
+    session.add_user("susan")
+    api = RsConnectApi(session.server_url, "some-key", session=session)
+    board = BoardRsConnect("", RsConnectFs(api))
+
+    board.pin_write(pd.DataFrame({"x": [1]}), "susan/df", type="csv")
+
+    queries = [s for s in spans if s.name == "rsc_query"]
+    assert len(queries) == session.count_requests()
+    assert {s.attrs["method"] for s in queries} >= {"GET", "POST"}
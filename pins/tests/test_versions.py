@@ -51,3 +51,36 @@ def test_version_from_files(bytes_):
 
     assert v.hash == digest
     assert v.created == EXAMPLE_DATE
+
+
+def test_version_parse_created_matches_strptime():
+    x = "20220209T220116Z"
+
+    assert Version.parse_created(x) == datetime.strptime(x, "%Y%m%dT%H%M%SZ")
+
+    with pytest.raises(ValueError):
+        Version.parse_created("20221309T220116Z")
+
+
+def test_version_from_string_hash_too_long():
+    with pytest.raises(ValueError):
+        Version.from_string("20220209T220116Z-baf3f0")
+
+
+def test_version_version_tracks_fields():
+    version = Version.from_string("20220209T220116Z-baf3f")
+    assert version.version == "20220209T220116Z-baf3f"
+
+    version.created = EXAMPLE_DATE
+    version.hash = "abcdef"
+    assert version.version == "20210102T135859Z-abcde"
+    assert version.to_dict()["version"] == "20210102T135859Z-abcde"
+
+
+def test_version_is_slotted():
+    import pickle
+
+    version = Version.from_string("20220209T220116Z-baf3f")
+
+    assert not hasattr(version, "__dict__")
+    assert pickle.loads(pickle.dumps(version)) == version
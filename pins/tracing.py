@@ -0,0 +1,248 @@
+"""Spans that time pins operations, and sinks that receive them.
+
+By default no sinks are registered, and spans do no work. To see where time is
+spent, add a sink. For example, to log every span,
+
+>>> from pins import tracing
+>>> sink = tracing.add_sink(tracing.LoggingSink())
+>>> tracing.remove_sink(sink)
+
+A sink is any callable that takes a finished Span.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Callable
+
+_log = logging.getLogger(__name__)
+
+Sink = Callable[["Span"], Any]
+
+_sinks: tuple[Sink, ...] = ()
+_sinks_lock = threading.Lock()
+
+
+class Span:
+    """A timed operation, reported to every sink when it finishes.
+
+    Parameters
+    ----------
+    name:
+        The operation (e.g. "load_data").
+    **attrs:
+        Details about the operation (e.g. the path of a file).
+
+    Attributes
+    ----------
+    duration:
+        The seconds the operation took. Set once it finishes.
+    bytes:
+        The number of bytes read, written, or transferred, if known.
+    cache_hit:
+        Whether the operation used the local cache, if it could.
+    error:
+        The exception raised by the operation, if any.
+    """
+
+    active = True
+
+    def __init__(self, name: str, sinks: tuple[Sink, ...], **attrs):
+        self.name = name
+        self.attrs = attrs
+        self.duration: float | None = None
+        self.bytes: int | None = None
+        self.cache_hit: bool | None = None
+        self.error: BaseException | None = None
+
+        self._sinks = sinks
+
+    def __enter__(self) -> Span:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.duration = time.perf_counter() - self._start
+        self.error = exc
+
+        for sink in self._sinks:
+            try:
+                sink(self)
+            except Exception:
+                # a broken sink should not break reading or writing pins
+                _log.exception(f"Tracing sink {sink!r} failed.")
+
+    def __repr__(self):
+        return (
+            f"Span({self.name!r}, duration={self.duration}, bytes={self.bytes}, "
+            f"cache_hit={self.cache_hit}, attrs={self.attrs})"
+        )
+
+
+class _NoopSpan:
+    """A span that ignores everything, used when there are no sinks."""
+
+    __slots__ = ()
+
+    active = False
+
+    def __enter__(self) -> _NoopSpan:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+    def __setattr__(self, name, value) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name: str, **attrs) -> Span | _NoopSpan:
+    """Return a context manager that times an operation.
+
+    Setting attributes like bytes on the span is ignored when there are no sinks,
+    so work to compute them can be skipped by checking span.active.
+    """
+
+    # read once, so adding or removing sinks mid-span is safe
+    sinks = _sinks
+    if not sinks:
+        return _NOOP_SPAN
+
+    return Span(name, sinks, **attrs)
+
+
+def add_sink(sink: Sink) -> Sink:
+    """Register a callable that receives every finished span, and return it."""
+
+    global _sinks
+
+    with _sinks_lock:
+        _sinks = (*_sinks, sink)
+
+    return sink
+
+
+def remove_sink(sink: Sink) -> None:
+    """Unregister a sink added by add_sink."""
+
+    global _sinks
+
+    with _sinks_lock:
+        _sinks = tuple(x for x in _sinks if x != sink)
+
+
+@contextmanager
+def use_sink(sink: Sink) -> Iterator[Sink]:
+    """Register a sink for the duration of a with block."""
+
+    add_sink(sink)
+    try:
+        yield sink
+    finally:
+        remove_sink(sink)
+
+
+def file_size(f) -> int | None:
+    """Return the size of an open file, or None if it is not known."""
+
+    size = getattr(f, "size", None)
+    if isinstance(size, int):
+        return size
+
+    try:
+        return os.fstat(f.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        pass
+
+    getbuffer = getattr(f, "getbuffer", None)
+    if getbuffer is not None:
+        return getbuffer().nbytes
+
+    return None
+
+
+def path_size(path) -> int:
+    """Return the total size of a file, or all files in a directory."""
+
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+
+    total = 0
+    for root, _, fnames in os.walk(path):
+        total += sum(os.path.getsize(os.path.join(root, x)) for x in fnames)
+
+    return total
+
+
+# Sinks =======================================================================
+
+
+class LoggingSink:
+    """Log each finished span.
+
+    Parameters
+    ----------
+    logger:
+        The logger to use. Defaults to the "pins.tracing" logger.
+    level:
+        The level to log spans at.
+    """
+
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.INFO):
+        self.logger = _log if logger is None else logger
+        self.level = level
+
+    def __call__(self, span: Span) -> None:
+        parts = [f"{span.name}: {span.duration * 1000:.1f}ms"]
+        if span.bytes is not None:
+            parts.append(f"{span.bytes} bytes")
+        if span.cache_hit is not None:
+            parts.append("cache hit" if span.cache_hit else "cache miss")
+        if span.error is not None:
+            parts.append(f"error {type(span.error).__name__}")
+        parts.extend(f"{k}={v}" for k, v in span.attrs.items())
+
+        self.logger.log(self.level, ", ".join(parts))
+
+
+class SpanCounter:
+    """Count spans, their total duration and bytes, and cache hits by name.
+
+    Examples
+    --------
+    >>> from pins import tracing
+    >>> counter = tracing.SpanCounter()
+    >>> with tracing.use_sink(counter):
+    ...     with tracing.span("some_operation") as s:
+    ...         s.bytes = 10
+    >>> counter.totals["some_operation"]["bytes"]
+    10
+    """
+
+    def __init__(self):
+        self.totals: dict[str, dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, span: Span) -> None:
+        with self._lock:
+            entry = self.totals.setdefault(
+                span.name,
+                {"count": 0, "duration": 0.0, "bytes": 0, "hits": 0, "misses": 0},
+            )
+            entry["count"] += 1
+            entry["duration"] += span.duration
+            entry["bytes"] += span.bytes or 0
+            if span.cache_hit is not None:
+                entry["hits" if span.cache_hit else "misses"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self.totals.clear()
@@ -20,6 +20,40 @@ def warn_deprecated(msg):
     warn(msg, DeprecationWarning)
 
 
+def slotted(*extra: str):
+    """Class decorator that gives a dataclass __slots__, like dataclass(slots=True).
+
+    dataclass(slots=True) needs python 3.10, so this recreates the class instead.
+    Apply it above the dataclass decorator. Names in extra are added to the slots,
+    for attributes that are not fields (e.g. set in __post_init__).
+    """
+
+    def decorator(cls):
+        from dataclasses import fields
+
+        # only fields defined on this class, since parents hold their own slots
+        inherited = {
+            name for base in cls.__mro__[1:] for name in getattr(base, "__slots__", ())
+        }
+        names = tuple(
+            name
+            for name in (*(f.name for f in fields(cls)), *extra)
+            if name not in inherited
+        )
+
+        cls_dict = dict(cls.__dict__)
+        for name in names:
+            # remove field defaults, which would otherwise shadow the slots
+            cls_dict.pop(name, None)
+        cls_dict.pop("__dict__", None)
+        cls_dict.pop("__weakref__", None)
+        cls_dict["__slots__"] = names
+
+        return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+    return decorator
+
+
 def hash_name(path, same_name):
     if same_name:
         _hash = os.path.basename(path)
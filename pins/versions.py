@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from collections.abc import Mapping, Sequence
 from dataclasses import asdict, dataclass
 from datetime import datetime
@@ -10,16 +11,21 @@ from xxhash import xxh64
 
 from ._types import IOBase, StrOrFile
 from .errors import PinsVersionError
+from .utils import slotted
 
 _log = logging.getLogger(__name__)
 
 VERSION_TIME_FORMAT = "%Y%m%dT%H%M%SZ"
 
+# matches dates in VERSION_TIME_FORMAT, which is fixed width
+RE_VERSION_TIME = re.compile(r"(\d{4})(\d{2})(\d{2})T(\d{2})(\d{2})(\d{2})Z")
+
 
 class _VersionBase:
-    pass
+    __slots__ = ()
 
 
+@slotted()
 @dataclass
 class VersionRaw(_VersionBase):
     version: str
@@ -28,6 +34,34 @@ class VersionRaw(_VersionBase):
         return asdict(self)
 
 
+@slotted()
+@dataclass
+class VersionBundle(VersionRaw):
+    """A Posit Connect bundle, with details from the content's bundle listing.
+
+    The hash is only known once the bundle's metadata has been fetched.
+    """
+
+    created: datetime | None = None
+    size: int | None = None
+    active: bool | None = None
+    hash: str | None = None
+
+    @staticmethod
+    def parse_created(x: str | None) -> datetime | None:
+        if x is None:
+            return None
+
+        # Connect returns UTC times, like 2021-09-01T12:00:00Z. Convert these to
+        # naive local times, to match the created field written by pins.
+        created = datetime.fromisoformat(x.replace("Z", "+00:00"))
+        if created.tzinfo is not None:
+            created = created.astimezone().replace(tzinfo=None)
+
+        return created
+
+
+@slotted("_rendered")
 @dataclass
 class Version(_VersionBase):
     created: datetime
@@ -42,13 +76,28 @@ class Version(_VersionBase):
 
     @property
     def version(self) -> str:
+        # formatting the date is slow, e.g. when sorting many versions, so the
+        # result is kept until created or hash change.
+        key = (self.created, self.hash)
+        cached = getattr(self, "_rendered", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         date_part = self.created.strftime(VERSION_TIME_FORMAT)
         hash_part = self.hash[:5]
-        return f"{date_part}-{hash_part}"
+        version = f"{date_part}-{hash_part}"
+
+        self._rendered = (key, version)
+        return version
 
     @staticmethod
     def parse_created(x):
-        return datetime.strptime(x, VERSION_TIME_FORMAT)
+        match = RE_VERSION_TIME.fullmatch(x)
+        if match is None:
+            return datetime.strptime(x, VERSION_TIME_FORMAT)
+
+        # much faster than strptime, which matters when listing many versions
+        return datetime(*map(int, match.groups()))
 
     def render_created(self):
         return self.created.strftime(VERSION_TIME_FORMAT)
@@ -64,6 +113,17 @@ class Version(_VersionBase):
 
         return hasher.hexdigest()
 
+    @staticmethod
+    def combine_hashes(hashes: Sequence[str]) -> str:
+        """Return the hash of a pin, from the hashes of its files."""
+
+        if len(hashes) > 1:
+            # Create an xxh64 hash of the combined hashes. Note that newer versions
+            # of xxhash only accept bytes, and hex digests encode the same in ascii.
+            return xxh64("".join(hashes).encode("ascii")).hexdigest()
+
+        return hashes[0]
+
     @classmethod
     def from_string(cls, version: str) -> Version:
         parts = version.split("-")
@@ -84,6 +144,10 @@ class Version(_VersionBase):
 
         obj = cls(created, hash_)
 
+        if RE_VERSION_TIME.fullmatch(dt_string) and len(hash_) <= 5:
+            # the version renders back to the same string, so skip formatting it
+            obj._rendered = ((created, hash_), version)
+
         if obj.version != version:
             raise ValueError(
                 "Version parsing failed. Received version string {version}, but "
@@ -104,14 +168,7 @@ class Version(_VersionBase):
         if created is None:
             created = datetime.now()
 
-        if len(hashes) > 1:
-            # Combine the hashes into a single string
-            combined_hashes = "".join(hashes)
-
-            # Create an xxh64 hash of the combined string
-            hashes = [xxh64(combined_hashes).hexdigest()]
-
-        return cls(created, hashes[0])
+        return cls(created, cls.combine_hashes(hashes))
 
     @classmethod
     def from_meta_fields(cls, created: str, hash: str):
@@ -128,8 +185,7 @@ def guess_version(x: str):
 
 def version_setup(board, name, new_version, versioned):
     if board.pin_exists(name):
-        versions_df = board.pin_versions(name, as_df=True)
-        versions = versions_df["version"].to_list()
+        versions = board._pin_version_names(name)
         old_version = versions[-1]
         n_versions = len(versions)
 
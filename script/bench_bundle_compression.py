@@ -0,0 +1,59 @@
+"""Compare throughput of single-threaded and parallel gzip for Connect bundles.
+
+Usage: python script/bench_bundle_compression.py [size_mb] [workers]
+"""
+
+import os
+import sys
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+
+from pins.rsconnect.api import _ParallelGzipWriter
+
+SIZE_MB = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+WORKERS = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+
+
+def make_bundle(p_dir: Path, size_mb: int):
+    # half random bytes, half repetitive text, so compression has real work to do
+    chunk = os.urandom(512 * 1024) + b"some,repeated,csv,row\n" * 23_831
+    with (p_dir / "data.bin").open("wb") as f:
+        for _ in range(size_mb):
+            f.write(chunk[: 1024 * 1024])
+
+
+def tar_single(p_src, p_archive):
+    with tarfile.open(p_archive, mode="w:gz") as tar:
+        tar.add(str(p_src), arcname="")
+
+
+def tar_parallel(p_src, p_archive):
+    with open(p_archive, "wb") as f_archive:
+        with _ParallelGzipWriter(f_archive, WORKERS) as f_gz:
+            with tarfile.open(fileobj=f_gz, mode="w") as tar:
+                tar.add(str(p_src), arcname="")
+
+
+def bench(name, f, p_src, p_archive):
+    start = time.perf_counter()
+    f(p_src, p_archive)
+    elapsed = time.perf_counter() - start
+
+    out_mb = p_archive.stat().st_size / 1024**2
+    print(
+        f"{name:>10}: {elapsed:6.2f}s  {SIZE_MB / elapsed:7.1f} MB/s"
+        f"  archive {out_mb:7.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        p_src = Path(tmp_dir) / "bundle"
+        p_src.mkdir()
+        make_bundle(p_src, SIZE_MB)
+
+        print(f"Bundle: {SIZE_MB} MB, parallel workers: {WORKERS}")
+        bench("tarfile", tar_single, p_src, Path(tmp_dir) / "single.tar.gz")
+        bench("parallel", tar_parallel, p_src, Path(tmp_dir) / "parallel.tar.gz")